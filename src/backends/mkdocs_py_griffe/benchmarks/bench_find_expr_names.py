@@ -0,0 +1,141 @@
+"""
+Benchmarks :func:`mkdocs_py_griffe.parsing.find_expr_names` against the reflection based
+`find_attributes_of_type`, on the expressions collected by `parse_code` and `parse_class`.
+
+Usage (from the `mkdocs_py_griffe` project folder, `PYTHONPATH=.` is not needed if the package is installed):
+```
+PYTHONPATH=. python benchmarks/bench_find_expr_names.py --depth 3 --breadth 4
+PYTHONPATH=. python benchmarks/bench_find_expr_names.py --package my_package --search-path /path/to/src
+```
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Iterator
+
+import griffe
+from griffe.dataclasses import Attribute as AstAttribute
+from griffe.dataclasses import Class as AstClass
+from griffe.dataclasses import Function as AstFunction
+from griffe.dataclasses import Module as AstModule
+from griffe.expressions import ExprName
+from synthetic_package import SyntheticPackage, write_package
+
+from mkdocs_py_griffe.parsing import find_expr_names
+
+
+def find_attributes_of_type(ast: Any, target_type):
+    """
+    The reflection based search of the referenced names formerly used by the generator, the baseline of the
+    benchmark.
+    """
+    results = []
+    primitive_types = (int, float, str, bool, bytes, complex)
+    visited = []
+
+    def get_attr_val(obj, attr_name) -> Any | None:
+        attr_value = getattr(obj, attr_name, None)
+        invalid = any(
+            [
+                attr_name.startswith("__"),
+                attr_name in ["parent"],
+                not attr_value,
+                isinstance(attr_value, primitive_types),
+                isinstance(attr_value, AstModule),
+            ]
+        )
+        return not invalid and attr_value
+
+    def parse_obj(obj):
+        if obj in visited:
+            return
+        visited.append(obj)
+        attributes = [
+            get_attr_val(obj, attr_name)
+            for attr_name in dir(obj)
+            if get_attr_val(obj, attr_name) and attr_name != "parent"
+        ]
+        for attr_value in attributes:
+            if isinstance(attr_value, target_type):
+                results.append(attr_value)
+                continue
+            recursive_search(attr_value)
+
+    def recursive_search(current):
+
+        if isinstance(current, target_type):
+            results.append(current)
+
+        if isinstance(current, list):
+            _ = [recursive_search(item) for item in current]
+        elif hasattr(current, "__dict__"):
+            parse_obj(current)
+
+    recursive_search(ast)
+    return results
+
+
+def iter_targets(ast: AstModule | AstClass) -> Iterator[Any]:
+    for member in ast.members.values():
+        if member.is_alias:
+            continue
+        if isinstance(member, AstModule):
+            yield from iter_targets(member)
+        if isinstance(member, AstAttribute):
+            yield member.annotation
+            yield member.value
+        if isinstance(member, AstFunction):
+            yield member.annotation
+            yield member.returns
+            yield member.parameters
+        if isinstance(member, AstClass):
+            yield member.decorators
+            yield member.bases
+            yield from iter_targets(member)
+
+
+def timed(title: str, fct, targets: list[Any]) -> float:
+    start = time.perf_counter()
+    count = 0
+    failures = 0
+    for target in targets:
+        try:
+            count += len(list(fct(target)))
+        except Exception:  # pylint: disable=broad-exception-caught
+            failures += 1
+    elapsed = time.perf_counter() - start
+    print(f"{title:<28}{elapsed:>10.3f}s{count:>12} names{failures:>8} failures")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--package", help="Name of an existing package to load")
+    parser.add_argument("--search-path", action="append", default=[])
+    parser.add_argument("--depth", type=int, default=SyntheticPackage().depth)
+    parser.add_argument("--breadth", type=int, default=SyntheticPackage().breadth)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.package:
+            name, search_paths = args.package, args.search_path
+        else:
+            spec = SyntheticPackage(depth=args.depth, breadth=args.breadth)
+            name, search_paths = spec.name, [str(write_package(Path(tmp), spec))]
+        root = griffe.load(name, submodules=True, search_paths=search_paths)
+        targets = list(iter_targets(root))
+
+    print(f"Package '{name}': {len(targets)} expressions")
+    legacy = timed(
+        "find_attributes_of_type",
+        lambda t: find_attributes_of_type(t, ExprName),
+        targets,
+    )
+    walker = timed("find_expr_names", find_expr_names, targets)
+    print(f"Speedup: x{legacy / walker:.1f}")
+
+
+if __name__ == "__main__":
+    main()
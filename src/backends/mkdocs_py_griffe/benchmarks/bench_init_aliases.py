@@ -0,0 +1,50 @@
+"""
+Benchmarks :func:`mkdocs_py_griffe.symbols.init_aliases` on a synthetic package with many levels of wildcard
+re-exports (`from .x import *`).
+
+Usage (from the `mkdocs_py_griffe` project folder, `PYTHONPATH=.` is not needed if the package is installed):
+```
+PYTHONPATH=. python benchmarks/bench_init_aliases.py --levels 20 --depth 2 --breadth 4
+```
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import griffe
+from synthetic_package import SyntheticPackage, write_package
+
+from mkdocs_py_griffe.symbols import init_aliases
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--levels", type=int, default=20)
+    parser.add_argument("--depth", type=int, default=2)
+    parser.add_argument("--breadth", type=int, default=SyntheticPackage().breadth)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    spec = SyntheticPackage(
+        depth=args.depth, breadth=args.breadth, wildcard_levels=args.levels
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        search_paths = [str(write_package(Path(tmp), spec))]
+        root = griffe.load(spec.name, submodules=True, search_paths=search_paths)
+
+    timings = []
+    aliases = {}
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        aliases = init_aliases(root_ast=root)
+        timings.append(time.perf_counter() - start)
+    print(
+        f"init_aliases: {len(aliases)} aliases, {args.levels} wildcard levels, "
+        f"best of {args.repeat}: {min(timings):.3f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
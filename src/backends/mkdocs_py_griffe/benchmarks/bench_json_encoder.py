@@ -0,0 +1,106 @@
+"""
+Benchmarks :class:`mkdocs_py_griffe.writers.DataclassJSONEncoder` against the encoding based on
+`dataclasses.asdict` (deep copy of the models), on the modules of a synthetic package.
+
+Usage (from the `mkdocs_py_griffe` project folder, `PYTHONPATH=.` is not needed if the package is installed):
+```
+PYTHONPATH=. python benchmarks/bench_json_encoder.py --depth 2 --classes 40
+```
+"""
+
+import argparse
+import dataclasses
+import json
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import griffe
+from synthetic_package import SyntheticPackage, write_package
+
+from mkdocs_py_griffe.configuration import Configuration
+from mkdocs_py_griffe.parsing import parse_module
+from mkdocs_py_griffe.py_griffe import init_project
+from mkdocs_py_griffe.symbols import get_module_ast
+from mkdocs_py_griffe.writers import DataclassJSONEncoder
+
+
+# pylint: disable=too-few-public-methods
+class AsDictJSONEncoder(json.JSONEncoder):
+    def default(self, o):
+        if hasattr(o, "__dict__"):
+            return dataclasses.asdict(o)
+        return json.JSONEncoder.default(self, o)
+
+
+class CountingWriter:
+    """
+    Discards the output, only counting its size (so that the memory peak only involves the encoding).
+    """
+
+    def __init__(self):
+        self.size = 0
+
+    def write(self, chunk: str):
+        self.size += len(chunk)
+
+
+def dump_all(docs: list, cls: type, **options) -> int:
+    """
+    Encodes the modules as the generator does: streamed when indented, at once when compact (to use the C
+    implementation of the encoder, only available without indentation).
+    """
+    writer = CountingWriter()
+    for doc in docs:
+        if options.get("indent"):
+            json.dump(doc, writer, cls=cls, **options)
+        else:
+            writer.write(json.dumps(doc, cls=cls, **options))
+    return writer.size
+
+
+def timed(title: str, docs: list, cls: type, repeat: int, **options) -> None:
+    timings = []
+    size = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        size = dump_all(docs, cls, **options)
+        timings.append(time.perf_counter() - start)
+    # Peak memory is measured in a separate pass, tracing allocations slows down the encoding.
+    tracemalloc.start()
+    dump_all(docs, cls, **options)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{title:<28}{min(timings):>10.3f}s{size / 1e6:>10.1f} MB{peak / 1e6:>10.1f} MB peak")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--depth", type=int, default=2)
+    parser.add_argument("--breadth", type=int, default=SyntheticPackage().breadth)
+    parser.add_argument("--classes", type=int, default=40)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    spec = SyntheticPackage(depth=args.depth, breadth=args.breadth, classes=args.classes)
+    with tempfile.TemporaryDirectory() as tmp:
+        search_paths = [str(write_package(Path(tmp), spec))]
+        root = griffe.load(spec.name, submodules=True, search_paths=search_paths)
+        project = init_project(
+            root_ast=root, config=Configuration(base_nav="/api", out=Path(tmp))
+        )
+        docs = [
+            parse_module(ast=get_module_ast(path=path, project=project), project=project)
+            for path in project.modules_tree
+        ]
+
+    print(f"{len(docs)} modules, best of {args.repeat}")
+    timed("asdict, indent=4", docs, AsDictJSONEncoder, args.repeat, indent=4)
+    timed("direct, indent=4", docs, DataclassJSONEncoder, args.repeat, indent=4)
+    timed("asdict, compact", docs, AsDictJSONEncoder, args.repeat, separators=(",", ":"))
+    timed("direct, compact", docs, DataclassJSONEncoder, args.repeat, separators=(",", ":"))
+
+
+if __name__ == "__main__":
+    main()
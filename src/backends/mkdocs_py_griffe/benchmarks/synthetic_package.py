@@ -0,0 +1,193 @@
+"""
+Generates synthetic Python packages on disk, used as inputs of the benchmarks.
+
+The generated packages follow the conventions expected by :func:`mkdocs_py_griffe.py_griffe.generate_api`:
+documented `__init__.py` for each module, documented classes, methods, functions and attributes, annotations
+referencing symbols of the package, and sphinx like cross links in docstrings.
+"""
+
+# pylint: disable=line-too-long
+
+import shutil
+from pathlib import Path
+from typing import NamedTuple
+
+
+class SyntheticPackage(NamedTuple):
+    """
+    Specification of a synthetic package.
+    """
+
+    name: str = "synthetic"
+    """
+    Name of the root module.
+    """
+    depth: int = 3
+    """
+    Depth of the modules' hierarchy.
+    """
+    breadth: int = 3
+    """
+    Number of sub-modules of each (non leaf) module.
+    """
+    files: int = 3
+    """
+    Number of files in each module.
+    """
+    classes: int = 4
+    """
+    Number of classes in each file.
+    """
+    methods: int = 6
+    """
+    Number of methods in each class.
+    """
+    wildcard_levels: int = 0
+    """
+    Number of nested modules in the `reexports` module, each level re-exporting the next one using
+    `from .level_x import *` (the root module re-exporting `reexports` the same way).
+    """
+
+
+def class_source(file_id: str, index: int, spec: SyntheticPackage) -> str:
+    prev_class = f"Class{file_id}_{index - 1}" if index > 0 else "object"
+    methods = "\n".join(
+        f'''
+    def method_{m}(self, value: {prev_class} | None, items: list[dict[str, int]], *args: int, **kwargs: str) -> "Class{file_id}_{index}":
+        """
+        Method {m} of :class:`Class{file_id}_{index}`, see also :meth:`Class{file_id}_{index}.method_{(m + 1) % spec.methods}`.
+
+        Parameters:
+            value: A value, see :class:`{prev_class}`.
+            items: Some items.
+
+        Returns:
+            The instance, see :func:`function_{file_id}`.
+
+        Raises:
+            RuntimeError: If something goes wrong.
+        """
+        if not items:
+            raise RuntimeError("No items")
+        return self
+'''
+        for m in range(spec.methods)
+    )
+    base = f"({prev_class})" if index > 0 else ""
+    return f'''
+@dataclass
+class Class{file_id}_{index}{base}:
+    """
+    Class {index} of file {file_id}, related to :class:`Class{file_id}_{(index + 1) % spec.classes}`.
+
+    Note:
+        It uses :glob:`ATTRIBUTE_{file_id}`.
+    """
+
+    attr: int = 0
+    """
+    An attribute, see :attr:`Class{file_id}_{index}.other`.
+    """
+    other: dict[str, list[{prev_class}]] | None = None
+    """
+    Another attribute.
+    """
+{methods}
+'''
+
+
+def file_source(file_id: str, spec: SyntheticPackage) -> str:
+    classes = "\n".join(class_source(file_id, i, spec) for i in range(spec.classes))
+    return f'''"""
+File {file_id}, see :func:`function_{file_id}` and :mod:`unknown.module`.
+"""
+from dataclasses import dataclass
+
+ATTRIBUTE_{file_id}: dict[str, int] = {{"a": 1}}
+"""
+A global attribute.
+"""
+
+{classes}
+
+def function_{file_id}(arg: Class{file_id}_0, other: list[Class{file_id}_{spec.classes - 1}]) -> Class{file_id}_0:
+    """
+    Function of file {file_id}, uses :class:`Class{file_id}_0`.
+
+    Parameters:
+        arg: The argument.
+        other: Other arguments.
+
+    Returns:
+        The argument.
+    """
+    return arg
+'''
+
+
+def write_module(folder: Path, module_id: str, level: int, spec: SyntheticPackage):
+    folder.mkdir(parents=True)
+    files = [f"file_{module_id}_{i}" for i in range(spec.files)]
+    sub_modules = [f"sub_{i}" for i in range(spec.breadth)] if level < spec.depth else []
+    imports = "\n".join(f"from .{file} import *" for file in files)
+    (folder / "__init__.py").write_text(
+        f'''"""
+Module {module_id}, see :mod:`{folder.name}`.
+"""
+{imports}
+''',
+        encoding="UTF8",
+    )
+    for i, file in enumerate(files):
+        (folder / f"{file}.py").write_text(
+            file_source(f"{module_id}_{i}", spec), encoding="UTF8"
+        )
+    for i, sub in enumerate(sub_modules):
+        write_module(folder / sub, f"{module_id}_{i}", level + 1, spec)
+
+
+def write_reexports(folder: Path, spec: SyntheticPackage):
+    folder.mkdir(parents=True)
+    for level in range(spec.wildcard_levels):
+        next_import = (
+            f"from .level_{level + 1} import *"
+            if level < spec.wildcard_levels - 1
+            else ""
+        )
+        (folder / "__init__.py").write_text(
+            f'''"""
+Re-exports level {level}.
+"""
+from .file_w{level} import *
+{next_import}
+''',
+            encoding="UTF8",
+        )
+        (folder / f"file_w{level}.py").write_text(
+            file_source(f"w{level}", spec), encoding="UTF8"
+        )
+        folder = folder / f"level_{level + 1}"
+        if next_import:
+            folder.mkdir()
+
+
+def write_package(folder: Path, spec: SyntheticPackage) -> Path:
+    """
+    Writes the synthetic package in a folder (previous content is removed).
+
+    Parameters:
+        folder: Parent folder of the package.
+        spec: Package's specification.
+
+    Returns:
+        The folder to include in the search paths when loading the package with griffe.
+    """
+    target = folder / spec.name
+    if target.exists():
+        shutil.rmtree(target)
+    write_module(target, "0", 0, spec)
+    if spec.wildcard_levels:
+        write_reexports(target / "reexports", spec)
+        with open(target / "__init__.py", "a", encoding="UTF8") as init_file:
+            init_file.write("from .reexports import *\n")
+    return folder
@@ -3,7 +3,7 @@ The backend for generating API data for python projects using the Python module
 <a href="https://mkdocstrings.github.io/griffe/" target="_blank">griffe</a> as the primary AST generator.
 
 The entry point is the function :func:`mkdocs_py_griffe.py_griffe.generate_api`,
-providing appropriate :class:`mkdocs_py_griffe.py_griffe.Configuration`.
+providing appropriate :class:`mkdocs_py_griffe.configuration.Configuration`.
 
 **Supported style**
 
@@ -11,9 +11,22 @@ We encourage to use Google-style synthax for docstrings, as documented
 <a href="https://mkdocstrings.github.io/griffe/docstrings/#google-style" target="_blank">here</a>.
 
 Regarding symbols cross-linking, the sphinx syntax is supported,
-see :glob:`mkdocs_py_griffe.py_griffe.SUPPORTED_CROSS_LINK_TAGS`.
+see :glob:`mkdocs_py_griffe.links.SUPPORTED_CROSS_LINK_TAGS`.
 """
 
+from .configuration import *
+from .docstrings_cache import *
+from .incremental import *
+from .indexes import *
+from .inventories import *
+from .links import *
 from .models import *
+from .pack import *
+from .parsing import *
+from .project import *
 from .py_griffe import *
+from .rendering import *
+from .search import *
 from .std_links import *
+from .symbols import *
+from .writers import *
@@ -0,0 +1,221 @@
+"""
+The configuration of the API generation.
+"""
+
+from pathlib import Path
+from typing import Literal, NamedTuple
+
+from .models import ChildModule
+
+ImplementationsMode = Literal["inline", "sidecar", "sources", "sources-sidecar", "none"]
+"""
+Possible modes to output the implementations of the entities (see `Configuration.implementations`).
+"""
+
+
+PrecompressFormat = Literal["gz", "br"]
+"""
+Possible formats of the precompressed API files (gzip or brotli), also used as their extension
+(*e.g.* `foo.json.gz`).
+"""
+
+
+# pylint: disable=dangerous-default-value
+class Configuration(NamedTuple):
+    """
+    Represents the configuration to generate API files using
+    :func:`mkdocs_py_griffe.py_griffe.generate_api`.
+    """
+
+    base_nav: str
+    """
+    The base URL for the navigation.
+    """
+    out: Path
+    """
+    Path of the output folder in which API files are generated.
+    """
+    external_links: dict[str, str] = {}
+    """
+    External links definition, e.g.:
+    ```
+    {   
+        "float": "https://docs.python.org/fr/3/library/stdtypes.html#numeric-types-int-float-complex",
+        "list": "https://docs.python.org/3/library/stdtypes.html#lists",
+        "dict": "https://docs.python.org/3/library/stdtypes.html#mapping-types-dict",
+    }
+    ```
+    The function :func:`mkdocs_py_griffe.std_links.std_links` is available, it includes common standard Python links.
+    """
+    external_link_rules: dict[str, str] = {}
+    """
+    External links defined by rules rather than per symbol: the keys are paths' prefixes and the values URLs
+    templates, *e.g.*:
+    ```
+    {
+        "numpy.": "https://numpy.org/doc/stable/reference/generated/{path}.html",
+        "pandas.": "https://pandas.pydata.org/docs/reference/api/{path}.html",
+    }
+    ```
+    Prefixes are matched on whole path's segments (a trailing `.` is optional), the longest matching prefix is
+    used; prefixes can not be empty. The templates can reference `{path}` (the symbol's full path), `{name}` (its
+    last segment) and `{relative}` (the path after the prefix), other braces are kept as is.
+
+    Rules have the lowest priority: `external_links`, `cross_linked_inventories` and `sphinx_inventories` are
+    looked up first. See :class:`mkdocs_py_griffe.indexes.PrefixRules`.
+    """
+    cross_linked_packages: dict[str, str] = {}
+    """
+    Other packages to cross-link with, for which documentation has been generated by the same tool.
+    
+    This is a dictionary where the keys are package names and the values are base URLs for the corresponding package 
+    documentation.
+    
+    Absolute URLs (e.g., "https://foo.com/docs/api/foo") are used to open links in a new tab, 
+    typically when the package documentation is hosted separately from the current documentation.
+    
+    Relative URLs (e.g., "documentation/api/bar") are used to navigate within the same documentation site, 
+    typically when the package documentation is part of the same document.
+    
+    Example:
+    ```
+    {
+        "foo": "https://foo.com/docs/api/foo",
+        "bar": "documentation/api/bar"
+    }
+    ```
+    """
+    cross_linked_inventories: dict[str, Path] = {}
+    """
+    Symbols inventories of the packages of `cross_linked_packages` (files `api.inventory` generated with the
+    `inventory` option), keyed by the packages' names.
+
+    When provided for a package, the links to its symbols are validated and use the symbols' actual navigation
+    paths, the links to unknown symbols being reported with suggestions. Links to its symbols in the declarations
+    are also resolved. Links to packages without inventory are not validated.
+    """
+    jobs: int = 1
+    """
+    Number of processes used to render and write the modules' API files.
+
+    When greater than 1, modules are dispatched over a pool of forked processes (not available on all platforms,
+    in which case the rendering happens in the main process); the generated files are identical.
+    """
+    incremental: bool = False
+    """
+    Whether to skip the modules whose inputs did not change since the previous generation.
+
+    Inputs are recorded in a manifest file in the `out` folder, they include the module's source files, its children
+    modules, and the resolution of the links it references (*e.g.* the navigation path of a symbol from another
+    module). See :func:`mkdocs_py_griffe.incremental.is_module_up_to_date`.
+    """
+    implementations: ImplementationsMode = "inline"
+    """
+    How the implementations of the entities (functions, classes) are included in the API files:
+    *  `inline`: within the `Code.implementation` attribute of the entities.
+    *  `sidecar`: in a separate file per module (`foo.implementations.json` next to `foo.json`), fetched only when
+       displayed; the entities reference it from `Code.implementationRef`
+       (see :func:`mkdocs_py_griffe.writers.extract_implementations`).
+    *  `sources`: the sources of the module's files are included once in the module (`Module.sources`), the entities
+       reference the lines of their implementation from `Code.sourceRef`
+       (see :func:`mkdocs_py_griffe.writers.extract_sources`).
+    *  `sources-sidecar`: like `sources`, but the sources are in a separate file per module (`foo.sources.json` next
+       to `foo.json`), fetched only when displayed.
+    *  `none`: implementations are not included.
+    """
+    references_table: bool = False
+    """
+    Whether the targets of the entities' references are stored once per module, in `Module.symbols`: the values of
+    `Code.references` are then indexes in this table rather than URLs
+    (see :func:`mkdocs_py_griffe.writers.extract_symbols`).
+    """
+    sphinx_inventories: dict[str, Path] = {}
+    """
+    Local Sphinx inventory files (`objects.inv`) providing external links for the Python objects they reference,
+    keyed by the base URL of their documentation, *e.g.*:
+    ```
+    {
+        "https://docs.python.org/3/": Path("inventories/python.inv"),
+        "https://numpy.org/doc/stable/": Path("inventories/numpy.inv"),
+    }
+    ```
+    The files are loaded when first needed, `external_links` have priority over them.
+    See :class:`mkdocs_py_griffe.inventories.SphinxInventory`.
+    """
+    inventory: bool = False
+    """
+    Whether to write the inventory of the symbols in the file `api.inventory`, allowing other projects to resolve
+    links to this package without loading its AST (see :class:`mkdocs_py_griffe.inventories.SymbolInventory`).
+    """
+    search_index: bool = False
+    """
+    Whether to write a search index over the names, paths and documentations of the entities in the `search`
+    folder, see :func:`mkdocs_py_griffe.search.write_search_index`.
+    """
+    nav_summary: bool = False
+    """
+    Whether to write the summary of the modules' tree in the file `api.nav.json` (see
+    :func:`mkdocs_py_griffe.writers.get_nav_summary`): the navigation can then be built without fetching the
+    modules' API files.
+    """
+    shard_size: int | None = None
+    """
+    Number of entities (types, callables and attributes) of a module above which they are written in separate
+    shard files, each including up to `shard_size` entities (*e.g.* `foo.shards/0.json` next to `foo.json`).
+    The module's file then only includes the references of its entities (`Module.shards`), in addition to its
+    documentation and children. See :func:`mkdocs_py_griffe.writers.shard_module`.
+
+    Modules are not sharded if `None`.
+    """
+    pack: bool = False
+    """
+    Whether to also write all the API files in a single pack file, along with the index of their offsets and lengths
+    in it (see :func:`mkdocs_py_griffe.pack.write_pack`): the pack can be uploaded as a single file, and the API
+    files fetched from it using HTTP range requests (or read using
+    :class:`mkdocs_py_griffe.pack.PackReader`).
+
+    The API files are still written separately.
+    """
+    compact_json: bool = False
+    """
+    Whether to write the API files without indentation nor whitespaces (keys are written in the models' fields
+    order in both cases). Compact files are also encoded several times faster, using the C implementation of the
+    JSON encoder, see :func:`mkdocs_py_griffe.writers.write_api_file`.
+    """
+    precompress: list[PrecompressFormat] = []
+    """
+    Formats of the precompressed siblings to write next to each API file, *e.g.* `["gz", "br"]` to write
+    `foo.json.gz` and `foo.json.br` next to `foo.json` (static servers can then serve them directly).
+    The `br` format requires the `brotli` package.
+
+    Compression runs in background threads while the modules are rendered.
+    """
+    precompress_min_size: int = 1024
+    """
+    Minimum size (in bytes) of the API files for which precompressed siblings are written.
+    """
+    docstrings_cache: Path | None = None
+    """
+    Folder of a persistent cache of the parsed docstrings, reused from one generation to another
+    (see :class:`mkdocs_py_griffe.docstrings_cache.DocstringsCache`). No cache is used if `None`.
+    """
+    docstrings_cache_size: int = 64 * 1024 * 1024
+    """
+    Maximum size (in bytes) of the entries of the docstrings cache, the least recently used entries are evicted
+    at the end of a generation when exceeded.
+    """
+    extra_modules: dict[str, list[ChildModule]] = {}
+    """
+    Other API module documentation node that should be added as a child of a given module.
+    
+    This is a dictionary where the keys are the parent's module names, and the values are a list of child modules' 
+    specification.
+    
+    Example:
+    ```
+    {
+        "foo": [ChildModule(name="Foo", path="foo/extra-foo", isLeaf=False)],
+        "foo.bar": [ChildModule(name="Bar", path="foo/bar/extra-bar", isLeaf=True)],
+    }
+    ```
+    """
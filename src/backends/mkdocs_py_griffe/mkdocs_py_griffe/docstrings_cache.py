@@ -0,0 +1,269 @@
+"""
+Persistent cache of the parsed docstrings, see `Configuration.docstrings_cache`.
+"""
+
+import hashlib
+import importlib.metadata
+import json
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any
+
+from griffe.dataclasses import Docstring as AstDocstring
+from griffe.docstrings.dataclasses import (DocstringParameter, DocstringRaise,
+                                           DocstringReturn, DocstringSection,
+                                           DocstringSectionAdmonition,
+                                           DocstringSectionOtherParameters,
+                                           DocstringSectionParameters,
+                                           DocstringSectionRaises,
+                                           DocstringSectionReturns,
+                                           DocstringSectionText)
+from griffe.docstrings.utils import parse_annotation
+from griffe.enumerations import DocstringSectionKind
+
+
+# pylint: disable=too-many-instance-attributes
+class DocstringsCache:
+    """
+    Persistent cache of the docstrings parsed by :func:`mkdocs_py_griffe.parsing.get_docstring_sections`,
+    owned by :class:`mkdocs_py_griffe.project.Project` (see `Configuration.docstrings_cache`).
+
+    Entries are stored in a SQLite database within the cache folder, keyed by a hash of the docstring's text and of
+    the parser options. They hold the structure of the sections consumed by the generator (text, admonitions,
+    parameters, returns and raises); the other sections are not cached.
+    """
+
+    FILENAME = "docstrings.sqlite"
+    """
+    Name of the database file in the cache folder.
+    """
+    FORMAT_VERSION = 1
+    """
+    Version of the entries' format, part of the keys.
+    """
+
+    def __init__(self, folder: Path, max_size: int, parser: str = "google"):
+        self.folder = Path(folder)
+        self.max_size = max_size
+        self.parser = parser
+        self.options = (
+            f"{parser};griffe={importlib.metadata.version('griffe')};"
+            f"format={DocstringsCache.FORMAT_VERSION}"
+        )
+        self.hits = 0
+        self.misses = 0
+        self.pending: dict[str, str] = {}
+        """
+        Entries parsed but not yet written in the database.
+        """
+        self.touched: set[str] = set()
+        """
+        Keys of the entries used but not yet marked as such in the database.
+        """
+        self.connection: sqlite3.Connection | None = None
+        self.pid: int | None = None
+
+    def connect(self) -> sqlite3.Connection:
+        if self.connection is None or self.pid != os.getpid():
+            # A connection is never shared with a forked worker process (see `Configuration.jobs`).
+            self.folder.mkdir(parents=True, exist_ok=True)
+            try:
+                self.connection = self.open_database()
+            except sqlite3.DatabaseError:
+                # Not a cache database (e.g. corrupted file), the cache is rebuilt.
+                for file_path in self.folder.glob(f"{DocstringsCache.FILENAME}*"):
+                    file_path.unlink()
+                self.connection = self.open_database()
+            self.pid = os.getpid()
+        return self.connection
+
+    def open_database(self) -> sqlite3.Connection:
+        """
+        Opens the database, creating its table if needed.
+
+        Returns:
+            The connection.
+
+        Raises:
+            sqlite3.DatabaseError: If the file is not a database, or its table does not have the expected columns.
+        """
+        connection = sqlite3.connect(self.folder / DocstringsCache.FILENAME, timeout=60)
+        try:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, sections TEXT NOT NULL, "
+                "size INTEGER NOT NULL, last_used REAL NOT NULL)"
+            )
+            connection.execute("SELECT key, sections, size, last_used FROM entries LIMIT 0")
+        except sqlite3.DatabaseError:
+            connection.close()
+            raise
+        return connection
+
+    def parse(self, docstring: AstDocstring) -> list[DocstringSection]:
+        """
+        Parses a docstring, using the cached structure when available.
+
+        Parameters:
+            docstring: The docstring, its parent is used to resolve the annotations of the raises sections.
+
+        Returns:
+            The sections.
+        """
+        key = hashlib.sha256(
+            f"{self.options}\n{docstring.value}".encode()
+        ).hexdigest()
+        sections = self.pending.get(key, None)
+        if sections is None:
+            row = (
+                self.connect()
+                .execute("SELECT sections FROM entries WHERE key = ?", (key,))
+                .fetchone()
+            )
+            sections = row[0] if row else None
+            if row:
+                self.touched.add(key)
+        if sections is not None:
+            self.hits += 1
+            return DocstringsCache.load_sections(json.loads(sections), docstring)
+
+        self.misses += 1
+        parsed = docstring.parse(self.parser)
+        self.pending[key] = json.dumps(DocstringsCache.dump_sections(parsed))
+        return parsed
+
+    def flush(self):
+        """
+        Writes the new entries and the usage of the existing ones in the database.
+        """
+        if not self.pending and not self.touched:
+            return
+        now = time.time()
+        with self.connect() as connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO entries (key, sections, size, last_used) VALUES (?, ?, ?, ?)",
+                [(k, v, len(v.encode()), now) for k, v in self.pending.items()],
+            )
+            connection.executemany(
+                "UPDATE entries SET last_used = ? WHERE key = ?",
+                [(now, k) for k in self.touched],
+            )
+        self.pending.clear()
+        self.touched.clear()
+
+    def evict(self) -> int:
+        """
+        Removes the least recently used entries until their total size fits `max_size`.
+
+        Returns:
+            The number of entries removed.
+        """
+        self.flush()
+        connection = self.connect()
+        with connection:
+            removed = connection.execute(
+                "DELETE FROM entries WHERE key IN (SELECT key FROM (SELECT key, SUM(size) OVER "
+                "(ORDER BY last_used DESC, key) AS total FROM entries) WHERE total > ?)",
+                (self.max_size,),
+            ).rowcount
+        if removed:
+            connection.execute("VACUUM")
+        return removed
+
+    def add_counts(self, hits: int, misses: int):
+        self.hits += hits
+        self.misses += misses
+
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses}
+
+    @staticmethod
+    def dump_sections(sections: list[DocstringSection]) -> list[dict[str, Any]]:
+        """
+        Parameters:
+            sections: Sections parsed by griffe.
+
+        Returns:
+            JSON serializable structure of the sections consumed by the generator.
+        """
+
+        def dump(section: DocstringSection) -> dict[str, Any] | None:
+            kind = section.kind.value
+            if isinstance(section, DocstringSectionText):
+                return {"kind": kind, "title": section.title, "value": section.value}
+            if isinstance(section, DocstringSectionAdmonition):
+                return {
+                    "kind": kind,
+                    "title": section.title,
+                    "tag": section.value.annotation,
+                    "description": section.value.description,
+                }
+            if isinstance(section, (DocstringSectionParameters, DocstringSectionReturns)):
+                return {
+                    "kind": kind,
+                    "title": section.title,
+                    "value": [
+                        {"name": e.name, "description": e.description}
+                        for e in section.value
+                    ],
+                }
+            if isinstance(section, DocstringSectionRaises):
+                return {
+                    "kind": kind,
+                    "title": section.title,
+                    "value": [
+                        {"annotation": str(e.annotation), "description": e.description}
+                        for e in section.value
+                    ],
+                }
+            return None
+
+        dumped = [dump(s) for s in sections]
+        return [s for s in dumped if s]
+
+    @staticmethod
+    def load_sections(
+        data: list[dict[str, Any]], docstring: AstDocstring
+    ) -> list[DocstringSection]:
+        """
+        Parameters:
+            data: Structure returned by :meth:`mkdocs_py_griffe.docstrings_cache.DocstringsCache.dump_sections`.
+            docstring: The docstring, its parent is used to resolve the annotations of the raises sections.
+
+        Returns:
+            The sections.
+        """
+
+        def load(section: dict[str, Any]) -> DocstringSection:
+            kind, title = DocstringSectionKind(section["kind"]), section["title"]
+            if kind == DocstringSectionKind.text:
+                return DocstringSectionText(section["value"], title=title)
+            if kind == DocstringSectionKind.admonition:
+                return DocstringSectionAdmonition(
+                    kind=section["tag"], text=section["description"], title=title
+                )
+            if kind == DocstringSectionKind.raises:
+                return DocstringSectionRaises(
+                    [
+                        DocstringRaise(
+                            annotation=parse_annotation(e["annotation"], docstring),
+                            description=e["description"],
+                        )
+                        for e in section["value"]
+                    ],
+                    title=title,
+                )
+            if kind == DocstringSectionKind.returns:
+                return DocstringSectionReturns(
+                    [DocstringReturn(**e) for e in section["value"]], title=title
+                )
+            factory = (
+                DocstringSectionOtherParameters
+                if kind == DocstringSectionKind.other_parameters
+                else DocstringSectionParameters
+            )
+            return factory([DocstringParameter(**e) for e in section["value"]], title=title)
+
+        return [load(s) for s in data]
@@ -0,0 +1,216 @@
+"""
+Incremental generations: manifest and fingerprints of the modules' inputs, see
+`Configuration.incremental`.
+"""
+
+import dataclasses
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Hashable
+
+from .configuration import Configuration
+from .links import resolve_cross_link, resolve_navigation_path
+from .project import Project
+from .rendering import ModuleRun
+from .symbols import get_module_ast
+from .writers import get_module_api_files, write_if_changed
+
+MANIFEST_FILENAME = ".manifest.json"
+"""
+Name of the manifest file (in `Configuration.out`) used by incremental generations.
+"""
+
+
+def sha256(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+def generator_fingerprint(config: Configuration) -> str:
+    """
+    Fingerprint of the generator: its sources and the configuration options affecting the API files.
+
+    Parameters:
+        config: Configuration.
+
+    Returns:
+        The fingerprint.
+    """
+    options = {
+        k: v
+        for k, v in config._asdict().items()
+        if k
+        not in {"out", "jobs", "incremental", "docstrings_cache", "docstrings_cache_size"}
+    }
+    sources = [
+        sha256(source.read_bytes())
+        for source in sorted(Path(__file__).parent.glob("*.py"))
+    ]
+    return sha256(repr((options, sources)).encode())
+
+
+def module_inputs_fingerprint(path: str, project: Project) -> str:
+    """
+    Fingerprint of the inputs of a module's API file that do not involve links resolution:
+    its source files, those defining the members its classes inherit, and its children modules.
+
+    Parameters:
+        path: Canonical path of the module.
+        project: Project description.
+
+    Returns:
+        The fingerprint.
+    """
+    module = get_module_ast(path=path, project=project)
+    elements = project.modules_tree[path]
+    # The inherited members are rendered with the classes, they may be defined in other modules.
+    inherited = [m for c in elements.classes for m in c.inherited_members.values()]
+    filepaths = {
+        f.filepath
+        for f in [module, *elements.files, *inherited]
+        # Packages may be loaded from their folder (e.g. namespace packages), they do not have a source file.
+        if isinstance(f.filepath, Path) and f.filepath.is_file()
+    }
+    sources = [
+        (str(filepath), sha256(filepath.read_bytes()))
+        for filepath in sorted(filepaths)
+    ]
+    children = [
+        (m.name, m.canonical_path, project.modules_tree[m.canonical_path].is_leaf)
+        for m in elements.modules
+    ]
+    return sha256(repr((sources, children)).encode())
+
+
+def resolutions_fingerprint(
+    dependencies: list[tuple[str, Hashable]], project: Project
+) -> str:
+    """
+    Fingerprint of the links resolutions a module depends on, evaluated with the current project.
+
+    Parameters:
+        dependencies: The `(category, key)` of the resolutions, see
+            :attr:`mkdocs_py_griffe.rendering.ModuleRun.dependencies`.
+        project: Project description.
+
+    Returns:
+        The fingerprint.
+    """
+
+    def resolve(category: str, key: Any):
+        resolvers = {
+            "navigation_path": lambda: resolve_navigation_path(
+                py_path=key[0], name=key[1], project=project
+            ),
+            "cross_link": lambda: resolve_cross_link(
+                tag=key[0], py_path=key[1], project=project
+            ),
+        }
+        return project.resolution_cache.get(
+            category, key, resolvers[category], tracked=False
+        )
+
+    values = [resolve(category, key) for category, key in dependencies]
+    return sha256(json.dumps(values).encode())
+
+
+def is_module_up_to_date(path: str, entry: dict[str, Any], project: Project) -> bool:
+    """
+    Whether a module's API file generated previously is up-to-date.
+
+    Parameters:
+        path: Canonical path of the module.
+        entry: The module's entry in the manifest of the previous generation.
+        project: Project description.
+
+    Returns:
+        `True` if the API file exists and the module's inputs as well as the resolution of its dependencies did
+        not change.
+    """
+    files = get_module_api_files(path=path, config=project.config)
+    if not all(f.exists() for f in files):
+        return False
+    if entry["inputs"] != module_inputs_fingerprint(path=path, project=project):
+        return False
+    dependencies = [(category, tuple(key)) for category, key in entry["dependencies"]]
+    return entry["resolutions"] == resolutions_fingerprint(
+        dependencies=dependencies, project=project
+    )
+
+
+def load_manifest(config: Configuration) -> dict[str, Any]:
+    manifest_path = Path(config.out) / MANIFEST_FILENAME
+    if not config.incremental or not manifest_path.exists():
+        return {"modules": {}}
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding="UTF8"))
+    except ValueError:
+        # Not a manifest (e.g. truncated file), all the modules are rendered.
+        return {"modules": {}}
+    if manifest.get("generator") != generator_fingerprint(config=config):
+        return {"modules": {}}
+    return manifest
+
+
+def manifest_entry(path: str, run: ModuleRun, project: Project) -> dict[str, Any]:
+    return {
+        "inputs": module_inputs_fingerprint(path=path, project=project),
+        "dependencies": run.dependencies,
+        "resolutions": resolutions_fingerprint(
+            dependencies=run.dependencies, project=project
+        ),
+        "diagnostics": run.reporter.to_json(),
+        "search": [[dataclasses.asdict(e.document), e.terms] for e in run.search],
+    }
+
+
+def find_up_to_date_modules(project: Project) -> dict[str, dict[str, Any]]:
+    """
+    Parameters:
+        project: Project description.
+
+    Returns:
+        The manifest entries (of the previous generation) of the modules whose API files are up-to-date, by
+        module's path. Empty if `Configuration.incremental` is disabled.
+    """
+    manifest = load_manifest(config=project.config)
+    entries = {}
+    for path in project.modules_tree.keys():
+        entry = manifest["modules"].get(path, None)
+        if entry and is_module_up_to_date(path=path, entry=entry, project=project):
+            entries[path] = entry
+    return entries
+
+
+def write_manifest(
+    runs: dict[str, ModuleRun], up_to_date: dict[str, dict[str, Any]], project: Project
+):
+    """
+    Writes the manifest used by the next incremental generation.
+
+    Parameters:
+        runs: Outcomes of the modules rendered by this generation.
+        up_to_date: Manifest entries of the modules skipped by this generation,
+            see :func:`mkdocs_py_griffe.incremental.find_up_to_date_modules`.
+        project: Project description.
+    """
+    entries = {
+        **up_to_date,
+        **{
+            path: manifest_entry(path=path, run=run, project=project)
+            for path, run in runs.items()
+        },
+    }
+    manifest = {
+        "generator": generator_fingerprint(config=project.config),
+        "modules": {path: entries[path] for path in project.modules_tree},
+    }
+    write_if_changed(
+        target_path=Path(project.config.out) / MANIFEST_FILENAME,
+        write=lambda file_path: file_path.write_text(
+            json.dumps(manifest), encoding="UTF8"
+        ),
+    )
+    project.reporter.add_stat(
+        "Incremental generation", {"rendered": len(runs), "skipped": len(up_to_date)}
+    )
@@ -0,0 +1,140 @@
+"""
+Indexes of the symbols and of the external links rules, used to resolve links.
+"""
+
+import bisect
+import re
+from typing import Any, Iterable, Literal, NamedTuple
+
+SymbolKind = Literal["function", "attribute", "class", "property", "method", "module"]
+"""
+Possible kinds for a symbol.
+"""
+
+
+class SymbolRef(NamedTuple):
+    """
+    Represents a reference of a symbol in the library.
+    Initialized from the function :func:`mkdocs_py_griffe.symbols.init_symbols`.
+    """
+
+    kind: SymbolKind
+    """
+    Kind of the symbol.
+    """
+    navigation_path: str
+    """
+    Navigation path.
+    """
+
+
+# pylint: disable=too-few-public-methods
+class SuffixIndex:
+    """
+    Index of paths allowing to retrieve efficiently those ending with a given suffix.
+
+    Paths are stored reversed and sorted, such that the paths ending with a suffix form a contiguous range
+    located by binary search. Look-ups cost is proportional to the suffix length (and the number of matches),
+    rather than to the number of paths.
+    """
+
+    def __init__(self, paths: Iterable[str]):
+        """
+        Initializes the index.
+
+        Parameters:
+            paths: The indexed paths, their order is preserved in the results of
+                :meth:`mkdocs_py_griffe.indexes.SuffixIndex.ending_with`.
+        """
+        entries = sorted((path[::-1], index) for index, path in enumerate(paths))
+        self.reversed_paths = [reversed_path for reversed_path, _ in entries]
+        self.indexes = [index for _, index in entries]
+
+    def ending_with(self, suffix: str) -> list[str]:
+        """
+        Retrieves the paths ending with a given suffix.
+
+        Parameters:
+            suffix: The suffix.
+
+        Returns:
+            The matching paths, in the order provided at construction.
+        """
+        reversed_suffix = suffix[::-1]
+        start = bisect.bisect_left(self.reversed_paths, reversed_suffix)
+        end = start
+        while end < len(self.reversed_paths) and self.reversed_paths[end].startswith(
+            reversed_suffix
+        ):
+            end += 1
+        matches = sorted(zip(self.indexes[start:end], self.reversed_paths[start:end]))
+        return [reversed_path[::-1] for _, reversed_path in matches]
+
+
+# pylint: disable=too-few-public-methods
+class PrefixRules:
+    """
+    Rules associating paths' prefixes to URLs templates, with longest-prefix matching.
+
+    The prefixes are stored in a trie of the paths' segments: look-ups cost is proportional to the depth of the
+    path, rather than to the number of rules.
+
+    Only the placeholders `{path}`, `{name}` and `{relative}` are substituted in the templates, other braces are
+    kept as is.
+    """
+
+    PLACEHOLDER = re.compile(r"\{(path|name|relative)\}")
+
+    def __init__(self, rules: dict[str, str]):
+        """
+        Initializes the rules.
+
+        Parameters:
+            rules: URLs templates keyed by prefixes, see `Configuration.external_link_rules`.
+
+        Raises:
+            ValueError: If a prefix is empty.
+        """
+        # Nodes are keyed by segment, the template of a rule (if any) is stored at the key `None`: split on the
+        # placeholders, the odd items being their names.
+        self.root: dict[str | None, Any] = {}
+        for prefix, template in rules.items():
+            if not prefix.rstrip("."):
+                raise ValueError(
+                    f"Empty prefix in the external link rules (template '{template}'): prefixes start with a "
+                    "package's name, e.g. 'numpy.'"
+                )
+            node = self.root
+            for segment in prefix.rstrip(".").split("."):
+                node = node.setdefault(segment, {})
+            node[None] = PrefixRules.PLACEHOLDER.split(template)
+
+    def get(self, py_path: str) -> str | None:
+        """
+        Retrieves the URL of a symbol from the rule with the longest prefix matching its path.
+
+        Parameters:
+            py_path: The symbol's path.
+
+        Returns:
+            The URL if a rule matches, `None` otherwise.
+        """
+        segments = py_path.split(".")
+        node = self.root
+        template, depth = None, 0
+        for index, segment in enumerate(segments):
+            node = node.get(segment, None)
+            if node is None:
+                break
+            if None in node:
+                template, depth = node[None], index + 1
+        if template is None:
+            return None
+        values = {
+            "path": py_path,
+            "name": segments[-1],
+            "relative": ".".join(segments[depth:]),
+        }
+        return "".join(
+            values[part] if index % 2 else part for index, part in enumerate(template)
+        )
@@ -0,0 +1,238 @@
+"""
+Inventories of symbols: Sphinx's `objects.inv` files and the symbols inventories of the packages
+documented with this backend.
+"""
+
+import bisect
+import re
+import zlib
+from pathlib import Path
+from typing import Iterable, cast
+
+from .indexes import SuffixIndex, SymbolKind, SymbolRef
+
+
+def read_inventory_header(content: bytes) -> tuple[list[str], int]:
+    """
+    Reads the header of an inventory file (Sphinx's `objects.inv`, or
+    :class:`mkdocs_py_griffe.inventories.SymbolInventory`): its leading lines starting with `#`.
+
+    Parameters:
+        content: The file's content.
+
+    Returns:
+        The lines of the header (without the leading `#`), and the offset of the remainder of the file.
+    """
+    header = []
+    offset = 0
+    while content.startswith(b"#", offset):
+        end = content.index(b"\n", offset)
+        header.append(content[offset:end].decode("UTF8")[1:].strip())
+        offset = end + 1
+    return header, offset
+
+
+SPHINX_INVENTORY_LINE = re.compile(
+    r"(?P<name>.+?)\s+(?P<role>\S+)\s+-?\d+\s+?(?P<uri>\S*)\s+.*"
+)
+"""
+Format of the entries of the Sphinx inventories: `{name} {domain}:{role} {priority} {uri} {display name}`.
+"""
+
+
+class SphinxInventory:
+    """
+    Index of the Python objects referenced by a Sphinx inventory file (`objects.inv`, version 2), loaded when first
+    queried.
+
+    Names are kept sorted along with their (not expanded) URIs, look-ups are binary searches: there is no
+    per-entry object, and the index stays compact for inventories of tens of thousands of entries.
+    """
+
+    def __init__(self, file_path: Path, base_url: str):
+        """
+        Initializes the index, the file is not read.
+
+        Parameters:
+            file_path: Path of the inventory file.
+            base_url: The base URL of the documentation, the inventory's URIs are relative to it.
+
+        Raises:
+            FileNotFoundError: If the file does not exist (reported before any module is rendered).
+        """
+        if not file_path.is_file():
+            raise FileNotFoundError(f"Sphinx inventory '{file_path}' not found")
+        self.file_path = file_path
+        self.base_url = base_url if base_url.endswith("/") else f"{base_url}/"
+        self.names: list[str] | None = None
+        self.uris: list[str] = []
+
+    def load(self):
+        """
+        Parses the inventory file (only the first call has an effect).
+
+        Raises:
+            ValueError: If the file is not a Sphinx inventory of version 2.
+        """
+        if self.names is not None:
+            return
+        content = self.file_path.read_bytes()
+        header, offset = read_inventory_header(content)
+        if not header or header[0] != "Sphinx inventory version 2":
+            raise ValueError(f"'{self.file_path}' is not a Sphinx inventory (version 2)")
+        entries: dict[str, str] = {}
+        lines = zlib.decompress(content[offset:]).decode("UTF8").splitlines()
+        for line in lines:
+            match = SPHINX_INVENTORY_LINE.match(line)
+            if not match or not match.group("role").startswith("py:"):
+                continue
+            # The first entry of a name has priority (e.g. a class over its homonym constructor's data).
+            entries.setdefault(match.group("name"), match.group("uri"))
+        self.names = sorted(entries)
+        self.uris = [entries[name] for name in self.names]
+
+    def get(self, py_path: str) -> str | None:
+        """
+        Parameters:
+            py_path: Path of a Python object.
+
+        Returns:
+            The URL of the object's documentation, `None` if it is not referenced.
+        """
+        self.load()
+        names = cast(list[str], self.names)
+        index = bisect.bisect_left(names, py_path)
+        if index == len(names) or names[index] != py_path:
+            return None
+        uri = self.uris[index]
+        if uri.endswith("$"):
+            uri = uri[:-1] + py_path
+        return self.base_url + uri
+
+
+INVENTORY_FILENAME = "api.inventory"
+"""
+Name of the symbols' inventory file (in `Configuration.out`), see `Configuration.inventory`.
+"""
+
+
+INVENTORY_VERSION = 1
+"""
+Version of the format of the symbols' inventories, see :class:`mkdocs_py_griffe.inventories.SymbolInventory`.
+"""
+
+
+class SymbolInventory:
+    """
+    Inventory of the symbols of a package, similar in spirit to the Sphinx's `objects.inv` files.
+
+    The file starts with a header of text lines (starting with `#`):
+    ```
+    # mkdocs_py_griffe symbols inventory version 1
+    # Project: foo
+    # Navigation: /api/foo
+    # The remainder of this file is compressed using zlib.
+    ```
+    followed by the zlib-compressed entries sorted by path, one per line: `{path} {kind} {navigation path}`
+    (*e.g.* `foo.bar.Baz class foo/bar.Baz`). Paths include the package's name, navigation paths are relative to
+    the package's documentation (`Navigation` in the header).
+
+    Look-ups are binary searches within the sorted paths.
+    """
+
+    def __init__(self, project: str, base_nav: str, entries: Iterable[tuple[str, SymbolRef]]):
+        """
+        Initializes the inventory.
+
+        Parameters:
+            project: Name of the package.
+            base_nav: The base URL of the package's documentation.
+            entries: The pairs `path`, :class:`mkdocs_py_griffe.indexes.SymbolRef`.
+        """
+        self.project = project
+        self.base_nav = base_nav
+        sorted_entries = sorted(entries)
+        self.paths = [path for path, _ in sorted_entries]
+        self.refs = [ref for _, ref in sorted_entries]
+        self.suffix_index: SuffixIndex | None = None
+
+    @staticmethod
+    def load(file_path: Path) -> "SymbolInventory":
+        """
+        Parameters:
+            file_path: Path of the inventory file.
+
+        Returns:
+            The inventory.
+
+        Raises:
+            ValueError: If the file is not an inventory, or its version is not supported.
+        """
+        content = file_path.read_bytes()
+        header, offset = read_inventory_header(content)
+        expected = f"mkdocs_py_griffe symbols inventory version {INVENTORY_VERSION}"
+        if not header or header[0] != expected:
+            raise ValueError(
+                f"'{file_path}' is not a symbols inventory (version {INVENTORY_VERSION})"
+            )
+        fields = dict(line.split(": ", 1) for line in header[1:] if ": " in line)
+        lines = zlib.decompress(content[offset:]).decode("UTF8").splitlines()
+        entries = []
+        for line in lines:
+            path, kind, nav = line.split(" ", 2)
+            entries.append(
+                (path, SymbolRef(kind=cast(SymbolKind, kind), navigation_path=nav))
+            )
+        return SymbolInventory(
+            project=fields.get("Project", ""),
+            base_nav=fields.get("Navigation", ""),
+            entries=entries,
+        )
+
+    def dumps(self) -> bytes:
+        """
+        Returns:
+            The content of the inventory file.
+        """
+        header = (
+            f"# mkdocs_py_griffe symbols inventory version {INVENTORY_VERSION}\n"
+            f"# Project: {self.project}\n"
+            f"# Navigation: {self.base_nav}\n"
+            "# The remainder of this file is compressed using zlib.\n"
+        )
+        lines = "".join(
+            f"{path} {ref.kind} {ref.navigation_path}\n"
+            for path, ref in zip(self.paths, self.refs)
+        )
+        return header.encode("UTF8") + zlib.compress(lines.encode("UTF8"), 9)
+
+    def get(self, path: str) -> SymbolRef | None:
+        """
+        Parameters:
+            path: Path of the symbol (including the package's name).
+
+        Returns:
+            The symbol's reference, `None` if not included.
+        """
+        index = bisect.bisect_left(self.paths, path)
+        if index < len(self.paths) and self.paths[index] == path:
+            return self.refs[index]
+        return None
+
+    def ending_with(self, suffix: str) -> list[str]:
+        """
+        Retrieves the paths ending with a given suffix (*e.g.* to suggest the symbols matching a short name), the
+        suffixes' index is built on first use.
+
+        Parameters:
+            suffix: The suffix.
+
+        Returns:
+            The matching paths.
+        """
+        if self.suffix_index is None:
+            self.suffix_index = SuffixIndex(self.paths)
+        return self.suffix_index.ending_with(suffix)
+
+    def __len__(self) -> int:
+        return len(self.paths)
@@ -0,0 +1,261 @@
+"""
+Resolution of the navigation paths and of the sphinx like cross links.
+"""
+
+import re
+from typing import Literal
+
+from griffe.dataclasses import Attribute as AstAttribute
+from griffe.dataclasses import Class as AstClass
+from griffe.dataclasses import Function as AstFunction
+from griffe.dataclasses import Module as AstModule
+from griffe.expressions import ExprName
+
+from .project import Project
+
+SphinxCrossLinkTag = Literal["mod", "class", "func", "attr", "meth", "glob"]
+"""
+Type of supported tags for sphinx like cross links.
+"""
+
+
+SUPPORTED_CROSS_LINK_TAGS: set[SphinxCrossLinkTag] = {
+    "mod",
+    "class",
+    "func",
+    "attr",
+    "meth",
+    "glob",
+}
+"""
+The supported tags for sphinx like cross links.
+
+*E.g.*:
+```
+*  :tag:`symbol`
+*  :tag:`a custom text <symbol>`
+*  :tag:`a custom text <foo.bar.symbol>`
+```
+"""
+
+
+def canonical_path(
+    ast: AstModule | AstAttribute | AstClass | AstFunction | ExprName,
+    project: Project,
+):
+    return ast.canonical_path.replace(f"{project.root_ast.name}.", "")
+
+
+def navigation_path(py_path: str, name: str, project: Project) -> str | None:
+    nav = project.resolution_cache.get(
+        "navigation_path",
+        (py_path, name),
+        lambda: resolve_navigation_path(py_path=py_path, name=name, project=project),
+    )
+    # Failures are reported for each use (not only when first resolved): the diagnostics of a module then do not
+    # depend on the modules processed before.
+    if nav is None and py_path.startswith(project.root_ast.name):
+        project.reporter.add_internal_cross_ref_error(py_path)
+    elif nav is None:
+        project.reporter.add_external_cross_ref_error(py_path)
+    return nav
+
+
+def resolve_navigation_path(py_path: str, name: str, project: Project) -> str | None:
+    if py_path.startswith(project.root_ast.name):
+        return resolve_internal_navigation_path(py_path=py_path, name=name, project=project)
+    return resolve_external_navigation_path(py_path=py_path, project=project)
+
+
+def resolve_internal_navigation_path(py_path: str, name: str, project: Project) -> str | None:
+
+    def get_symbol(path: str):
+        base = path.replace(f"{project.root_ast.name}.", "")
+        symbol_direct = project.all_symbols.get(base, None)
+        if symbol_direct:
+            return symbol_direct
+        alias = project.all_aliases.get(path, None)
+        if alias:
+            base = alias.replace(f"{project.root_ast.name}.", "")
+            symbol_alias = project.all_symbols.get(base, None)
+            return symbol_alias
+        return None
+
+    symbol = get_symbol(path=py_path)
+    if not symbol:
+        parent_symbol = get_symbol(path=py_path.replace(f".{name}", ""))
+        if parent_symbol and parent_symbol.kind == "attribute":
+            # This is when linking an instance's attribute (from implementation in declaration).
+            # We link to the parent global attribute if it exists.
+            return f"@nav{project.config.base_nav}/{parent_symbol.navigation_path}"
+        return None
+    return f"@nav{project.config.base_nav}/{symbol.navigation_path}"
+
+
+def resolve_external_navigation_path(py_path: str, project: Project) -> str | None:
+    if py_path in project.config.external_links:
+        return project.config.external_links[py_path]
+    package_name = py_path.split(".")[0]
+    cross_linked_inventory = project.cross_linked_inventories.get(package_name, None)
+    cross_linked_symbol = cross_linked_inventory and cross_linked_inventory.get(py_path)
+    if cross_linked_symbol:
+        base_path = project.config.cross_linked_packages[package_name]
+        return f"@nav{base_path}/{cross_linked_symbol.navigation_path}"
+    for inventory in project.sphinx_inventories:
+        url = inventory.get(py_path)
+        if url:
+            return url
+
+    return project.external_link_rules.get(py_path)
+
+
+def expr_canonical_path(expr: ExprName, project: Project) -> str:
+    """
+    Canonical path of a name referenced in an expression, the resolutions are memoized by the canonical path of
+    the scope the name is resolved in (the module or class including the expression) and the name.
+
+    Parameters:
+        expr: The name.
+        project: Project description.
+
+    Returns:
+        The canonical path.
+    """
+    parent = expr.parent
+    if isinstance(parent, ExprName):
+        return f"{expr_canonical_path(expr=parent, project=project)}.{expr.name}"
+    if not isinstance(parent, (AstModule, AstClass)):
+        return expr.canonical_path
+    return project.resolution_cache.get(
+        "canonical_path",
+        (parent.canonical_path, expr.name),
+        lambda: expr.canonical_path,
+        tracked=False,
+    )
+
+
+def navigation_path_ast(
+    ast: AstModule | AstAttribute | AstClass | AstFunction | ExprName, project: Project
+) -> str | None:
+    py_path = (
+        expr_canonical_path(expr=ast, project=project)
+        if isinstance(ast, ExprName)
+        else ast.canonical_path
+    )
+    return navigation_path(py_path=py_path, name=ast.name, project=project)
+
+
+def get_nav_path(tag: SUPPORTED_CROSS_LINK_TAGS, py_path: str):
+    nav = ""
+    if tag == "mod":
+        nav = py_path.replace(".", "/")
+    parts = py_path.split(".")
+    if tag in ["class", "func", "glob"]:
+        # Symbols of a root module have less parts (e.g. 'Foo' for the class 'foo.Foo' => '.Foo').
+        nav = "/".join(parts[0:-2]) + "." + ".".join(parts[-2:])
+    if tag in ["meth", "attr"]:
+        nav = "/".join(parts[0:-3]) + "." + ".".join(parts[-3:])
+    return nav
+
+
+def sanitize_py_path(py_path: str, project: Project) -> str:
+    project_prefix = f"{project.root_ast.name}."
+    if py_path.startswith(project_prefix):
+        return py_path.replace(project_prefix, "")
+    return py_path
+
+
+def get_cross_link_candidates(
+    link_type: SphinxCrossLinkTag, short_link: str, project: Project
+) -> list[str]:
+    short_link_sanitized = sanitize_py_path(short_link, project=project)
+    parent_symbol = ".".join(short_link_sanitized.split(".")[0:-1])
+    suffix = (
+        short_link_sanitized
+        if link_type in {"mod", "class", "func", "glob"}
+        else parent_symbol
+    )
+    return [
+        *project.symbols_index.ending_with(suffix),
+        *[
+            candidate
+            for inventory in project.cross_linked_inventories.values()
+            for candidate in inventory.ending_with(suffix)
+        ],
+    ]
+
+
+def resolve_cross_link(
+    tag: SphinxCrossLinkTag, py_path: str, project: Project
+) -> tuple[str | None, list[str]]:
+    """
+    Resolves the target of a sphinx like cross link.
+
+    Parameters:
+        tag: The link's tag.
+        py_path: The link's target path.
+        project: Project description.
+
+    Returns:
+        The URL if resolved, otherwise `None` along with candidates symbols.
+    """
+    py_path = sanitize_py_path(py_path, project=project)
+    if project.all_symbols.get(py_path, None):
+        nav_path = get_nav_path(tag=tag, py_path=py_path)
+        return f"@nav{project.config.base_nav}/{nav_path}", []
+
+    package_name = py_path.split(".")[0]
+    inventory = project.cross_linked_inventories.get(package_name, None)
+    if project.config.cross_linked_packages.get(package_name, None) and inventory:
+        symbol = inventory.get(py_path)
+        if symbol:
+            base_path = project.config.cross_linked_packages[package_name]
+            return f"@nav{base_path}/{symbol.navigation_path}", []
+        return None, inventory.ending_with(py_path.split(".")[-1])
+    if project.config.cross_linked_packages.get(package_name, None):
+        # Remove the package name from the path (e.g. 'youwol.foo.bar' => 'foo.bar')
+        relative_path = ".".join(py_path.split(".")[1:])
+        nav_path = get_nav_path(tag=tag, py_path=relative_path)
+        base_path = project.config.cross_linked_packages[package_name]
+        return f"@nav{base_path}/{nav_path}", []
+
+    return None, get_cross_link_candidates(
+        link_type=tag, short_link=py_path, project=project
+    )
+
+
+def replace_links(text: str, parent: str, project: Project) -> str:
+
+    cross_ref_pattern = r":(\w+):`([^`]+)`"
+
+    def replace_function(match: re.Match):
+        tag = match.group(1)  # Capture the tag (e.g., func, class, etc.)
+        # Capture the value between the backticks
+        # (e.g., 'module.foo' or 'custom text <module.foo>')
+        content = match.group(2)
+        py_path = content
+        label = py_path.split(".")[-1]
+
+        if tag not in SUPPORTED_CROSS_LINK_TAGS:
+            project.reporter.add_sphinx_tag_unknown(parent, tag)
+            return label
+
+        pattern = r"<([^>]+)>"
+        matches = re.findall(pattern, py_path)
+        if matches:
+            index_start = py_path.find("<")
+            label = py_path[0:index_start]
+            py_path = matches[0]
+
+        url, candidates = project.resolution_cache.get(
+            "cross_link",
+            (tag, py_path),
+            lambda: resolve_cross_link(tag=tag, py_path=py_path, project=project),
+        )
+        if url:
+            return f"[{label}]({url})"
+
+        project.reporter.add_sphinx_link_unresolved(parent, match.group(0), candidates)
+        return label
+
+    return re.sub(cross_ref_pattern, replace_function, text)
@@ -5,7 +5,7 @@ Python version of the target TypeScript [models](@nav/api/CodeApi.models.ts).
 # pylint: disable=invalid-name
 
 import dataclasses
-from typing import Optional
+from typing import Optional, Union
 
 EntityPath = str
 """
@@ -76,6 +76,7 @@ class Documentation:
 
 
 @dataclasses.dataclass(frozen=True)
+# pylint: disable=too-many-instance-attributes
 class Code:
     """
     Entity code's description.
@@ -97,13 +98,28 @@ class Code:
     """
     Ending line of the declaration.
     """
-    references: dict[str, EntityPath]
+    references: dict[str, Union[EntityPath, int]]
     """
-    References to other entities in the declaration.
+    References to other entities in the declaration, either their URL or its index in `Module.symbols`.
     """
     implementation: Optional[str] = None
     """
     Optional associated implementation.
+
+    As the other fields defaulting to `None`, it is omitted from the API files when unset.
+    """
+    implementationRef: Optional[str] = None
+    """
+    Reference of the implementation when stored in a separate file rather than in `implementation`, formatted as
+    `{file}#{key}`: `file` is the path of the JSON file (relative to the API files' folder) mapping keys to
+    implementations.
+    """
+    sourceRef: Optional[str] = None
+    """
+    Reference of the source of the file including the entity, when the implementation is given by the lines
+    `startLine` to `endLine` of this source. It is formatted as `{file}#{filePath}`: `file` is the path of the JSON
+    file (relative to the API files' folder) mapping files' paths to sources, or is empty when the sources are
+    included in the module (`Module.sources`).
     """
 
 
@@ -202,6 +218,110 @@ class ChildModule:
     """
 
 
+@dataclasses.dataclass(frozen=True)
+class ModuleSummary:
+    """
+    Summary of a module within the navigation tree, see :func:`mkdocs_py_griffe.writers.get_nav_summary`.
+    """
+
+    name: str
+    """
+    Name.
+    """
+    path: EntityPath
+    """
+    Path (*e.g.* `ModuleFoo.ModuleBar`).
+    """
+    isLeaf: bool
+    """
+    Whether it includes children modules.
+    """
+    summary: str
+    """
+    First line of the module's docstring (empty if none).
+    """
+    children: list["ModuleSummary"]
+    """
+    Children modules.
+    """
+
+
+@dataclasses.dataclass(frozen=True)
+class SearchDocument:
+    """
+    Entity referenced by the search index, see :func:`mkdocs_py_griffe.search.write_search_index`.
+    """
+
+    name: str
+    """
+    Name.
+    """
+    path: EntityPath
+    """
+    The path (e.g. `ModuleFoo.TypeBar.attrBaz`).
+    """
+    role: str
+    """
+    Role of the entity's semantic (*e.g.* `class`, `function`).
+    """
+    url: Optional[str]
+    """
+    Navigation URL of the entity.
+    """
+    summary: str
+    """
+    First line of the entity's documentation (empty if none).
+    """
+
+
+@dataclasses.dataclass(frozen=True)
+class ShardEntry:
+    """
+    Reference of an entity of a module written in a separate shard file (see `Module.shards`).
+    """
+
+    name: str
+    """
+    Name of the entity.
+    """
+    path: str
+    """
+    Path of the entity, its view's anchor is available before the shard is fetched.
+    """
+    kind: str
+    """
+    Kind of the entity: `type`, `callable` or `attribute`.
+    """
+    filePath: str
+    """
+    File path in which the entity is declared.
+    """
+    shard: str
+    """
+    Path of the shard file including the entity (relative to the API files' folder).
+    """
+
+
+@dataclasses.dataclass(frozen=True)
+class ModuleShard:
+    """
+    Shard of a module's entities, see `Module.shards`.
+    """
+
+    types: list[Type]
+    """
+    Types components.
+    """
+    callables: list[Callable]
+    """
+    Callable components.
+    """
+    attributes: list[Attribute]
+    """
+    Attributes components.
+    """
+
+
 @dataclasses.dataclass(frozen=True)
 # pylint: disable=too-many-instance-attributes
 class Module:
@@ -247,3 +367,17 @@ class Module:
     """
     Files components.
     """
+    sources: Optional[dict[str, str]] = None
+    """
+    Sources of the module's files (keyed by their path) when the implementations refer to them,
+    see `Code.sourceRef`.
+    """
+    symbols: Optional[list[str]] = None
+    """
+    URLs referenced by the entities of the module when `Code.references` refer to them by index.
+    """
+    shards: Optional[list[ShardEntry]] = None
+    """
+    References of the module's entities when they are written in separate shard files, `types`, `callables` and
+    `attributes` are then empty.
+    """
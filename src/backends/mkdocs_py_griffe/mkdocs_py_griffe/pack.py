@@ -0,0 +1,241 @@
+"""
+Precompression of the API files and their concatenation into a single pack file.
+"""
+
+import gzip
+import json
+import mmap
+import shutil
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable, cast
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+from .configuration import Configuration, PrecompressFormat
+from .writers import get_module_api_files, write_if_changed
+
+
+def compress(content: bytes, compress_format: PrecompressFormat) -> bytes:
+    if compress_format == "gz":
+        # `mtime=0` makes the output deterministic.
+        return gzip.compress(content, compresslevel=9, mtime=0)
+    return brotli.compress(content)
+
+
+def decompress(content: bytes, compress_format: PrecompressFormat) -> bytes | None:
+    """
+    Decompresses the content of a precompressed sibling.
+
+    Parameters:
+        content: Compressed content.
+        compress_format: Compression format.
+
+    Returns:
+        The decompressed content, `None` if the content is not valid (e.g. truncated).
+    """
+    if compress_format == "gz":
+        try:
+            return gzip.decompress(content)
+        except (OSError, EOFError, zlib.error):
+            return None
+    try:
+        return brotli.decompress(content)
+    except brotli.error:
+        return None
+
+
+def precompress_api_file(
+    file_path: Path, config: Configuration
+) -> list[PrecompressFormat]:
+    """
+    Writes the precompressed siblings of an API file (see `Configuration.precompress`) when missing or not matching
+    the file's content. Siblings of files smaller than `Configuration.precompress_min_size`, or of formats not
+    requested, are removed.
+
+    Parameters:
+        file_path: Path of the API file.
+        config: Configuration.
+
+    Returns:
+        The formats of the siblings written.
+    """
+    file_size = file_path.stat().st_size
+    written: list[PrecompressFormat] = []
+    content = None
+    for compress_format in cast(list[PrecompressFormat], ["gz", "br"]):
+        sibling = file_path.with_name(f"{file_path.name}.{compress_format}")
+        if (
+            compress_format not in config.precompress
+            or file_size < config.precompress_min_size
+        ):
+            sibling.unlink(missing_ok=True)
+            continue
+        content = content if content is not None else file_path.read_bytes()
+        # Decompressing is much cheaper than compressing, and does not depend on the files' times.
+        if sibling.exists() and decompress(sibling.read_bytes(), compress_format) == content:
+            continue
+        compressed = compress(content, compress_format)
+        write_if_changed(sibling, lambda p, c=compressed: p.write_bytes(c))
+        written.append(compress_format)
+    return written
+
+
+class Precompressor:
+    """
+    Writes the precompressed siblings of the API files in background threads, see
+    :func:`mkdocs_py_griffe.pack.precompress_api_file`.
+
+    The threads are started on the first submission: with parallel rendering, it happens after the worker processes
+    have been forked.
+    """
+
+    def __init__(self, config: Configuration):
+        if "br" in config.precompress and brotli is None:
+            raise ValueError("The 'br' precompression format requires the 'brotli' package")
+        self.config = config
+        self.executor: ThreadPoolExecutor | None = None
+        self.futures: list[Future] = []
+
+    def submit(self, path: str):
+        """
+        Submits the precompression of a module's API files. If `Configuration.precompress` is empty, it only removes
+        the siblings written by previous generations.
+
+        Parameters:
+            path: Canonical path of the module.
+        """
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=max(1, self.config.jobs))
+        for file_path in get_module_api_files(path=path, config=self.config):
+            self.futures.append(
+                self.executor.submit(precompress_api_file, file_path, self.config)
+            )
+
+    def wait(self) -> dict[str, int]:
+        """
+        Waits for the submitted compressions.
+
+        Returns:
+            The number of files written per format.
+        """
+        counts = {f: 0 for f in self.config.precompress}
+        for future in self.futures:
+            for compress_format in future.result():
+                counts[compress_format] += 1
+        if self.executor:
+            self.executor.shutdown()
+        return counts
+
+
+PACK_FILENAME = "api.pack"
+"""
+Name of the pack file (in `Configuration.out`), see `Configuration.pack`.
+"""
+
+
+PACK_INDEX_FILENAME = "api.pack-index.json"
+"""
+Name of the index of the pack file (in `Configuration.out`), see `Configuration.pack`.
+"""
+
+
+def write_pack(paths: Iterable[str], config: Configuration) -> bool:
+    """
+    Writes the API files of modules in a single pack file (if its content changed), by concatenating them.
+
+    The index maps the API files' paths (relative to `Configuration.out`, *e.g.* `foo/bar.json`) to their
+    `[offset, length]` in the pack, it is written as JSON:
+    ```
+    {
+        "pack": "api.pack",
+        "files": {"foo.json": [0, 1256], "foo/bar.json": [1256, 3010]}
+    }
+    ```
+
+    Parameters:
+        paths: Canonical paths of the modules.
+        config: Configuration.
+
+    Returns:
+        Whether the pack file has been written.
+    """
+    out = Path(config.out)
+    files: dict[str, list[int]] = {}
+
+    def write(file_path: Path):
+        offset = 0
+        with file_path.open("wb") as pack:
+            for path in paths:
+                for api_file in get_module_api_files(path=path, config=config):
+                    with api_file.open("rb") as content:
+                        shutil.copyfileobj(content, pack)
+                    length = pack.tell() - offset
+                    files[api_file.relative_to(out).as_posix()] = [offset, length]
+                    offset += length
+
+    written = write_if_changed(target_path=out / PACK_FILENAME, write=write)
+    index = {"pack": PACK_FILENAME, "files": files}
+    write_if_changed(
+        target_path=out / PACK_INDEX_FILENAME,
+        write=lambda file_path: file_path.write_text(
+            json.dumps(index, separators=(",", ":")), encoding="UTF8"
+        ),
+    )
+    return written
+
+
+class PackReader:
+    """
+    Reads the API files from a pack (see `Configuration.pack`), the pack file is memory mapped.
+
+    Example:
+    ```
+    with PackReader(folder=Path("docs/api")) as reader:
+        module = json.loads(reader.read("foo/bar.json"))
+    ```
+    """
+
+    def __init__(self, folder: Path):
+        """
+        Parameters:
+            folder: The folder including the pack (`Configuration.out` of the generation).
+        """
+        index = json.loads((folder / PACK_INDEX_FILENAME).read_text(encoding="UTF8"))
+        self.files: dict[str, list[int]] = index["files"]
+        """
+        `[offset, length]` of the API files, keyed by their path relative to the folder.
+        """
+        with (folder / index["pack"]).open("rb") as pack:
+            # An empty file can not be mapped.
+            self.mmap = (
+                mmap.mmap(pack.fileno(), 0, access=mmap.ACCESS_READ) if self.files else None
+            )
+
+    def read(self, file: str) -> bytes:
+        """
+        Parameters:
+            file: Path of the API file, relative to the pack's folder (*e.g.* `foo/bar.json`).
+
+        Returns:
+            The content of the API file.
+
+        Raises:
+            KeyError: If the file is not included in the pack.
+        """
+        offset, length = self.files[file]
+        return self.mmap[offset : offset + length]
+
+    def close(self):
+        if self.mmap:
+            self.mmap.close()
+
+    def __enter__(self) -> "PackReader":
+        return self
+
+    def __exit__(self, *_):
+        self.close()
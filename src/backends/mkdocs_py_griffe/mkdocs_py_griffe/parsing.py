@@ -0,0 +1,627 @@
+"""
+Conversion of griffe's AST into the API models.
+"""
+
+import dataclasses
+import functools
+from typing import Any, Iterator, Sequence
+
+from griffe.dataclasses import Attribute as AstAttribute
+from griffe.dataclasses import Class as AstClass
+from griffe.dataclasses import Decorator as AstDecorator
+from griffe.dataclasses import Docstring as AstDocstring
+from griffe.dataclasses import Function as AstFunction
+from griffe.dataclasses import Module as AstModule
+from griffe.dataclasses import Parameter as AstParameter
+from griffe.dataclasses import Parameters as AstParameters
+from griffe.docstrings.dataclasses import (DocstringSection,
+                                           DocstringSectionAdmonition,
+                                           DocstringSectionParameters,
+                                           DocstringSectionRaises,
+                                           DocstringSectionReturns,
+                                           DocstringSectionText)
+from griffe.expressions import Expr, ExprAttribute, ExprName
+
+from .links import (canonical_path, navigation_path, navigation_path_ast,
+                    replace_links)
+from .models import (Attribute, Callable, ChildModule, Code, Documentation,
+                     DocumentationSection, File, Module, Semantic, Type)
+from .project import Project
+from .symbols import is_leaf_module
+
+NO_SEMANTIC = Semantic(role="", labels=[], attributes={}, relations={})
+"""
+No semantic.
+"""
+
+
+MODULE_SEMANTIC = Semantic(role="module", labels=[], attributes={}, relations={})
+"""
+Semantic for global variables.
+"""
+
+
+GLOBAL_SEMANTIC = Semantic(role="global", labels=[], attributes={}, relations={})
+"""
+Semantic for global variables.
+"""
+
+
+FUNCTION_GLOBAL_SEMANTIC = Semantic(
+    role="function", labels=[], attributes={}, relations={}
+)
+"""
+Semantic for globals functions.
+"""
+
+
+CLASS_SEMANTIC = Semantic(role="class", labels=[], attributes={}, relations={})
+"""
+Semantic for class's attributes.
+"""
+
+
+ATTR_SEMANTIC = Semantic(role="attribute", labels=[], attributes={}, relations={})
+"""
+Semantic for class's attributes.
+"""
+
+
+METHOD_SEMANTIC = Semantic(role="method", labels=[], attributes={}, relations={})
+"""
+Semantic for class's method.
+"""
+
+
+def parse_module(ast: AstModule, project: Project) -> Module:
+    """
+    Transforms module documentation as provided by griffe to the mkdocs-ts models.
+
+    Parameters:
+        ast: Griffe's module documentation.
+        project: Project description.
+
+    Returns:
+        The parsed model.
+    """
+    elements = project.modules_tree[ast.canonical_path]
+    children_modules = [
+        *[parse_child_module(ast=m, project=project) for m in elements.modules],
+        *project.config.extra_modules.get(ast.canonical_path, []),
+    ]
+    classes = [
+        parse_class(ast=c, project=project) for c in elements.classes if c.has_docstring
+    ]
+    functions = [
+        parse_function(ast=f, semantic=FUNCTION_GLOBAL_SEMANTIC, project=project)
+        for f in elements.functions
+        if f.has_docstring
+    ]
+    attributes = [
+        parse_attribute(ast=a, semantic=GLOBAL_SEMANTIC, project=project)
+        for a in elements.attributes
+    ]
+    files = [format_file_doc(ast=f, project=project) for f in elements.files]
+    sections = get_docstring_sections(ast, project=project)
+
+    return Module(
+        name=ast.name,
+        documentation=format_detailed_docstring(
+            sections=sections, parent=ast, project=project
+        ),
+        semantic=MODULE_SEMANTIC,
+        path=canonical_path(ast=ast, project=project),
+        children=children_modules,
+        attributes=sorted(attributes, key=lambda m: m.name),
+        types=classes,
+        callables=functions,
+        files=files,
+    )
+
+
+def get_symbol_path(ast: AstClass | AstFunction | AstAttribute | AstModule) -> str:
+    path = ast.name
+    it = ast
+    while it.parent:
+        path = f"{it.parent.name}.{path}"
+        it = it.parent
+
+    return path
+
+
+def parse_child_module(ast: AstModule, project: Project) -> ChildModule:
+    """
+    Transforms submodule documentation as provided by griffe to the mkdocs-ts models.
+
+    Parameters:
+        ast: Griffe's module documentation.
+        project: Project description.
+
+    Returns:
+        The parsed model.
+    """
+    return ChildModule(
+        name=ast.name,
+        path=ast.canonical_path,
+        isLeaf=is_leaf_module(path=ast.canonical_path, project=project),
+    )
+
+
+def format_file_doc(ast: AstModule, project: Project) -> File:
+    """
+    Transforms a file documentation as provided by griffe to the mkdocs-ts models.
+
+    Parameters:
+        ast: Griffe's module documentation.
+        project: Project description.
+
+    Returns:
+        The parsed model.
+    """
+    return File(
+        name=ast.name,
+        path=str(ast.filepath.relative_to(project.root_ast.filepath.parent)),
+        documentation=format_detailed_docstring(
+            get_docstring_sections(ast, project=project), parent=ast, project=project
+        ),
+    )
+
+
+def parse_function(ast: AstFunction, semantic: Semantic, project: Project) -> Callable:
+    """
+    Transforms a function's documentation as provided by griffe to the mkdocs-ts models.
+
+    Parameters:
+        ast: Griffe's function documentation.
+        semantic: Target semantic
+        project: Project description.
+
+    Returns:
+        The parsed model.
+    """
+    parsed = get_docstring_sections(ast, project=project)
+    sections = [
+        p
+        for p in parsed
+        if isinstance(p, DocstringSectionText)
+        or (isinstance(p, DocstringSectionAdmonition) and p.title != "Return")
+    ]
+    formatted = format_detailed_docstring(sections, parent=ast, project=project)
+    params_doc = parse_parameters(ast=ast, parsed=parsed, project=project)
+    returns_doc = parse_returns(ast=ast, parsed=parsed, project=project)
+    raises_doc = parse_raises(ast=ast, parsed=parsed, project=project)
+
+    return Callable(
+        name=ast.name,
+        documentation=Documentation(
+            sections=[
+                s
+                for s in [*formatted.sections, returns_doc, params_doc, raises_doc]
+                if s
+            ]
+        ),
+        path=canonical_path(ast=ast, project=project),
+        code=parse_code(ast=ast, project=project),
+        semantic=semantic,
+    )
+
+
+def parse_class(ast: AstClass, project: Project) -> Type:
+    """
+    Transforms a class's documentation as provided by griffe to the mkdocs-ts models.
+
+    Parameters:
+        ast: Griffe's class documentation.
+        project: Project description.
+
+    Returns:
+        The parsed model.
+    """
+    bases = list(find_expr_names(ast.bases))
+    semantic = Semantic(
+        role="class",
+        labels=[],
+        attributes={},
+        relations={"inherits": [b.canonical_path for b in bases]},
+    )
+    return Type(
+        name=ast.name,
+        documentation=format_detailed_docstring(
+            sections=get_docstring_sections(ast, project=project),
+            parent=ast,
+            project=project,
+        ),
+        path=canonical_path(ast=ast, project=project),
+        semantic=semantic,
+        attributes=[
+            parse_attribute(ast=attr, semantic=ATTR_SEMANTIC, project=project)
+            for attr in ast.attributes.values()
+            if attr.docstring and not attr.inherited
+        ],
+        callables=[
+            parse_function(ast=f, semantic=METHOD_SEMANTIC, project=project)
+            for f in ast.functions.values()
+            if f and f.docstring
+        ],
+        code=parse_code(ast, project=project),
+    )
+
+
+def parse_parameters(
+    ast: AstFunction, parsed: list[DocstringSection], project: Project
+) -> DocumentationSection | None:
+    """
+    Transforms a function's parameter documentation as provided by griffe to the mkdocs-ts models.
+
+    Parameters:
+        ast: Griffe's function documentation.
+        parsed: parsed documentation using google style.
+        project: Project description.
+
+    Returns:
+        The parsed model.
+    """
+
+    params = next(
+        (p for p in parsed if isinstance(p, DocstringSectionParameters)), None
+    )
+
+    def format_param(e):
+        with_links = replace_links(
+            e.description, parent=ast.canonical_path, project=project
+        )
+        return f"*  **{e.name}**: {with_links}"
+
+    if not params:
+        return None
+
+    content = functools.reduce(
+        lambda acc, e: f"{acc}\n{format_param(e)}", params.value, ""
+    )
+    return DocumentationSection(
+        title="Arguments",
+        content=content,
+        contentType="Markdown",
+        semantic=Semantic(role="arguments", labels=[], attributes={}, relations={}),
+    )
+
+
+def parse_returns(
+    ast: AstFunction, parsed: list[DocstringSection], project: Project
+) -> DocumentationSection | None:
+    """
+    Transforms a function's returns documentation as provided by griffe to the mkdocs-ts models.
+
+    Parameters:
+        ast: Griffe's function documentation.
+        parsed: parsed documentation using google style.
+        project: Project description.
+
+    Returns:
+        The parsed model.
+    """
+
+    returns = next(
+        (p for p in parsed if isinstance(p, DocstringSectionReturns)),
+        None,
+    )
+    if returns:
+        try:
+            returns_doc = replace_links(
+                returns.value[0].description,
+                parent=ast.canonical_path,
+                project=project,
+            )
+            return DocumentationSection(
+                title="Returns",
+                content=returns_doc,
+                contentType="Markdown",
+                semantic=Semantic(
+                    role="returns", labels=[], attributes={}, relations={}
+                ),
+            )
+        except RuntimeError as e:
+            project.reporter.add_error(
+                ast.canonical_path,
+                f"Failed to parse return of function {ast.name}: {e}",
+            )
+
+    return None
+
+
+def parse_raises(
+    ast: AstFunction, parsed: list[DocstringSection], project: Project
+) -> DocumentationSection | None:
+    """
+    Transforms a function's raises documentation as provided by griffe to the mkdocs-ts models.
+
+    Parameters:
+        ast: Griffe's function documentation.
+        parsed: parsed documentation using google style.
+        project: Project description.
+
+    Returns:
+        The parsed model.
+    """
+
+    raises = next(
+        (p for p in parsed if isinstance(p, DocstringSectionRaises)),
+        None,
+    )
+    if raises:
+        try:
+
+            def format_raise(e):
+                with_links = replace_links(
+                    e.description, parent=ast.canonical_path, project=project
+                )
+                annotation = e.annotation
+                if isinstance(annotation, ExprAttribute):
+                    # Qualified exception, e.g. 'sqlite3.DatabaseError'.
+                    annotation = annotation.last
+                exception_nav = navigation_path(
+                    py_path=annotation.canonical_path,
+                    name=annotation.name,
+                    project=project,
+                )
+                return f"*  **<a target='_blank' href='{exception_nav}'>{annotation.name}</a>**: {with_links}"
+
+            content = functools.reduce(
+                lambda acc, e: f"{acc}\n{format_raise(e)}", raises.value, ""
+            )
+
+            return DocumentationSection(
+                title="Raises",
+                content=content,
+                contentType="Markdown",
+                semantic=Semantic(
+                    role="raises", labels=[], attributes={}, relations={}
+                ),
+            )
+        except RuntimeError as e:
+            project.reporter.add_error(
+                ast.canonical_path,
+                f"Failed to parse 'raises' of function {ast.name}: {e}",
+            )
+
+    return None
+
+
+def get_docstring_sections(
+    ast: AstClass | AstFunction | AstAttribute | AstModule, project: Project
+) -> list[DocstringSection]:
+    """
+    Parses the docstring of an entity using google style, through the docstrings cache if enabled.
+
+    Parameters:
+        ast: Griffe's entity documentation.
+        project: Project description.
+
+    Returns:
+        The parsed sections.
+    """
+    if not ast.docstring and not (
+        isinstance(ast, AstModule) and ast.filepath.parts[-1] != "__init__.py"
+    ):
+        # This should not normally happen because only symbols with docstring are reported.
+        # Except for files for which it is tolerated.
+        project.reporter.add_no_docstring(get_symbol_path(ast))
+
+    docstring_text = ast.docstring.value if ast.docstring else ""
+
+    docstring = AstDocstring(
+        docstring_text,
+        parent=ast,
+    )
+    if project.docstrings_cache:
+        return project.docstrings_cache.parse(docstring)
+    return docstring.parse("google")
+
+
+def format_detailed_docstring(
+    sections: Sequence[DocstringSection],
+    parent: AstFunction | AstClass | AstAttribute | AstModule,
+    project: Project,
+) -> Documentation:
+    def admonition(v: DocstringSectionAdmonition) -> DocumentationSection:
+        return DocumentationSection(
+            content=replace_links(
+                v.value.description, parent=parent.canonical_path, project=project
+            ),
+            contentType="Markdown",
+            semantic=Semantic(
+                role="admonition",
+                labels=[],
+                attributes={
+                    "tag": (
+                        v.value.annotation
+                        if isinstance(v.value.annotation, str)
+                        else None
+                    )
+                },
+                relations={},
+            ),
+            title=v.title,
+        )
+
+    def text(v: DocstringSectionText) -> DocumentationSection:
+        return DocumentationSection(
+            content=replace_links(
+                v.value, parent=parent.canonical_path, project=project
+            ),
+            contentType="Markdown",
+            semantic=Semantic(role="text", labels=[], attributes={}, relations={}),
+            title=v.title,
+        )
+
+    def factory(v: DocstringSection):
+        if isinstance(v, DocstringSectionAdmonition):
+            return admonition(v)
+        if isinstance(v, DocstringSectionText):
+            return text(v)
+        return None
+
+    formatted = [factory(s) for s in sections]
+    return Documentation(sections=[s for s in formatted if s])
+
+
+def parse_attribute(
+    ast: AstAttribute, semantic: Semantic, project: Project
+) -> Attribute:
+    """
+    Transforms an attribute's documentation as provided by griffe to the mkdocs-ts models.
+
+    Parameters:
+        ast: Griffe's module documentation.
+        semantic: Target semantic.
+        project: Project description.
+
+    Returns:
+        The parsed model.
+    """
+    sections = get_docstring_sections(ast, project=project)
+    documentation = format_detailed_docstring(
+        sections=sections, parent=ast, project=project
+    )
+    return Attribute(
+        name=ast.name,
+        semantic=semantic,
+        documentation=documentation,
+        path=canonical_path(ast=ast, project=project),
+        code=parse_code(ast=ast, project=project),
+    )
+
+
+def extract_function_declaration(
+    function_str,
+):
+    def_index = function_str.find("def")
+    no_decorator = function_str[def_index:]
+    close_parenthesis_index = no_decorator.find(")")
+    remaining = no_decorator[close_parenthesis_index:]
+    end_index = remaining.find(":")
+    return function_str[0 : def_index + close_parenthesis_index + end_index]
+
+
+def extract_class_declaration(class_str):
+    index_doc_start = class_str.find('"""')
+    return class_str[0:index_doc_start].rstrip()[0:-1]
+
+
+def parse_code(ast: AstClass | AstFunction | AstAttribute, project: Project) -> Code:
+    """
+    Transforms a code's documentation from class, function or attribute provided by griffe to the mkdocs-ts models.
+
+    Parameters:
+        ast: Griffe's module documentation.
+        project: Project description.
+
+    Returns:
+        The parsed model.
+    """
+
+    def nav_path(e: ExprName | AstClass | AstFunction):
+        return navigation_path_ast(ast=e, project=project)
+
+    file_path = str(ast.filepath.relative_to(project.root_ast.filepath.parent))
+    references = {}
+    implementation = None
+    declaration = ""
+    if isinstance(ast, AstAttribute):
+        types_annotation = list(find_expr_names(ast.annotation))
+        types_value = list(find_expr_names(ast.value))
+        declaration = functools.reduce(lambda acc, e: f"{acc}\n{e}", ast.lines)
+        implementation = None
+        references = {e.name: nav_path(e=e) for e in [*types_annotation, *types_value]}
+
+    if isinstance(ast, AstFunction):
+        types_annotation = list(find_expr_names(ast.annotation))
+        returns_annotation = list(find_expr_names(ast.returns))
+        parameters_annotation = list(find_expr_names(ast.parameters))
+        all_annotations = [
+            *types_annotation,
+            *returns_annotation,
+            *parameters_annotation,
+        ]
+        implementation = "\n".join(ast.lines)
+        declaration = extract_function_declaration(implementation)
+        references = {
+            **{e.name: nav_path(e=e) for e in all_annotations},
+            ast.name: nav_path(e=ast),
+        }
+
+    if isinstance(ast, AstClass):
+        decorators_annotation = list(find_expr_names(ast.decorators))
+        bases_annotation = list(find_expr_names(ast.bases))
+        all_annotations = [
+            *decorators_annotation,
+            *bases_annotation,
+        ]
+        implementation = "\n".join(ast.lines)
+        declaration = extract_class_declaration(implementation)
+        references = {
+            **{e.name: nav_path(e=e) for e in all_annotations},
+            ast.name: nav_path(e=ast),
+        }
+
+    return Code(
+        filePath=file_path,
+        startLine=ast.lineno,
+        endLine=ast.endlineno,
+        declaration=declaration,
+        implementation=(
+            None if project.config.implementations == "none" else implementation
+        ),
+        references=references,
+    )
+
+
+@functools.cache
+def dataclass_fields(dataclass_type: type) -> tuple[str, ...]:
+    """
+    Lists the fields names of a dataclass, cached per type for :func:`mkdocs_py_griffe.parsing.find_expr_names`.
+
+    Parameters:
+        dataclass_type: Dataclass type.
+
+    Returns:
+        The fields names, in declaration order.
+    """
+    return tuple(f.name for f in dataclasses.fields(dataclass_type))
+
+
+def find_expr_names(ast: Any) -> Iterator[ExprName]:
+    """
+    Lazily yields the names referenced within a griffe expression, a function's parameters, or a list of decorators.
+
+    Contrary to a reflection based search, the traversal only follows the structure of griffe's `Expr*`
+    dataclasses, `Parameters`, `Parameter` and `Decorator` (as well as lists and tuples of them): resolved objects
+    are never crawled. Nodes are visited once (identity based), depth-first in source order.
+
+    Parameters:
+        ast: Griffe's expression or expressions container; `None` and strings are ignored.
+
+    Returns:
+        Generator over the names found.
+    """
+    visited: set[int] = set()
+    stack = [ast]
+    while stack:
+        current = stack.pop()
+        if current is None or isinstance(current, str) or id(current) in visited:
+            continue
+        visited.add(id(current))
+        if isinstance(current, ExprName):
+            yield current
+            continue
+        if isinstance(current, Expr):
+            children = [getattr(current, field) for field in dataclass_fields(type(current))]
+        elif isinstance(current, (list, tuple, AstParameters)):
+            children = list(current)
+        elif isinstance(current, AstParameter):
+            children = [current.annotation, current.default]
+        elif isinstance(current, AstDecorator):
+            children = [current.value]
+        else:
+            continue
+        stack.extend(reversed(children))
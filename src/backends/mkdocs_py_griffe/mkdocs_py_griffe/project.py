@@ -0,0 +1,297 @@
+"""
+Description of the documented project and state of a generation (links resolution cache, diagnostics).
+"""
+
+import pprint
+from collections import abc, defaultdict
+from typing import Any, Hashable, NamedTuple
+
+from griffe.dataclasses import Attribute as AstAttribute
+from griffe.dataclasses import Class as AstClass
+from griffe.dataclasses import Function as AstFunction
+from griffe.dataclasses import Module as AstModule
+
+from .configuration import Configuration
+from .docstrings_cache import DocstringsCache
+from .indexes import PrefixRules, SuffixIndex, SymbolRef
+from .inventories import SphinxInventory, SymbolInventory
+
+
+class ModuleElements(NamedTuple):
+    """
+    Classified elements of a module.
+    Initialized from the function :func:`mkdocs_py_griffe.symbols.extract_module`.
+    """
+
+    modules: list[AstModule]
+    """
+    Documented sub-modules.
+    """
+    files: list[AstModule]
+    """
+    Files.
+    """
+    classes: list[AstClass]
+    """
+    Documented classes.
+    """
+    functions: list[AstFunction]
+    """
+    Documented functions.
+    """
+    attributes: list[AstAttribute]
+    """
+    Documented attributes.
+    """
+    is_leaf: bool
+    """
+    Whether the module has no documented sub-modules.
+    """
+
+
+ModulesTree = dict[str, ModuleElements]
+"""
+Index of the documented modules: canonical path => classified elements.
+Initialized from the function :func:`mkdocs_py_griffe.symbols.init_modules_tree`.
+"""
+
+
+class ResolutionCache:
+    """
+    Run-wide memoization of links resolution, owned by :class:`mkdocs_py_griffe.project.Project`.
+
+    Entries are grouped by category (*e.g.* `navigation_path` keyed by canonical path, `cross_link` keyed by
+    sphinx tag and path), hits and misses are counted per category.
+    """
+
+    def __init__(self):
+        self.entries: dict[str, dict[Hashable, Any]] = defaultdict(dict)
+        self.hits: dict[str, int] = defaultdict(int)
+        self.misses: dict[str, int] = defaultdict(int)
+        self.dependencies: set[tuple[str, Hashable]] | None = None
+        """
+        When not `None`, collects the `(category, key)` of the tracked entries requested.
+        """
+
+    def get(
+        self,
+        category: str,
+        key: Hashable,
+        compute: abc.Callable[[], Any],
+        tracked: bool = True,
+    ) -> Any:
+        """
+        Retrieves a cached value, computing it on the first request.
+
+        Parameters:
+            category: Category of the entry.
+            key: Key of the entry within the category.
+            compute: Computes the value when not cached, it is called once per key.
+            tracked: Whether to include the entry in the `dependencies` (when collected).
+                Only entries whose key and value are stable from one run to another should be tracked.
+
+        Returns:
+            The value.
+        """
+        if tracked and self.dependencies is not None:
+            self.dependencies.add((category, key))
+        cache = self.entries[category]
+        if key in cache:
+            self.hits[category] += 1
+            return cache[key]
+        self.misses[category] += 1
+        value = compute()
+        cache[key] = value
+        return value
+
+    def hit_rates(self) -> dict[str, str]:
+        """
+        Returns:
+            Hit rates (formatted) per category.
+        """
+        return {
+            category: f"{100 * self.hits[category] / (self.hits[category] + self.misses[category]):.1f}% "
+            f"({self.hits[category]} hits, {self.misses[category]} misses)"
+            for category in {**self.hits, **self.misses}
+        }
+
+    def add_counts(self, hits: dict[str, int], misses: dict[str, int]):
+        """
+        Adds hits and misses counted elsewhere (*e.g.* by the copy of the cache in a worker process).
+
+        Parameters:
+            hits: Hits per category.
+            misses: Misses per category.
+        """
+        for category, count in hits.items():
+            self.hits[category] += count
+        for category, count in misses.items():
+            self.misses[category] += count
+
+
+class DocReporter:
+    """
+    Gathers the diagnostics of an API generation, owned by :class:`mkdocs_py_griffe.project.Project`.
+
+    Partial reports (*e.g.* from worker processes) can be combined using
+    :meth:`mkdocs_py_griffe.project.DocReporter.merge`.
+    """
+
+    def __init__(self):
+        self.errors: dict[str, set[str]] = defaultdict(set)
+        self.external_cross_ref_errors: set[str] = set()
+        self.internal_cross_ref_errors: set[str] = set()
+        self.no_docstrings_errors: set[str] = set()
+        self.sphinx_tag_unknown: set[str] = set()
+        self.sphinx_links_unresolved: dict[str, list[str]] = {}
+        self.stats: dict[str, Any] = {}
+
+    def add_error(self, symbol_path: str, description: str):
+        self.errors[symbol_path].add(description)
+
+    def add_external_cross_ref_error(self, symbol_path: str):
+        self.external_cross_ref_errors.add(symbol_path)
+
+    def add_internal_cross_ref_error(self, symbol_path: str):
+        self.internal_cross_ref_errors.add(symbol_path)
+
+    def add_no_docstring(self, symbol_path: str):
+        self.no_docstrings_errors.add(symbol_path)
+
+    def add_sphinx_tag_unknown(self, parent: str, tag: str):
+        self.sphinx_tag_unknown.add(f"[{parent}] => `{tag}` unknown")
+
+    def add_sphinx_link_unresolved(self, parent: str, link: str, candidates: list[str]):
+        self.sphinx_links_unresolved[f"{parent}=>{link}"] = candidates
+
+    def add_stat(self, name: str, value: Any):
+        self.stats[name] = value
+
+    def merge(self, other: "DocReporter") -> "DocReporter":
+        """
+        Merges the diagnostics of another reporter into this one.
+
+        Parameters:
+            other: The other reporter.
+
+        Returns:
+            This reporter.
+        """
+        for symbol_path, descriptions in other.errors.items():
+            self.errors[symbol_path].update(descriptions)
+        self.external_cross_ref_errors.update(other.external_cross_ref_errors)
+        self.internal_cross_ref_errors.update(other.internal_cross_ref_errors)
+        self.no_docstrings_errors.update(other.no_docstrings_errors)
+        self.sphinx_tag_unknown.update(other.sphinx_tag_unknown)
+        self.sphinx_links_unresolved.update(other.sphinx_links_unresolved)
+        self.stats.update(other.stats)
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """
+        Returns:
+            JSON serializable representation of the diagnostics (stats excluded).
+        """
+        return {
+            "errors": {k: sorted(v) for k, v in self.errors.items()},
+            "external_cross_ref_errors": sorted(self.external_cross_ref_errors),
+            "internal_cross_ref_errors": sorted(self.internal_cross_ref_errors),
+            "no_docstrings_errors": sorted(self.no_docstrings_errors),
+            "sphinx_tag_unknown": sorted(self.sphinx_tag_unknown),
+            "sphinx_links_unresolved": self.sphinx_links_unresolved,
+        }
+
+    @staticmethod
+    def from_json(data: dict[str, Any]) -> "DocReporter":
+        """
+        Parameters:
+            data: Representation returned by :meth:`mkdocs_py_griffe.project.DocReporter.to_json`.
+
+        Returns:
+            The reporter.
+        """
+        reporter = DocReporter()
+        for symbol_path, descriptions in data["errors"].items():
+            reporter.errors[symbol_path].update(descriptions)
+        reporter.external_cross_ref_errors.update(data["external_cross_ref_errors"])
+        reporter.internal_cross_ref_errors.update(data["internal_cross_ref_errors"])
+        reporter.no_docstrings_errors.update(data["no_docstrings_errors"])
+        reporter.sphinx_tag_unknown.update(data["sphinx_tag_unknown"])
+        reporter.sphinx_links_unresolved.update(data["sphinx_links_unresolved"])
+        return reporter
+
+    def print_summary(self):
+        """
+        Prints the summary of the diagnostics in the console.
+        """
+        print(f"Internal cross links errors ({len(self.internal_cross_ref_errors)}):")
+        pprint.pprint(self.internal_cross_ref_errors)
+        print(f"External cross links errors  ({len(self.external_cross_ref_errors)}):")
+        pprint.pprint(self.external_cross_ref_errors)
+        print(f"No docstring errors ({len(self.no_docstrings_errors)}):")
+        pprint.pprint(self.no_docstrings_errors)
+        print(f"Sphinx cross-link tag unknown ({len(self.sphinx_tag_unknown)}):")
+        pprint.pprint(self.sphinx_tag_unknown)
+        print(
+            f"Sphinx cross-link unresolved ({len(self.sphinx_links_unresolved.keys())}):"
+        )
+        pprint.pprint(self.sphinx_links_unresolved)
+        for name, value in self.stats.items():
+            print(f"{name}:")
+            pprint.pprint(value)
+
+
+# pylint: disable=dangerous-default-value
+class Project(NamedTuple):
+    """
+    Represents the project, holding global symbols.
+    """
+
+    config: Configuration
+    """
+    The configuration.
+    """
+    root_ast: AstModule
+    """
+    The root AST from griffe of the documented module.
+    """
+    all_symbols: dict[str, SymbolRef]
+    """
+    The list of all symbols defined in the documented module.
+    """
+    symbols_index: SuffixIndex
+    """
+    Suffix index over the keys of `all_symbols`, used to suggest candidates for unresolved cross links.
+    """
+    all_aliases: dict[str, str]
+    """
+    The list of aliases defined in the documented module (from the library).
+    """
+    modules_tree: ModulesTree
+    """
+    Classified elements of the documented modules.
+    """
+    resolution_cache: ResolutionCache
+    """
+    Memoization of links resolution for the run.
+    """
+    reporter: DocReporter
+    """
+    Diagnostics of the run.
+    """
+    docstrings_cache: DocstringsCache | None = None
+    """
+    Persistent cache of the parsed docstrings, if enabled (see `Configuration.docstrings_cache`).
+    """
+    sphinx_inventories: list[SphinxInventory] = []
+    """
+    Sphinx inventories providing external links, see `Configuration.sphinx_inventories`.
+    """
+    cross_linked_inventories: dict[str, "SymbolInventory"] = {}
+    """
+    Symbols inventories of the cross-linked packages, see `Configuration.cross_linked_inventories`.
+    """
+    external_link_rules: PrefixRules = PrefixRules({})
+    """
+    Rules providing external links, see `Configuration.external_link_rules`.
+    """
@@ -0,0 +1,145 @@
+"""
+Rendering of the API files of the modules, possibly within worker processes.
+"""
+
+import multiprocessing
+from collections import abc
+from concurrent.futures import ProcessPoolExecutor
+from typing import Hashable, NamedTuple, cast
+
+from .parsing import parse_module
+from .project import DocReporter, Project
+from .search import SearchEntry, search_entries
+from .symbols import get_module_ast
+from .writers import write_module_api
+
+
+class ModuleRun(NamedTuple):
+    """
+    Outcome of the rendering of a module, see :func:`mkdocs_py_griffe.rendering.render_module_api`.
+    """
+
+    reporter: DocReporter
+    """
+    Diagnostics of the module.
+    """
+    dependencies: list[tuple[str, Hashable]]
+    """
+    The `(category, key)` of the links resolutions requested to render the module.
+    """
+    hits: dict[str, int]
+    """
+    Resolution cache hits while rendering the module.
+    """
+    misses: dict[str, int]
+    """
+    Resolution cache misses while rendering the module.
+    """
+    written: bool
+    """
+    Whether the API file has been written (*i.e.* its content changed).
+    """
+    docstrings_cache: tuple[int, int]
+    """
+    Docstrings cache hits and misses while rendering the module.
+    """
+    search: list[SearchEntry]
+    """
+    Entries of the module's entities in the search index (if `Configuration.search_index` is enabled).
+    """
+
+
+def render_module_api(path: str, project: Project) -> ModuleRun:
+    """
+    Renders and writes a module's API file, collecting its diagnostics and dependencies.
+
+    Parameters:
+        path: Canonical path of the module.
+        project: Project description.
+
+    Returns:
+        The outcome.
+    """
+    project = project._replace(reporter=DocReporter())
+    cache = project.resolution_cache
+    hits, misses = dict(cache.hits), dict(cache.misses)
+    docstrings_cache = project.docstrings_cache
+    docstrings_counts = (
+        (docstrings_cache.hits, docstrings_cache.misses) if docstrings_cache else (0, 0)
+    )
+    cache.dependencies = set()
+    doc = parse_module(get_module_ast(path=path, project=project), project=project)
+    written = write_module_api(doc=doc, path=path, project=project)
+    search = search_entries(doc=doc, project=project) if project.config.search_index else []
+    if docstrings_cache:
+        docstrings_cache.flush()
+        docstrings_counts = (
+            docstrings_cache.hits - docstrings_counts[0],
+            docstrings_cache.misses - docstrings_counts[1],
+        )
+    run = ModuleRun(
+        reporter=project.reporter,
+        dependencies=sorted(cache.dependencies),
+        hits={k: v - hits.get(k, 0) for k, v in cache.hits.items()},
+        misses={k: v - misses.get(k, 0) for k, v in cache.misses.items()},
+        written=written,
+        docstrings_cache=docstrings_counts,
+        search=search,
+    )
+    cache.dependencies = None
+    return run
+
+
+WORKER_PROJECT: Project | None = None
+"""
+The project within a worker process of :func:`mkdocs_py_griffe.rendering.render_modules`.
+"""
+
+
+def init_worker(project: Project):
+    # The project is inherited from the parent process (fork), it is not pickled.
+    global WORKER_PROJECT  # pylint: disable=global-statement
+    WORKER_PROJECT = project
+
+
+def render_module_api_in_worker(path: str) -> ModuleRun:
+    return render_module_api(path=path, project=cast(Project, WORKER_PROJECT))
+
+
+def render_modules(
+    paths: list[str], project: Project, on_rendered: abc.Callable[[str], None]
+) -> dict[str, ModuleRun]:
+    """
+    Renders the API files of modules, in parallel worker processes if `Configuration.jobs` is greater than 1
+    (and the platform supports forking).
+
+    The resolution and docstrings caches statistics of the workers are added to the ones of the project.
+
+    Parameters:
+        paths: Canonical paths of the modules.
+        project: Project description.
+        on_rendered: Called with the path of each module once its API file is written, in the order of `paths`.
+
+    Returns:
+        The outcomes by module's path.
+    """
+    runs: dict[str, ModuleRun] = {}
+    config = project.config
+    if config.jobs > 1 and "fork" in multiprocessing.get_all_start_methods():
+        with ProcessPoolExecutor(
+            max_workers=config.jobs,
+            mp_context=multiprocessing.get_context("fork"),
+            initializer=init_worker,
+            initargs=(project,),
+        ) as executor:
+            for path, run in zip(paths, executor.map(render_module_api_in_worker, paths)):
+                runs[path] = run
+                project.resolution_cache.add_counts(hits=run.hits, misses=run.misses)
+                if project.docstrings_cache:
+                    project.docstrings_cache.add_counts(*run.docstrings_cache)
+                on_rendered(path)
+    else:
+        for path in paths:
+            runs[path] = render_module_api(path=path, project=project)
+            on_rendered(path)
+    return runs
@@ -0,0 +1,226 @@
+"""
+Search index of the documented entities, see `Configuration.search_index`.
+"""
+
+import re
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from .configuration import Configuration
+from .models import Entity, Module, SearchDocument
+from .project import Project
+from .writers import remove_stale_files, write_api_file
+
+SEARCH_INDEX_VERSION = 2
+"""
+Version of the search index's format, see :func:`mkdocs_py_griffe.search.write_search_index`.
+"""
+
+
+SEARCH_PREFIX_LENGTH = 2
+"""
+Length of the terms' prefixes used to shard the search index.
+"""
+
+
+SEARCH_DOCUMENTS_CHUNK_SIZE = 256
+"""
+Number of documents per file of the search index.
+"""
+
+
+SEARCH_STOP_WORDS = frozenset(
+    "a an and are as at be by for from has if in into is it its of on or that the this to was were will with"
+    .split()
+)
+"""
+Words not indexed, they are provided to the frontend within the index to tokenize the queries the same way.
+"""
+
+
+SEARCH_WORD = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+"""
+Words of the texts indexed (including identifiers).
+"""
+
+
+SEARCH_WORD_PART = re.compile(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+|[0-9]+")
+"""
+Parts of the words (*e.g.* `get`, `Module` and `Path` for `getModulePath` or `get_Module_path`).
+"""
+
+
+class SearchEntry(NamedTuple):
+    """
+    An entity of the search index, see :func:`mkdocs_py_griffe.search.search_entries`.
+    """
+
+    document: SearchDocument
+    """
+    The document returned by the searches.
+    """
+    terms: dict[str, int]
+    """
+    The weights of the entity's terms.
+    """
+
+
+def search_terms(text: str) -> list[str]:
+    """
+    Parameters:
+        text: A text.
+
+    Returns:
+        The terms of the text: its lower-cased words (including identifiers), each followed by its parts if any
+        (*e.g.* `get_module_path`, `get`, `module` and `path` for `get_module_path`). Terms of one character, of
+        more than 64 characters, or in :glob:`mkdocs_py_griffe.search.SEARCH_STOP_WORDS` are excluded.
+
+        The function `searchTerms` of the frontend follows the same rules.
+    """
+    terms = []
+    for word in SEARCH_WORD.findall(text):
+        parts = SEARCH_WORD_PART.findall(word)
+        for term in dict.fromkeys([word, *parts] if len(parts) > 1 else [word]):
+            term = term.lower().strip("_")
+            if 1 < len(term) <= 64 and term not in SEARCH_STOP_WORDS:
+                terms.append(term)
+    return terms
+
+
+def search_entries(doc: Module, project: Project) -> list[SearchEntry]:
+    """
+    Computes the entries of the search index for a module and its entities (types with their members, callables,
+    attributes).
+
+    The terms of the names are weighted 8, those of the paths 2, and those of the documentations 1 (per
+    occurrence, with a maximum of 4).
+
+    Parameters:
+        doc: The module's model.
+        project: Project description.
+
+    Returns:
+        The entries.
+    """
+
+    def entry(entity: Entity | Module) -> SearchEntry:
+        terms: dict[str, int] = defaultdict(int)
+        text_counts: dict[str, int] = defaultdict(int)
+        for section in entity.documentation.sections:
+            for term in search_terms(section.content):
+                text_counts[term] += 1
+        for term, count in text_counts.items():
+            terms[term] += min(count, 4)
+        for term in set(search_terms(entity.path.replace(".", " "))):
+            terms[term] += 2
+        for term in set(search_terms(entity.name)):
+            terms[term] += 8
+        symbol = project.all_symbols.get(entity.path)
+        content = next((s.content for s in entity.documentation.sections if s.content), "")
+        lines = content.strip().splitlines()
+        return SearchEntry(
+            document=SearchDocument(
+                name=entity.name,
+                path=entity.path,
+                role=entity.semantic.role,
+                url=(
+                    f"@nav{project.config.base_nav}/{symbol.navigation_path}"
+                    if symbol
+                    else None
+                ),
+                summary=lines[0].strip() if lines else "",
+            ),
+            terms=dict(terms),
+        )
+
+    entities: list[Entity | Module] = [doc]
+    for t in doc.types:
+        entities.extend([t, *t.callables, *t.attributes])
+    entities.extend([*doc.callables, *doc.attributes])
+    return [entry(e) for e in entities]
+
+
+def get_search_folder(config: Configuration) -> Path:
+    return Path(config.out) / "search"
+
+
+def write_search_index(entries: list[SearchEntry], config: Configuration) -> list[Path]:
+    """
+    Writes the search index (in the folder `search` of `Configuration.out`), it includes:
+    *  `index.json`: the description of the index, *e.g.*:
+       ```
+       {
+           "version": 2,
+           "prefixLength": 2,
+           "stopWords": ["a", "an", "and"],
+           "documentsChunkSize": 256,
+           "documentsCount": 1250,
+           "shards": ["ab", "ac", "ad"]
+       }
+       ```
+    *  `terms/{prefix}.json`: the terms starting with `prefix` (sorted, to look up prefixes by binary search), and
+       for each term its postings: the flattened pairs `documentId, weight` sorted by decreasing weights.
+    *  `documents/{i}.json`: the documents `i * documentsChunkSize` to `(i + 1) * documentsChunkSize` (excluded),
+       see :class:`mkdocs_py_griffe.models.SearchDocument`.
+
+    Files are written without whitespaces, only if their content changed; the files not written anymore are
+    removed.
+
+    Parameters:
+        entries: The entries of the index, their position defines the documents' ids.
+        config: Configuration.
+
+    Returns:
+        The paths of the index's files.
+    """
+    folder = get_search_folder(config=config)
+    postings: dict[str, list[tuple[int, int]]] = defaultdict(list)
+    for document_id, entry in enumerate(entries):
+        for term, weight in entry.terms.items():
+            postings[term].append((document_id, weight))
+    shards: dict[str, list[str]] = defaultdict(list)
+    for term in sorted(postings):
+        shards[term[:SEARCH_PREFIX_LENGTH]].append(term)
+
+    files: list[Path] = []
+    # The index is only read by programs, whitespaces would mostly increase the size of the postings.
+    compact_config = config._replace(compact_json=True)
+
+    def write(file_path: Path, content: Any):
+        write_api_file(target_path=file_path, content=content, config=compact_config)
+        files.append(file_path)
+
+    for prefix, terms in shards.items():
+        write(
+            folder / "terms" / f"{prefix}.json",
+            {
+                "terms": terms,
+                "postings": [
+                    [
+                        value
+                        for posting in sorted(postings[term], key=lambda p: (-p[1], p[0]))
+                        for value in posting
+                    ]
+                    for term in terms
+                ],
+            },
+        )
+    for i in range(0, len(entries), SEARCH_DOCUMENTS_CHUNK_SIZE):
+        write(
+            folder / "documents" / f"{i // SEARCH_DOCUMENTS_CHUNK_SIZE}.json",
+            [e.document for e in entries[i : i + SEARCH_DOCUMENTS_CHUNK_SIZE]],
+        )
+    write(
+        folder / "index.json",
+        {
+            "version": SEARCH_INDEX_VERSION,
+            "prefixLength": SEARCH_PREFIX_LENGTH,
+            "stopWords": sorted(SEARCH_STOP_WORDS),
+            "documentsChunkSize": SEARCH_DOCUMENTS_CHUNK_SIZE,
+            "documentsCount": len(entries),
+            "shards": list(shards),
+        },
+    )
+    remove_stale_files(folder=folder, kept=files)
+    return files
@@ -67,5 +67,6 @@ def std_links() -> dict[str, str]:
         "time": "https://docs.python.org/3/library/time.html",
         "time.time": "https://docs.python.org/3/library/time.html#time.time",
         "watchdog.events.FileSystemEvent": "https://pythonhosted.org/watchdog/api.html#watchdog.events.FileSystemEvent",
+        # pylint: disable-next=line-too-long
         "watchdog.events.PatternMatchingEventHandler": "https://pythonhosted.org/watchdog/api.html#watchdog.events.PatternMatchingEventHandler",
     }
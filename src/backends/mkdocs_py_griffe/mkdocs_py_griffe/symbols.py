@@ -0,0 +1,316 @@
+"""
+Exploration of the documented modules: modules tree, exported symbols and aliases.
+"""
+
+import functools
+from pathlib import PosixPath
+from typing import Any, Iterator, NamedTuple, cast
+
+import griffe
+from griffe.dataclasses import Alias as AstAlias
+from griffe.dataclasses import Attribute as AstAttribute
+from griffe.dataclasses import Class as AstClass
+from griffe.dataclasses import Function as AstFunction
+from griffe.dataclasses import Module as AstModule
+from griffe.enumerations import Kind
+from griffe.exceptions import AliasResolutionError
+
+from .indexes import SymbolKind, SymbolRef
+from .project import ModuleElements, ModulesTree, Project
+
+INIT_FILENAME = "__init__.py"
+"""
+The '__init__.py' filename to recognize module.
+"""
+
+
+def extract_module(ast: AstModule) -> ModuleElements:
+    """
+    Classifies the documented elements of a module: its children modules (documented packages), and the
+    classes, functions and attributes of its files.
+
+    Parameters:
+        ast: Module's AST.
+
+    Returns:
+        The module's elements.
+    """
+    no_alias = {
+        k: v
+        for k, v in ast.modules.items()
+        if not isinstance(v, griffe.dataclasses.Alias)
+    }
+
+    modules = [
+        v
+        for k, v in no_alias.items()
+        if isinstance(v.filepath, PosixPath)
+        and v.filepath.name == INIT_FILENAME
+        and v.docstring
+    ]
+
+    files = [v for k, v in no_alias.items() if k not in modules]
+    classes = [
+        c
+        for v in files
+        for c in v.classes.values()
+        if isinstance(c, AstClass) and c.docstring
+    ]
+    functions = [
+        f
+        for v in files
+        for f in v.functions.values()
+        if isinstance(f, AstFunction) and f.docstring
+    ]
+    attributes = [
+        a
+        for v in files
+        for a in v.attributes.values()
+        if isinstance(a, AstAttribute) and a.docstring
+    ]
+    return ModuleElements(
+        modules=modules,
+        files=files,
+        classes=classes,
+        functions=functions,
+        attributes=attributes,
+        is_leaf=len(modules) == 0,
+    )
+
+
+def init_modules_tree(root_ast: AstModule) -> ModulesTree:
+    """
+    Classifies, in a single pass, the elements of all the documented modules within the provided AST.
+
+    Parameters:
+        root_ast: Root module's AST.
+
+    Returns:
+        The modules' index.
+    """
+    tree: ModulesTree = {}
+    stack = [root_ast]
+    while stack:
+        ast = stack.pop()
+        elements = extract_module(ast=ast)
+        tree[ast.canonical_path] = elements
+        stack.extend(reversed(elements.modules))
+    return tree
+
+
+def is_leaf_module(path: str, project: Project) -> bool:
+    return project.modules_tree[path].is_leaf
+
+
+def iter_symbols(
+    root_ast: AstModule, modules_tree: ModulesTree | None = None
+) -> Iterator[tuple[str, SymbolRef]]:
+    """
+    Look up for all the symbols within the provided AST.
+
+    Modules are traversed depth first using an explicit stack: the depth of the hierarchy is not limited.
+
+    Parameters:
+        root_ast: Root module's AST.
+        modules_tree: Modules' index, computed from `root_ast` if not provided.
+
+    Returns:
+        Generator over the pairs `canonical path`, :class:`mkdocs_py_griffe.indexes.SymbolRef`.
+    """
+
+    def get_canonical_path(p: str):
+        return p.replace(f"{root_ast.name}.", "")
+
+    def get_symbol(
+        ast: AstClass | AstFunction | AstAttribute | AstModule, from_class: bool
+    ) -> tuple[str, SymbolRef]:
+        base = get_canonical_path(ast.canonical_path)
+        index = {
+            Kind.MODULE: 1,
+            Kind.ATTRIBUTE: 3 if from_class else 2,
+            Kind.FUNCTION: 3 if from_class else 2,
+            Kind.CLASS: 2,
+        }[ast.kind]
+        kind = {
+            Kind.MODULE: "module",
+            Kind.ATTRIBUTE: "property" if from_class else "attribute",
+            Kind.FUNCTION: "method" if from_class else "function",
+            Kind.CLASS: "class",
+        }[ast.kind]
+        parts = base.split(".")
+        module_path = "/".join(parts[0:-index])
+        remaining = ".".join(parts[-index:])
+        return base, SymbolRef(
+            navigation_path=f"{module_path}.{remaining}",
+            kind=cast(SymbolKind, kind),
+        )
+
+    tree = modules_tree or init_modules_tree(root_ast=root_ast)
+    stack = [root_ast]
+    while stack:
+        ast = stack.pop()
+        elements = tree[ast.canonical_path]
+        yield get_symbol(ast, from_class=False)
+        for f in elements.functions:
+            yield get_symbol(f, from_class=False)
+        for a in elements.attributes:
+            yield get_symbol(a, from_class=False)
+        for c in elements.classes:
+            yield get_symbol(c, from_class=False)
+        for c in elements.classes:
+            for m in c.functions.values():
+                yield get_symbol(m, from_class=True)
+        for c in elements.classes:
+            for p in c.attributes.values():
+                yield get_symbol(p, from_class=True)
+        stack.extend(reversed(elements.modules))
+
+
+def init_symbols(
+    root_ast: AstModule, modules_tree: ModulesTree | None = None
+) -> dict[str, SymbolRef]:
+    """
+    Look up for all the symbols within the provided AST, see :func:`mkdocs_py_griffe.symbols.iter_symbols`.
+
+    Parameters:
+        root_ast: Root module's AST.
+        modules_tree: Modules' index, computed from `root_ast` if not provided.
+
+    Returns:
+        A dictionary `canonical path` => :class:`mkdocs_py_griffe.indexes.SymbolRef`.
+    """
+    return dict(iter_symbols(root_ast=root_ast, modules_tree=modules_tree))
+
+
+class WildcardChain(NamedTuple):
+    """
+    Linked list of the modules re-exporting (using `from x import *`) the entities processed by
+    :func:`mkdocs_py_griffe.symbols.init_aliases`, the latest first.
+
+    Nested levels of wildcard imports share the tail of the chain rather than copying it.
+    """
+
+    module: str
+    """
+    Canonical path of the re-exporting module.
+    """
+    parent: "WildcardChain | None"
+    """
+    Chain of the re-exporting modules of `module`.
+    """
+
+
+def wildcard_chain_modules(chain: WildcardChain | None) -> list[str]:
+    modules = []
+    while chain:
+        modules.append(chain.module)
+        chain = chain.parent
+    return modules[::-1]
+
+
+def init_aliases(root_ast: AstModule) -> dict[str, str]:
+    """
+    Look up for all the aliases within the provided AST.
+
+    The alias graph is traversed iteratively (depth first), the resolution of aliases' targets is cached.
+
+    Parameters:
+        root_ast: Root module's AST.
+
+    Returns:
+        A dictionary `alias canonical path` => `resolved canonical path`.
+    """
+
+    aliases: dict[str, str] = {}
+    modules_seen: set[str] = set()
+    # Resolved objects are kept alongside their canonical path for their `id` to remain valid.
+    resolved: dict[int, tuple[Any, str | None]] = {}
+
+    def resolve(
+        ast: AstModule | AstAlias | AstAttribute | AstClass | AstFunction,
+    ) -> str | None:
+        if id(ast) not in resolved:
+            try:
+                resolved[id(ast)] = (ast, ast.canonical_path)
+            except AliasResolutionError:
+                resolved[id(ast)] = (ast, None)
+        return resolved[id(ast)][1]
+
+    def is_leaf(ast):
+        return any(isinstance(ast, C) for C in [AstAttribute, AstClass, AstFunction])
+
+    def add_import(
+        entity: AstModule | AstAlias | AstAttribute | AstClass | AstFunction,
+        parent_module: str,
+        wild_cards: WildcardChain | None,
+    ):
+        target = cast(str, resolve(entity))
+        aliases[f"{parent_module}.{entity.name}"] = target
+        for parent_wild_card in wildcard_chain_modules(wild_cards):
+            aliases[f"{parent_wild_card}.{entity.name}"] = target
+
+    def process_entity(
+        ast: AstModule | AstAlias | AstAttribute | AstClass | AstFunction,
+        parent_module: str,
+        wild_cards: WildcardChain | None,
+    ) -> list[tuple]:
+        # Returns the tasks to process the entity, in order.
+        if is_leaf(ast):
+            return [("import", ast, parent_module, wild_cards)]
+
+        ast_path = cast(str, resolve(ast))
+        lib_members = [m for m in ast.all_members.values() if resolve(m)]
+        modules = [
+            m
+            for m in lib_members
+            if isinstance(m, AstModule) and resolve(m) not in modules_seen
+        ]
+        direct_imports = [
+            m
+            for m in lib_members
+            if not isinstance(m, AstAlias) and not isinstance(m, AstModule)
+        ]
+        direct_aliases = [
+            m
+            for m in lib_members
+            if isinstance(m, AstAlias) and not m.name.endswith("/*")
+        ]
+        wild_cards_aliases = [
+            m for m in lib_members if isinstance(m, AstAlias) and m.name.endswith("/*")
+        ]
+        wild_cards_children = WildcardChain(module=ast_path, parent=wild_cards)
+        wild_cards_modules = wildcard_chain_modules(wild_cards_children)
+        return [
+            *[("module", m, parent_module, wild_cards) for m in modules],
+            *[("process", m, ast_path, wild_cards) for m in direct_imports],
+            *[("import", m, parent_module, wild_cards) for m in direct_aliases],
+            *[
+                ("process", m, resolve(m), wild_cards_children)
+                for m in wild_cards_aliases
+                # Skip cycles of wildcard imports
+                if resolve(m) not in wild_cards_modules
+            ],
+        ]
+
+    tasks = [("process", root_ast, root_ast.name, None)]
+    while tasks:
+        action, entity, parent_module, wild_cards = tasks.pop()
+        if action == "import":
+            add_import(entity, parent_module, wild_cards)
+            continue
+        if action == "module":
+            entity_path = cast(str, resolve(entity))
+            modules_seen.add(entity_path)
+            add_import(entity, parent_module, wild_cards)
+            parent_module = entity_path
+        tasks.extend(reversed(process_entity(entity, parent_module, wild_cards)))
+
+    return aliases
+
+
+def get_module_ast(path: str, project: Project) -> AstModule:
+    return functools.reduce(
+        lambda acc, e: acc.modules[e],
+        path.split(".")[1:],
+        project.root_ast,
+    )
@@ -0,0 +1,467 @@
+"""
+Writing of the API files of the modules: encoding, implementations & sources side files, shards
+and navigation summary.
+"""
+
+import dataclasses
+import filecmp
+import functools
+import json
+import os
+import shutil
+from collections import abc
+from pathlib import Path
+from typing import Any, get_args
+
+from .configuration import Configuration, PrecompressFormat
+from .models import (Code, Entity, Module, ModuleShard, ModuleSummary,
+                     ShardEntry, Type)
+from .project import Project
+from .symbols import get_module_ast
+
+
+@functools.cache
+def optional_fields(model_type: type) -> frozenset[str] | None:
+    """
+    Lists the fields of an API model that default to `None`, those omitted from the API files when unset.
+
+    Parameters:
+        model_type: Type of the encoded object.
+
+    Returns:
+        The names of the optional fields, `None` if the type is not a dataclass.
+    """
+    if not dataclasses.is_dataclass(model_type):
+        return None
+    return frozenset(f.name for f in dataclasses.fields(model_type) if f.default is None)
+
+
+class DataclassJSONEncoder(json.JSONEncoder):
+    """
+    JSON encoder of the models (see `models.py`).
+
+    Dataclasses are converted one level at a time (the fields are not copied), the encoder walking the nested
+    models as it streams the output. Optional fields (those defaulting to `None`) are omitted when unset.
+    """
+
+    def default(self, o):
+        optional = optional_fields(type(o))
+        if optional is None:
+            return json.JSONEncoder.default(self, o)
+        values = o.__dict__
+        for name in optional:
+            if values[name] is None:
+                return {k: v for k, v in values.items() if v is not None or k not in optional}
+        return values
+
+
+def get_module_api_path(path: str, config: Configuration) -> Path:
+    return Path(config.out, *path.split(".")).with_suffix(".json")
+
+
+def get_implementations_path(path: str, config: Configuration) -> Path:
+    return Path(config.out, *path.split(".")).with_suffix(".implementations.json")
+
+
+def get_sources_path(path: str, config: Configuration) -> Path:
+    return Path(config.out, *path.split(".")).with_suffix(".sources.json")
+
+
+def get_shards_folder(path: str, config: Configuration) -> Path:
+    return Path(config.out, *path.split(".")).with_suffix(".shards")
+
+
+def get_module_api_files(path: str, config: Configuration) -> list[Path]:
+    """
+    Parameters:
+        path: Canonical path of the module.
+        config: Configuration.
+
+    Returns:
+        The paths of the files generated for a module: its API file, its implementations file if any, and its shard
+        files if any (as currently written).
+    """
+    sidecars = {
+        "sidecar": [get_implementations_path(path=path, config=config)],
+        "sources-sidecar": [get_sources_path(path=path, config=config)],
+    }
+    shards_folder = get_shards_folder(path=path, config=config)
+    shards = sorted(
+        shards_folder.glob("*.json"),
+        key=lambda shard_path: int(shard_path.name.split(".")[0]),
+    )
+    return [
+        get_module_api_path(path=path, config=config),
+        *sidecars.get(config.implementations, []),
+        *shards,
+    ]
+
+
+def replace_codes(doc: Module, replace: abc.Callable[[Entity], Code]) -> Module:
+    """
+    Replaces the `Code` of all the entities of a module.
+
+    Parameters:
+        doc: The module's model.
+        replace: Returns the new code of an entity.
+
+    Returns:
+        The updated model.
+    """
+
+    def update(entity: Any) -> Any:
+        return dataclasses.replace(entity, code=replace(entity))
+
+    def update_type(entity: Type) -> Type:
+        return dataclasses.replace(
+            update(entity),
+            callables=[update(c) for c in entity.callables],
+            attributes=[update(a) for a in entity.attributes],
+        )
+
+    return dataclasses.replace(
+        doc,
+        types=[update_type(t) for t in doc.types],
+        callables=[update(c) for c in doc.callables],
+        attributes=[update(a) for a in doc.attributes],
+    )
+
+
+def extract_implementations(doc: Module, reference: str) -> tuple[Module, dict[str, str]]:
+    """
+    Moves the implementations of a module's entities out of the model, each entity's `Code.implementationRef`
+    referencing its implementation in the returned mapping (keyed by the entity's path).
+
+    Parameters:
+        doc: The module's model.
+        reference: Path of the file storing the implementations, relative to `Configuration.out`.
+
+    Returns:
+        The updated model and the implementations.
+    """
+    implementations: dict[str, str] = {}
+
+    def extract(entity: Entity) -> Code:
+        if entity.code.implementation is None:
+            return entity.code
+        implementations[entity.path] = entity.code.implementation
+        return dataclasses.replace(
+            entity.code,
+            implementation=None,
+            implementationRef=f"{reference}#{entity.path}",
+        )
+
+    return replace_codes(doc=doc, replace=extract), implementations
+
+
+def extract_sources(
+    doc: Module, reference: str, project: Project
+) -> tuple[Module, dict[str, str]]:
+    """
+    Replaces the implementations of a module's entities by references to the lines of their files' sources
+    (`Code.sourceRef`), each source being included once.
+
+    The lines of the sources not included in any implementation are emptied (they are kept to preserve the lines'
+    numbering).
+
+    Parameters:
+        doc: The module's model.
+        reference: Path of the file storing the sources, relative to `Configuration.out`;
+            empty if they are included in the module.
+        project: Project description.
+
+    Returns:
+        The updated model and the sources (keyed by the files' paths, as provided by `Code.filePath`).
+    """
+    lines_collection = project.root_ast.lines_collection
+    root_folder = project.root_ast.filepath.parent
+    files_lines: dict[str, list[str]] = {}
+    covered: dict[str, list[bool]] = {}
+
+    def extract(entity: Entity) -> Code:
+        code = entity.code
+        if code.implementation is None or code.startLine is None:
+            return code
+        if code.filePath not in files_lines:
+            try:
+                files_lines[code.filePath] = lines_collection[root_folder / code.filePath]
+            except KeyError:
+                return code
+            covered[code.filePath] = [False] * len(files_lines[code.filePath])
+        file_covered = covered[code.filePath]
+        file_covered[code.startLine - 1 : code.endLine] = [True] * (
+            code.endLine - code.startLine + 1
+        )
+        return dataclasses.replace(
+            code, implementation=None, sourceRef=f"{reference}#{code.filePath}"
+        )
+
+    doc = replace_codes(doc=doc, replace=extract)
+    sources = {
+        path: "\n".join(
+            line if is_covered else ""
+            for line, is_covered in zip(lines, covered[path])
+        ).rstrip("\n")
+        for path, lines in files_lines.items()
+    }
+    return doc, sources
+
+
+def extract_symbols(doc: Module) -> Module:
+    """
+    Replaces the URLs referenced by a module's entities (`Code.references`) by their index in a table of the
+    module's distinct targets (`Module.symbols`), ordered by first occurrence.
+
+    Unresolved references (`None`) are kept as is.
+
+    Parameters:
+        doc: The module's model.
+
+    Returns:
+        The updated model.
+    """
+    symbols: dict[str, int] = {}
+
+    def extract(entity: Entity) -> Code:
+        references = {
+            name: None if url is None else symbols.setdefault(url, len(symbols))
+            for name, url in entity.code.references.items()
+        }
+        return dataclasses.replace(entity.code, references=references)
+
+    doc = replace_codes(doc=doc, replace=extract)
+    return dataclasses.replace(doc, symbols=list(symbols))
+
+
+def get_shard_path(path: str, index: int, config: Configuration) -> Path:
+    return get_shards_folder(path=path, config=config) / f"{index}.json"
+
+
+def shard_module(
+    doc: Module, path: str, config: Configuration
+) -> tuple[Module, list[ModuleShard]]:
+    """
+    Splits the entities of a module into shards of `Configuration.shard_size` entities (in the order types,
+    callables, attributes), the shard `i` of the module `foo` being written in the file `foo.shards/{i}.json`.
+
+    Parameters:
+        doc: The module's model.
+        path: Canonical path of the module.
+        config: Configuration.
+
+    Returns:
+        The module, its entities replaced by their references (`Module.shards`), and the shards.
+    """
+    entities = [
+        *[("type", e) for e in doc.types],
+        *[("callable", e) for e in doc.callables],
+        *[("attribute", e) for e in doc.attributes],
+    ]
+    shards: list[ModuleShard] = []
+    entries: list[ShardEntry] = []
+    for i in range(0, len(entities), config.shard_size):
+        chunk = entities[i : i + config.shard_size]
+        shard_path = get_shard_path(path=path, index=len(shards), config=config)
+        shards.append(
+            ModuleShard(
+                types=[e for kind, e in chunk if kind == "type"],
+                callables=[e for kind, e in chunk if kind == "callable"],
+                attributes=[e for kind, e in chunk if kind == "attribute"],
+            )
+        )
+        entries.extend(
+            ShardEntry(
+                name=e.name,
+                path=e.path,
+                kind=kind,
+                filePath=e.code.filePath,
+                shard=shard_path.relative_to(config.out).as_posix(),
+            )
+            for kind, e in chunk
+        )
+    doc = dataclasses.replace(doc, types=[], callables=[], attributes=[], shards=entries)
+    return doc, shards
+
+
+def write_if_changed(target_path: Path, write: abc.Callable[[Path], None]) -> bool:
+    """
+    Writes a file atomically, and only if its content changed: the content is written in a temporary file (next to
+    the target), which replaces the target only when their contents differ.
+
+    This preserves the modification time of unchanged files, and readers never see partially written files.
+
+    Parameters:
+        target_path: The file to write.
+        write: Writes the content in the provided (temporary) file.
+
+    Returns:
+        Whether the target has been written.
+    """
+    target_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = target_path.with_name(f".{target_path.name}.{os.getpid()}.tmp")
+    try:
+        write(tmp_path)
+        if target_path.exists() and filecmp.cmp(tmp_path, target_path, shallow=False):
+            return False
+        os.replace(tmp_path, target_path)
+        return True
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def remove_stale_files(folder: Path, kept: list[Path]):
+    """
+    Removes the files of a folder (recursively) that are not in a list of API files, along with their precompressed
+    siblings. The folder is removed if no file is kept.
+
+    Parameters:
+        folder: The folder.
+        kept: The API files to keep.
+    """
+    if not folder.exists():
+        return
+    for file_path in sorted(folder.rglob("*"), reverse=True):
+        if file_path.is_dir():
+            if not any(file_path.iterdir()):
+                file_path.rmdir()
+            continue
+        api_file = file_path.with_name(".".join(file_path.name.split(".")[:2]))
+        if api_file not in kept:
+            file_path.unlink()
+    if not kept:
+        shutil.rmtree(folder, ignore_errors=True)
+
+
+def remove_api_file(file_path: Path):
+    """
+    Removes an API file (if it exists) along with its precompressed siblings.
+
+    Parameters:
+        file_path: Path of the API file.
+    """
+    file_path.unlink(missing_ok=True)
+    for compress_format in get_args(PrecompressFormat):
+        file_path.with_name(f"{file_path.name}.{compress_format}").unlink(missing_ok=True)
+
+
+def write_module_api(doc: Module, path: str, project: Project) -> bool:
+    """
+    Writes the API files of a module (if their content changed): the module's file, its implementations
+    or sources file when `Configuration.implementations` is `sidecar` or `sources-sidecar`, and its shards when
+    `Configuration.shard_size` is exceeded.
+
+    Parameters:
+        doc: The module's model.
+        path: Canonical path of the module.
+        project: Project description.
+
+    Returns:
+        Whether the module's API file has been written.
+    """
+    config = project.config
+    implementations_path = get_implementations_path(path=path, config=config)
+    sources_path = get_sources_path(path=path, config=config)
+    if config.implementations == "sidecar":
+        reference = implementations_path.relative_to(config.out).as_posix()
+        doc, implementations = extract_implementations(doc=doc, reference=reference)
+        write_api_file(
+            target_path=implementations_path, content=implementations, config=config
+        )
+    if config.implementations == "sources":
+        doc, sources = extract_sources(doc=doc, reference="", project=project)
+        doc = dataclasses.replace(doc, sources=sources)
+    if config.implementations == "sources-sidecar":
+        reference = sources_path.relative_to(config.out).as_posix()
+        doc, sources = extract_sources(doc=doc, reference=reference, project=project)
+        write_api_file(target_path=sources_path, content=sources, config=config)
+    if config.references_table:
+        doc = extract_symbols(doc=doc)
+    shards: list[ModuleShard] = []
+    entities_count = len(doc.types) + len(doc.callables) + len(doc.attributes)
+    if config.shard_size and entities_count > config.shard_size:
+        doc, shards = shard_module(doc=doc, path=path, config=config)
+    shard_paths = [
+        get_shard_path(path=path, index=i, config=config) for i in range(len(shards))
+    ]
+    for shard, shard_path in zip(shards, shard_paths):
+        write_api_file(target_path=shard_path, content=shard, config=config)
+    for sidecar in {implementations_path, sources_path} - set(
+        get_module_api_files(path=path, config=config)
+    ):
+        remove_api_file(sidecar)
+    remove_stale_files(
+        folder=get_shards_folder(path=path, config=config), kept=shard_paths
+    )
+
+    return write_api_file(
+        target_path=get_module_api_path(path=path, config=config),
+        content=doc,
+        config=config,
+    )
+
+
+def write_api_file(target_path: Path, content: Any, config: Configuration) -> bool:
+    """
+    Writes an API file (if its content changed).
+
+    Parameters:
+        target_path: The file to write.
+        content: The content (models or JSON serializable).
+        config: Configuration.
+
+    Returns:
+        Whether the file has been written.
+    """
+
+    def write(file_path: Path):
+        if config.compact_json:
+            # Encoded at once to use the C implementation of the encoder (not available with indentation).
+            encoded = json.dumps(content, cls=DataclassJSONEncoder, separators=(",", ":"))
+            file_path.write_text(encoded, encoding="UTF8")
+            return
+        with open(file_path, "w", encoding="UTF8") as json_file:
+            json.dump(content, json_file, cls=DataclassJSONEncoder, indent=4)
+
+    return write_if_changed(target_path=target_path, write=write)
+
+
+def get_nav_summary_path(config: Configuration) -> Path:
+    return Path(config.out) / "api.nav.json"
+
+
+def get_nav_summary(path: str, project: Project) -> ModuleSummary:
+    """
+    Summarizes a module and its descendants for the navigation: their names, paths, leaf flags and the first line
+    of their docstrings. The modules of `Configuration.extra_modules` are included (with an empty summary).
+
+    Only the modules' trees and docstrings are involved, no module is rendered.
+
+    Parameters:
+        path: Canonical path of the module.
+        project: Project description.
+
+    Returns:
+        The summary.
+    """
+    ast = get_module_ast(path=path, project=project)
+    elements = project.modules_tree[path]
+    lines = ast.docstring.value.strip().splitlines() if ast.docstring else []
+    extra_modules = [
+        ModuleSummary(
+            name=m.name, path=m.path, isLeaf=m.isLeaf, summary="", children=[]
+        )
+        for m in project.config.extra_modules.get(path, [])
+    ]
+    return ModuleSummary(
+        name=ast.name,
+        path=path,
+        isLeaf=elements.is_leaf,
+        summary=lines[0].strip() if lines else "",
+        children=[
+            *[
+                get_nav_summary(path=m.canonical_path, project=project)
+                for m in elements.modules
+            ],
+            *extra_modules,
+        ],
+    )
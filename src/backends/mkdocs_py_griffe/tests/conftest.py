@@ -0,0 +1,155 @@
+"""
+Fixtures of the tests: a small package `demo` written in a temporary folder, and the generation of its API files.
+"""
+
+from pathlib import Path
+from typing import Callable
+
+import griffe
+import pytest
+
+from mkdocs_py_griffe import Configuration, DocReporter, generate_api
+
+DEMO_FILES = {
+    "__init__.py": '''
+"""
+The demo package, see :class:`demo.shapes.Square`.
+"""
+from .shapes import Square, compute_area
+''',
+    "shapes.py": '''
+"""
+Shapes and their areas.
+"""
+from dataclasses import dataclass
+
+DEFAULT_SIDE = 1.0
+"""
+Default side of the squares.
+"""
+
+
+@dataclass
+class Square:
+    """
+    A square shape, see :func:`demo.shapes.compute_area`.
+    """
+
+    side: float = DEFAULT_SIDE
+    """
+    The side's length.
+    """
+
+    def scaled(self, factor: float) -> "Square":
+        """
+        Returns a scaled copy of the square.
+
+        Parameters:
+            factor: The scaling factor.
+
+        Returns:
+            The scaled square.
+        """
+        return Square(side=self.side * factor)
+
+
+def compute_area(square: Square) -> float:
+    """
+    Computes the area of a square.
+
+    Parameters:
+        square: The square.
+
+    Returns:
+        Its area.
+    """
+    return square.side**2
+''',
+    "io/__init__.py": '''
+"""
+Reading and writing shapes.
+"""
+''',
+    "io/readers.py": '''
+"""
+Readers of shapes.
+"""
+from demo.shapes import Square
+
+
+def read_square(text: str) -> Square:
+    """
+    Parses a square from its side, see :class:`demo.shapes.Square`.
+
+    Parameters:
+        text: The side.
+
+    Returns:
+        The square.
+    """
+    return Square(side=float(text))
+''',
+}
+"""
+Files of the package `demo`, by path relative to the package's folder.
+"""
+
+Generate = Callable[..., DocReporter]
+
+
+def write_demo(folder: Path, files: dict[str, str] | None = None) -> Path:
+    """
+    Writes the package `demo` in a folder.
+
+    Parameters:
+        folder: The folder including the package.
+        files: Files replacing or completing those of `DEMO_FILES`.
+
+    Returns:
+        The folder.
+    """
+    for relative_path, content in {**DEMO_FILES, **(files or {})}.items():
+        file_path = folder / "demo" / relative_path
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text(content.lstrip(), encoding="UTF8")
+    return folder
+
+
+@pytest.fixture(name="demo_folder")
+def fixture_demo_folder(tmp_path: Path) -> Path:
+    return write_demo(tmp_path / "src")
+
+
+@pytest.fixture(name="out")
+def fixture_out(tmp_path: Path) -> Path:
+    return tmp_path / "out"
+
+
+@pytest.fixture(name="generate")
+def fixture_generate(demo_folder: Path, out: Path) -> Generate:
+    """
+    Returns a function generating the API files of the package `demo` in the folder `out`, its keyword arguments
+    are options of the :class:`mkdocs_py_griffe.configuration.Configuration`.
+    """
+
+    def generate(**options) -> DocReporter:
+        root_ast = griffe.load("demo", submodules=True, search_paths=[str(demo_folder)])
+        config = Configuration(**{"base_nav": "/api/demo", "out": out, **options})
+        return generate_api(root_ast=root_ast, config=config, report=None)
+
+    return generate
+
+
+def read_files(folder: Path) -> dict[str, bytes]:
+    """
+    Parameters:
+        folder: A folder.
+
+    Returns:
+        The content of the files in the folder (recursively), keyed by their path relative to the folder.
+    """
+    return {
+        file_path.relative_to(folder).as_posix(): file_path.read_bytes()
+        for file_path in sorted(folder.rglob("*"))
+        if file_path.is_file()
+    }
@@ -0,0 +1,71 @@
+import json
+from pathlib import Path
+
+from conftest import Generate, write_demo
+
+
+def iter_dicts(value):
+    if isinstance(value, dict):
+        yield value
+        for item in value.values():
+            yield from iter_dicts(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from iter_dicts(item)
+
+
+def test_unset_optional_fields_omitted(generate: Generate, out: Path):
+    generate()
+
+    module = json.loads((out / "demo.json").read_text())
+    codes = [d for d in iter_dicts(module) if "declaration" in d]
+    assert codes
+    for key in ["sources", "symbols", "shards"]:
+        assert key not in module
+    assert any("implementation" in code for code in codes)
+    assert not any("implementationRef" in code or "sourceRef" in code for code in codes)
+
+
+def test_set_optional_fields_written(generate: Generate, out: Path):
+    generate(implementations="sources", references_table=True)
+
+    module = json.loads((out / "demo.json").read_text())
+    codes = [d for d in iter_dicts(module) if "declaration" in d]
+    assert "sources" in module
+    assert "symbols" in module
+    sourced = [code for code in codes if "sourceRef" in code]
+    assert sourced
+    assert all(code["sourceRef"] == f"#{code['filePath']}" for code in sourced)
+    assert not any("implementation" in code for code in codes)
+
+
+def test_qualified_raises(generate: Generate, demo_folder: Path, out: Path):
+    parsers = '''
+"""
+Parsers of shapes.
+"""
+import json
+
+
+def parse_side(text: str) -> float:
+    """
+    Parses a side from JSON.
+
+    Parameters:
+        text: The JSON.
+
+    Returns:
+        The side.
+
+    Raises:
+        json.JSONDecodeError: If the text is not JSON.
+    """
+'''
+    write_demo(demo_folder, {"parsers.py": parsers})
+    url = "https://docs.python.org/3/library/json.html#json.JSONDecodeError"
+    generate(external_links={"json.JSONDecodeError": url})
+
+    module = json.loads((out / "demo.json").read_text())
+    parse_side = next(c for c in module["callables"] if c["name"] == "parse_side")
+    raises = next(s for s in parse_side["documentation"]["sections"] if s.get("title") == "Raises")
+    assert f"href='{url}'>JSONDecodeError</a>" in raises["content"]
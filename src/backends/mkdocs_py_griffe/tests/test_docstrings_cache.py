@@ -0,0 +1,49 @@
+import sqlite3
+from pathlib import Path
+
+import pytest
+from conftest import Generate, read_files
+
+from mkdocs_py_griffe import DocstringsCache
+
+
+def test_cached_docstrings_same_output(generate: Generate, out: Path, tmp_path: Path):
+    generate(out=tmp_path / "uncached")
+    first = generate(docstrings_cache=tmp_path / "cache")
+    second = generate(docstrings_cache=tmp_path / "cache", out=tmp_path / "second")
+
+    first_stats, second_stats = first.stats["Docstrings cache"], second.stats["Docstrings cache"]
+    assert first_stats["misses"] > 0
+    assert second_stats["misses"] == 0
+    assert second_stats["hits"] == first_stats["hits"] + first_stats["misses"]
+    assert read_files(out) == read_files(tmp_path / "uncached") == read_files(tmp_path / "second")
+
+
+@pytest.mark.parametrize(
+    "corrupt",
+    [
+        lambda file_path: file_path.write_bytes(b"not a database"),
+        lambda file_path: sqlite3.connect(file_path).execute("CREATE TABLE entries (key TEXT)"),
+    ],
+    ids=["not-a-database", "other-table"],
+)
+def test_corrupt_cache_rebuilt(generate: Generate, out: Path, tmp_path: Path, corrupt):
+    generate(out=tmp_path / "uncached")
+    cache = tmp_path / "cache"
+    cache.mkdir()
+    corrupt(cache / DocstringsCache.FILENAME)
+
+    reporter = generate(docstrings_cache=cache)
+
+    assert reporter.stats["Docstrings cache"]["misses"] > 0
+    assert read_files(out) == read_files(tmp_path / "uncached")
+    assert generate(docstrings_cache=cache).stats["Docstrings cache"]["misses"] == 0
+
+
+def test_eviction(generate: Generate, tmp_path: Path):
+    first = generate(docstrings_cache=tmp_path / "cache", docstrings_cache_size=0)
+    second = generate(docstrings_cache=tmp_path / "cache")
+
+    first_stats, second_stats = first.stats["Docstrings cache"], second.stats["Docstrings cache"]
+    assert first_stats["evicted"] == first_stats["misses"] > 0
+    assert second_stats["misses"] == first_stats["misses"]
@@ -0,0 +1,55 @@
+import json
+from pathlib import Path
+
+import pytest
+from conftest import Generate
+
+from mkdocs_py_griffe import PrefixRules
+
+
+def test_prefix_rules_longest_prefix():
+    rules = PrefixRules(
+        {
+            "numpy.": "https://numpy.org/{path}.html",
+            "numpy.linalg": "https://numpy.org/linalg/{relative}#{name}",
+        }
+    )
+
+    assert rules.get("numpy") == "https://numpy.org/numpy.html"
+    assert rules.get("numpy.array") == "https://numpy.org/numpy.array.html"
+    assert rules.get("numpy.linalg.norm") == "https://numpy.org/linalg/norm#norm"
+    assert rules.get("numpyx.array") is None
+    assert rules.get("pandas") is None
+
+
+def test_prefix_rules_other_braces_kept():
+    rules = PrefixRules({"foo": "https://foo.org/{0}/{}/{path}/{unknown}"})
+
+    assert rules.get("foo.bar") == "https://foo.org/{0}/{}/foo.bar/{unknown}"
+
+
+@pytest.mark.parametrize("prefix", ["", "."])
+def test_prefix_rules_empty_prefix(prefix: str):
+    with pytest.raises(ValueError, match="Empty prefix"):
+        PrefixRules({prefix: "https://foo.org/{path}"})
+
+
+def test_rules_in_declarations(generate: Generate, out: Path):
+    generate(
+        external_links={"float": "https://docs.python.org/3/library/functions.html#float"},
+        external_link_rules={
+            "dataclasses.": "https://docs.python.org/3/library/dataclasses.html#{path}",
+            "float": "https://never.used/{path}",
+        },
+    )
+
+    module = json.loads((out / "demo.json").read_text())
+    square = next(t for t in module["types"] if t["name"] == "Square")
+    references = square["code"]["references"]
+    assert (
+        references["dataclass"]
+        == "https://docs.python.org/3/library/dataclasses.html#dataclasses.dataclass"
+    )
+    # Exact entries have priority over the rules.
+    side = next(a for a in square["attributes"] if a["name"] == "side")
+    assert side["code"]["references"]["float"] == "https://docs.python.org/3/library/functions.html#float"
@@ -0,0 +1,129 @@
+import json
+from pathlib import Path
+
+import pytest
+from conftest import DEMO_FILES, Generate, read_files, write_demo
+
+from mkdocs_py_griffe import MANIFEST_FILENAME
+
+
+def api_files(folder: Path) -> dict[str, bytes]:
+    return {k: v for k, v in read_files(folder).items() if k != MANIFEST_FILENAME}
+
+
+def test_unchanged_modules_skipped(generate: Generate, out: Path):
+    first = generate(incremental=True)
+    files = read_files(out)
+    second = generate(incremental=True)
+
+    assert second.stats["Incremental generation"] == {"rendered": 0, "skipped": 2}
+    assert read_files(out) == files
+    # The diagnostics of the skipped modules are restored from the manifest.
+    assert second.to_json() == first.to_json()
+
+
+BIG_SQUARE = '''
+"""
+Big shapes.
+"""
+from demo.shapes import Square
+
+
+class BigSquare(Square):
+    """
+    A big square.
+    """
+'''
+
+
+@pytest.mark.parametrize(
+    "versions, rendered",
+    [
+        # Only the module `demo` includes `shapes.py`.
+        ((DEMO_FILES, {"shapes.py": DEMO_FILES["shapes.py"].replace("Computes the area", "Computes the surface")}), 1),
+        # `demo.io` references `Square`, that can not be resolved anymore.
+        (
+            (
+                DEMO_FILES,
+                {
+                    "__init__.py": DEMO_FILES["__init__.py"].replace("Square", "Rectangle"),
+                    "shapes.py": DEMO_FILES["shapes.py"].replace("Square", "Rectangle"),
+                },
+            ),
+            2,
+        ),
+        # `demo.io` renders the method `scaled` inherited by `BigSquare` from `shapes.py`.
+        (
+            (
+                {"io/big.py": BIG_SQUARE},
+                {"io/big.py": BIG_SQUARE, "shapes.py": DEMO_FILES["shapes.py"].replace("scaled copy", "scaled clone")},
+            ),
+            2,
+        ),
+    ],
+)
+def test_incremental_equals_full_generation(
+    generate: Generate, demo_folder: Path, out: Path, versions: tuple[dict[str, str], dict[str, str]], rendered: int
+):
+    # The files of the package for the first generation, then for the second one.
+    initial, changed = versions
+    write_demo(demo_folder, initial)
+    generate(incremental=True)
+    write_demo(demo_folder, changed)
+    incremental = generate(incremental=True)
+    full = generate(out=out.parent / "full")
+
+    assert incremental.stats["Incremental generation"] == {
+        "rendered": rendered,
+        "skipped": 2 - rendered,
+    }
+    assert api_files(out) == api_files(out.parent / "full")
+    assert incremental.to_json() == full.to_json()
+
+
+def set_generator(manifest: dict):
+    manifest["generator"] = "stale"
+
+
+def set_inputs(manifest: dict):
+    manifest["modules"]["demo.io"]["inputs"] = "stale"
+
+
+@pytest.mark.parametrize(
+    "make_stale, rendered",
+    [(set_generator, 2), (set_inputs, 1)],
+)
+def test_stale_manifest(generate: Generate, out: Path, make_stale, rendered: int):
+    generate(incremental=True)
+    files = read_files(out)
+    manifest_path = out / MANIFEST_FILENAME
+    manifest = json.loads(manifest_path.read_text())
+    make_stale(manifest)
+    manifest_path.write_text(json.dumps(manifest))
+
+    reporter = generate(incremental=True)
+
+    assert reporter.stats["Incremental generation"] == {"rendered": rendered, "skipped": 2 - rendered}
+    assert read_files(out) == files
+
+
+def test_corrupt_manifest(generate: Generate, out: Path):
+    generate(incremental=True)
+    files = read_files(out)
+    (out / MANIFEST_FILENAME).write_text('{"generator": ')
+
+    reporter = generate(incremental=True)
+
+    assert reporter.stats["Incremental generation"] == {"rendered": 2, "skipped": 0}
+    assert read_files(out) == files
+
+
+def test_missing_api_file(generate: Generate, out: Path):
+    generate(incremental=True)
+    files = read_files(out)
+    (out / "demo" / "io.json").unlink()
+
+    reporter = generate(incremental=True)
+
+    assert reporter.stats["Incremental generation"] == {"rendered": 1, "skipped": 1}
+    assert read_files(out) == files
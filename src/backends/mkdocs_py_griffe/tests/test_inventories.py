@@ -0,0 +1,213 @@
+import json
+import zlib
+from pathlib import Path
+
+import griffe
+import pytest
+from conftest import Generate, write_demo
+
+from mkdocs_py_griffe import (INVENTORY_FILENAME, Configuration, DocReporter,
+                              SphinxInventory, SymbolInventory, SymbolRef,
+                              generate_api)
+
+
+def test_symbol_inventory(generate: Generate, out: Path):
+    reporter = generate(inventory=True)
+
+    inventory = SymbolInventory.load(out / INVENTORY_FILENAME)
+    assert reporter.stats["Symbols inventory"] == {"symbols": len(inventory)}
+    assert inventory.project == "demo"
+    assert inventory.base_nav == "/api/demo"
+    assert inventory.get("demo.shapes.Square") == SymbolRef(
+        kind="class", navigation_path=".shapes.Square"
+    )
+    assert inventory.get("demo.io.readers.read_square") == SymbolRef(
+        kind="function", navigation_path="io.readers.read_square"
+    )
+    assert inventory.get("demo.shapes.Circle") is None
+    assert inventory.ending_with("Square") == ["demo.shapes.Square"]
+    assert inventory.dumps() == (out / INVENTORY_FILENAME).read_bytes()
+
+
+def test_symbol_inventory_round_trip(tmp_path: Path):
+    entries = [
+        ("foo.Bar", SymbolRef(kind="class", navigation_path=".Bar")),
+        ("foo", SymbolRef(kind="module", navigation_path=".foo")),
+    ]
+    file_path = tmp_path / INVENTORY_FILENAME
+    file_path.write_bytes(SymbolInventory(project="foo", base_nav="/api/foo", entries=entries).dumps())
+
+    inventory = SymbolInventory.load(file_path)
+
+    assert (inventory.project, inventory.base_nav) == ("foo", "/api/foo")
+    assert list(zip(inventory.paths, inventory.refs)) == sorted(entries)
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        b"",
+        b"# Sphinx inventory version 2\n# Project: foo\n",
+        b"# mkdocs_py_griffe symbols inventory version 0\n",
+    ],
+    ids=["empty", "sphinx", "version"],
+)
+def test_symbol_inventory_bad_header(tmp_path: Path, content: bytes):
+    file_path = tmp_path / INVENTORY_FILENAME
+    file_path.write_bytes(content)
+
+    with pytest.raises(ValueError, match="not a symbols inventory"):
+        SymbolInventory.load(file_path)
+
+
+def write_sphinx_inventory(file_path: Path, lines: list[str]) -> Path:
+    header = (
+        "# Sphinx inventory version 2\n"
+        "# Project: numpy\n"
+        "# Version: 1.26\n"
+        "# The remainder of this file is compressed using zlib.\n"
+    )
+    file_path.write_bytes(header.encode() + zlib.compress("".join(f"{line}\n" for line in lines).encode()))
+    return file_path
+
+
+NUMPY_LINES = [
+    "numpy.ndarray py:class 1 reference/generated/numpy.ndarray.html#$ -",
+    "numpy.ndarray py:data 1 reference/other.html#ndarray -",
+    "numpy.zeros py:function 1 reference/generated/numpy.zeros.html#numpy.zeros numpy.zeros",
+    "numpy.doc std:doc -1 doc.html Numpy documentation",
+]
+
+
+def test_sphinx_inventory(tmp_path: Path):
+    file_path = write_sphinx_inventory(tmp_path / "objects.inv", NUMPY_LINES)
+    inventory = SphinxInventory(file_path=file_path, base_url="https://numpy.org/doc")
+    base_url = "https://numpy.org/doc/reference/generated"
+
+    # `$` stands for the object's name, the first entry of a name has priority.
+    assert inventory.get("numpy.ndarray") == f"{base_url}/numpy.ndarray.html#numpy.ndarray"
+    assert inventory.get("numpy.zeros") == f"{base_url}/numpy.zeros.html#numpy.zeros"
+    # Only the Python objects are indexed.
+    assert inventory.get("numpy.doc") is None
+    assert inventory.get("numpy.ones") is None
+
+
+def test_sphinx_inventory_links(generate: Generate, demo_folder: Path, out: Path, tmp_path: Path):
+    arrays = '''
+"""
+Conversions to arrays.
+"""
+import numpy
+
+
+def to_array(square: "demo.shapes.Square") -> numpy.ndarray:
+    """
+    Converts a square to an array.
+
+    Parameters:
+        square: The square.
+
+    Returns:
+        The array.
+    """
+'''
+    write_demo(demo_folder, {"arrays.py": arrays})
+    file_path = write_sphinx_inventory(tmp_path / "objects.inv", NUMPY_LINES)
+
+    reporter = generate(sphinx_inventories={"https://numpy.org/doc/stable/": file_path})
+
+    # Like `external_links`, the inventories resolve the links of the declarations.
+    content = (out / "demo.json").read_text()
+    assert "https://numpy.org/doc/stable/reference/generated/numpy.ndarray.html#numpy.ndarray" in content
+    assert "numpy.ndarray" not in reporter.external_cross_ref_errors
+
+
+def test_sphinx_inventory_missing(generate: Generate, out: Path, tmp_path: Path):
+    with pytest.raises(FileNotFoundError):
+        generate(sphinx_inventories={"https://numpy.org/doc/stable/": tmp_path / "missing.inv"})
+    assert not out.exists()
+
+
+def test_sphinx_inventory_bad_header(tmp_path: Path):
+    file_path = tmp_path / "objects.inv"
+    file_path.write_bytes(b"# Sphinx inventory version 1\n")
+    inventory = SphinxInventory(file_path=file_path, base_url="https://numpy.org/doc")
+
+    with pytest.raises(ValueError, match="not a Sphinx inventory"):
+        inventory.get("numpy.zeros")
+
+
+APP_FILES = {
+    "__init__.py": '''
+"""
+An application using :class:`demo.shapes.Square`, not :class:`demo.Square`.
+"""
+''',
+    "factory.py": '''
+"""
+Factory of squares.
+"""
+from demo.shapes import Square
+
+
+def make() -> Square:
+    """
+    Makes a square.
+
+    Returns:
+        The square.
+    """
+''',
+}
+
+
+@pytest.fixture(name="generate_app")
+def fixture_generate_app(tmp_path: Path) -> Generate:
+    """
+    Returns a function generating the API files of a package `app` referencing the package `demo`, its keyword
+    arguments are options of the :class:`mkdocs_py_griffe.configuration.Configuration`.
+    """
+    app_folder = tmp_path / "app_src"
+    (app_folder / "app").mkdir(parents=True)
+    for name, content in APP_FILES.items():
+        (app_folder / "app" / name).write_text(content.lstrip())
+
+    def generate_app(**options) -> DocReporter:
+        root_ast = griffe.load("app", submodules=True, search_paths=[str(app_folder)])
+        config = Configuration(
+            **{
+                "base_nav": "/api/app",
+                "out": tmp_path / "app_out",
+                "cross_linked_packages": {"demo": "/api/demo"},
+                **options,
+            }
+        )
+        return generate_api(root_ast=root_ast, config=config, report=None)
+
+    return generate_app
+
+
+def test_cross_linked_inventory(generate: Generate, generate_app: Generate, out: Path, tmp_path: Path):
+    generate(inventory=True)
+
+    reporter = generate_app(cross_linked_inventories={"demo": out / INVENTORY_FILENAME})
+
+    module = json.loads((tmp_path / "app_out" / "app.json").read_text())
+    assert "[Square](@nav/api/demo/.shapes.Square)" in module["documentation"]["sections"][0]["content"]
+    assert module["callables"][0]["code"]["references"]["Square"] == "@nav/api/demo/.shapes.Square"
+    # The link to the re-exported symbol is not in the inventory, its suggestions come from the inventory.
+    assert reporter.sphinx_links_unresolved == {"app=>:class:`demo.Square`": ["demo.shapes.Square"]}
+
+
+def test_cross_linked_package_without_inventory(generate_app: Generate, tmp_path: Path):
+    reporter = generate_app()
+
+    # Links are not validated.
+    content = (tmp_path / "app_out" / "app.json").read_text()
+    assert "[Square](@nav/api/demo/.Square)" in content
+    assert not reporter.sphinx_links_unresolved
+
+
+def test_cross_linked_inventory_missing(generate_app: Generate, tmp_path: Path):
+    with pytest.raises(FileNotFoundError):
+        generate_app(cross_linked_inventories={"demo": tmp_path / "missing.inventory"})
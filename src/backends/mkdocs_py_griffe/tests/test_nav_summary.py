@@ -0,0 +1,41 @@
+import json
+from pathlib import Path
+
+from conftest import Generate, read_files
+
+from mkdocs_py_griffe import ChildModule
+
+
+def test_nav_summary(generate: Generate, out: Path):
+    extra = ChildModule(name="extra", path="demo.extra", isLeaf=True)
+    generate(nav_summary=True, extra_modules={"demo": [extra]})
+
+    summary = json.loads((out / "api.nav.json").read_text())
+    assert summary == {
+        "name": "demo",
+        "path": "demo",
+        "isLeaf": False,
+        "summary": "The demo package, see :class:`demo.shapes.Square`.",
+        "children": [
+            {
+                "name": "io",
+                "path": "demo.io",
+                "isLeaf": True,
+                "summary": "Reading and writing shapes.",
+                "children": [],
+            },
+            {
+                "name": "extra",
+                "path": "demo.extra",
+                "isLeaf": True,
+                "summary": "",
+                "children": [],
+            },
+        ],
+    }
+
+
+def test_nav_summary_disabled(generate: Generate, out: Path):
+    generate()
+
+    assert "api.nav.json" not in read_files(out)
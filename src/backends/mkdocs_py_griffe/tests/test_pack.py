@@ -0,0 +1,34 @@
+import json
+from pathlib import Path
+
+import pytest
+from conftest import Generate, read_files
+
+from mkdocs_py_griffe import PACK_FILENAME, PACK_INDEX_FILENAME, PackReader
+
+
+def test_pack(generate: Generate, out: Path):
+    reporter = generate(pack=True, implementations="sidecar")
+
+    assert reporter.stats["Pack"] == {"modules": 2, "written": True}
+    files = read_files(out)
+    index = json.loads(files[PACK_INDEX_FILENAME])
+    assert index["pack"] == PACK_FILENAME
+    assert set(index["files"]) == {
+        "demo.json",
+        "demo.implementations.json",
+        "demo/io.json",
+        "demo/io.implementations.json",
+    }
+    # The index's `[offset, length]` are the byte ranges of HTTP range requests.
+    pack = files[PACK_FILENAME]
+    for file, (offset, length) in index["files"].items():
+        assert pack[offset : offset + length] == files[file]
+
+    with PackReader(folder=out) as reader:
+        for file in index["files"]:
+            assert reader.read(file) == files[file]
+        with pytest.raises(KeyError):
+            reader.read("demo/unknown.json")
+
+    assert generate(pack=True, implementations="sidecar").stats["Pack"]["written"] is False
@@ -0,0 +1,81 @@
+import gzip
+import os
+from pathlib import Path
+
+import pytest
+from conftest import DEMO_FILES, Generate, write_demo
+
+import mkdocs_py_griffe.pack
+
+
+def siblings(folder: Path, suffix: str) -> dict[Path, Path]:
+    return {p.with_suffix(""): p for p in folder.rglob(f"*.json.{suffix}")}
+
+
+def test_gzip_siblings(generate: Generate, out: Path):
+    reporter = generate(precompress=["gz"], precompress_min_size=0, nav_summary=True)
+
+    gz = siblings(out, "gz")
+    assert set(gz) == set(out.rglob("*.json"))
+    for file_path, sibling in gz.items():
+        assert gzip.decompress(sibling.read_bytes()) == file_path.read_bytes()
+    # Only the modules' API files are counted, not the navigation summary.
+    assert reporter.stats["Precompressed files written"] == {"gz": len(gz) - 1}
+
+    # Siblings matching their files are kept.
+    reporter = generate(precompress=["gz"], precompress_min_size=0)
+    assert reporter.stats["Precompressed files written"] == {"gz": 0}
+
+
+def test_precompress_disabled(generate: Generate, out: Path):
+    generate(precompress=["gz"], precompress_min_size=0, nav_summary=True, search_index=True)
+    assert siblings(out, "gz")
+
+    reporter = generate(nav_summary=True, search_index=True)
+
+    assert "Precompressed files written" not in reporter.stats
+    assert not siblings(out, "gz")
+
+
+def test_stale_siblings(generate: Generate, demo_folder: Path, out: Path):
+    generate(precompress=["gz"], precompress_min_size=0)
+    gz = siblings(out, "gz")
+    # Times do not tell stale siblings: they are more recent than the files rewritten below.
+    for sibling in gz.values():
+        os.utime(sibling, ns=(0, sibling.stat().st_mtime_ns + 3600 * 10**9))
+    gz[out / "demo" / "io.json"].write_bytes(b"truncated")
+    write_demo(demo_folder, {"shapes.py": DEMO_FILES["shapes.py"].replace("Computes the area", "Computes the surface")})
+
+    reporter = generate(precompress=["gz"], precompress_min_size=0)
+
+    # `demo.json` changed, the sibling of `demo/io.json` is corrupted.
+    assert reporter.stats["Precompressed files written"] == {"gz": 2}
+    for file_path, sibling in gz.items():
+        assert gzip.decompress(sibling.read_bytes()) == file_path.read_bytes()
+
+
+def test_min_size(generate: Generate, out: Path):
+    generate(precompress=["gz"], precompress_min_size=0)
+    assert siblings(out, "gz")
+
+    reporter = generate(precompress=["gz"], precompress_min_size=10**9)
+
+    assert reporter.stats["Precompressed files written"] == {"gz": 0}
+    assert not siblings(out, "gz")
+
+
+def test_brotli_siblings(generate: Generate, out: Path):
+    brotli = pytest.importorskip("brotli")
+    generate(precompress=["br"], precompress_min_size=0)
+
+    br = siblings(out, "br")
+    assert set(br) == set(out.rglob("*.json"))
+    for file_path, sibling in br.items():
+        assert brotli.decompress(sibling.read_bytes()) == file_path.read_bytes()
+
+
+def test_brotli_missing(generate: Generate, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(mkdocs_py_griffe.pack, "brotli", None)
+
+    with pytest.raises(ValueError, match="brotli"):
+        generate(precompress=["br"])
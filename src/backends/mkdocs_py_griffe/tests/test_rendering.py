@@ -0,0 +1,14 @@
+from pathlib import Path
+
+from conftest import Generate, read_files
+
+
+def test_parallel_rendering_identical(generate: Generate, out: Path, tmp_path: Path):
+    serial = generate(jobs=1)
+    parallel = generate(jobs=4, out=tmp_path / "parallel")
+
+    files = read_files(out)
+    assert {"demo.json", "demo/io.json"} <= set(files)
+    assert read_files(tmp_path / "parallel") == files
+    assert parallel.to_json() == serial.to_json()
+    assert parallel.stats["API files"] == serial.stats["API files"] == {"written": 2, "unchanged": 0}
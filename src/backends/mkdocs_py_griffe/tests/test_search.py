@@ -0,0 +1,68 @@
+import json
+from pathlib import Path
+
+from conftest import Generate, read_files
+
+from mkdocs_py_griffe import SEARCH_STOP_WORDS, search_terms
+
+
+def test_search_terms():
+    # Same text and expected terms as the test of `searchTerms` in the frontend.
+    text = "Parses the docstring of getModulePath, see get_module_path or HTTPServer2 (a __init__ x)."
+
+    assert search_terms(text) == [
+        "parses",
+        "docstring",
+        "getmodulepath",
+        "get",
+        "module",
+        "path",
+        "see",
+        "get_module_path",
+        "get",
+        "module",
+        "path",
+        "httpserver2",
+        "http",
+        "server",
+        "init",
+    ]
+
+
+def shards(search_folder: Path) -> list[dict]:
+    return [json.loads(p.read_text()) for p in (search_folder / "terms").glob("*.json")]
+
+
+def lookup(search_folder: Path, term: str) -> list[int]:
+    shard = json.loads((search_folder / "terms" / f"{term[:2]}.json").read_text())
+    postings = shard["postings"][shard["terms"].index(term)]
+    return postings[0::2]
+
+
+def test_search_index(generate: Generate, out: Path):
+    generate(search_index=True)
+
+    search_folder = out / "search"
+    index = json.loads((search_folder / "index.json").read_text())
+    documents = json.loads((search_folder / "documents" / "0.json").read_text())
+    assert index["stopWords"] == sorted(SEARCH_STOP_WORDS)
+    assert index["documentsCount"] == len(documents)
+    assert {"compute_area", "Square", "read_square"} <= {d["name"] for d in documents}
+
+    read_square = next(i for i, d in enumerate(documents) if d["name"] == "read_square")
+    assert documents[read_square]["url"] == "@nav/api/demo/io.readers.read_square"
+    # The parts of the identifiers are indexed, the documents named after the term come first.
+    assert lookup(search_folder, "read")[0] == read_square
+    assert read_square in lookup(search_folder, "read_square")
+    # Stop words are not indexed ('the' is included in the documentation of all the entities).
+    assert all("the" not in shard["terms"] for shard in shards(search_folder))
+
+
+def test_search_index_incremental(generate: Generate, out: Path):
+    generate(search_index=True)
+    full = read_files(out / "search")
+
+    generate(search_index=True, incremental=True)
+    generate(search_index=True, incremental=True)
+
+    assert read_files(out / "search") == full
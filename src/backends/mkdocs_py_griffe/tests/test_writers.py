@@ -0,0 +1,70 @@
+from pathlib import Path
+
+import pytest
+from conftest import DEMO_FILES, Generate, write_demo
+
+from mkdocs_py_griffe import write_if_changed
+
+
+def mtimes(folder: Path) -> dict[Path, int]:
+    return {p: p.stat().st_mtime_ns for p in folder.rglob("*") if p.is_file()}
+
+
+def test_unchanged_files_not_written(generate: Generate, demo_folder: Path, out: Path):
+    generate()
+    before = mtimes(out)
+    unchanged = generate()
+
+    assert unchanged.stats["API files"] == {"written": 0, "unchanged": 2}
+    assert mtimes(out) == before
+
+    changes = {"shapes.py": DEMO_FILES["shapes.py"].replace("Computes the area", "Computes the surface")}
+    write_demo(demo_folder, changes)
+    changed = generate()
+
+    assert changed.stats["API files"] == {"written": 1, "unchanged": 1}
+    after = mtimes(out)
+    assert after[out / "demo.json"] != before[out / "demo.json"]
+    assert after[out / "demo" / "io.json"] == before[out / "demo" / "io.json"]
+    assert "Computes the surface" in (out / "demo.json").read_text()
+
+
+def test_write_if_changed(tmp_path: Path):
+    target = tmp_path / "folder" / "file.json"
+
+    assert write_if_changed(target, lambda p: p.write_text("foo"))
+    assert not write_if_changed(target, lambda p: p.write_text("foo"))
+    assert write_if_changed(target, lambda p: p.write_text("bar"))
+    assert target.read_text() == "bar"
+    assert [p.name for p in target.parent.iterdir()] == ["file.json"]
+
+
+def test_write_if_changed_failure(tmp_path: Path):
+    target = tmp_path / "file.json"
+    target.write_text("foo")
+
+    def write(file_path: Path):
+        file_path.write_text("partial")
+        raise RuntimeError("Interrupted")
+
+    with pytest.raises(RuntimeError):
+        write_if_changed(target, write)
+    # The target is left untouched, and the temporary file is removed.
+    assert target.read_text() == "foo"
+    assert [p.name for p in tmp_path.iterdir()] == ["file.json"]
+
+
+def test_sidecar_removed_with_siblings(generate: Generate, out: Path):
+    generate(implementations="sidecar", precompress=["gz"], precompress_min_size=0)
+    sidecars = {p.relative_to(out).as_posix() for p in out.rglob("*.implementations.json*")}
+    assert sidecars == {
+        "demo.implementations.json",
+        "demo.implementations.json.gz",
+        "demo/io.implementations.json",
+        "demo/io.implementations.json.gz",
+    }
+
+    generate(implementations="inline", precompress=["gz"], precompress_min_size=0)
+
+    assert not list(out.rglob("*.implementations.json*"))
+    assert {p.relative_to(out).as_posix() for p in out.rglob("*.gz")} == {"demo.json.gz", "demo/io.json.gz"}
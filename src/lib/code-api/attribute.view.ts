@@ -50,6 +50,7 @@ export class AttributeView implements VirtualDOM<'div'> {
                         configuration: this.configuration,
                         parent: this.attribute,
                         project: this.project,
+                        symbols: this.fromModule.symbols,
                     }),
                 ],
             },
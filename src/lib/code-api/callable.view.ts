@@ -42,6 +42,7 @@ export class CallableView implements VirtualDOM<'div'> {
                 configuration: this.configuration,
                 parent: this.callable,
                 project: this.project,
+                symbols: this.fromModule.symbols,
             }),
             { tag: 'div', class: 'mt-3' },
             new DocumentationView({
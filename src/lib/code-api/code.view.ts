@@ -1,10 +1,10 @@
 import { ChildrenLike, VirtualDOM } from '@youwol/rx-vdom'
-import { BehaviorSubject } from 'rxjs'
+import { BehaviorSubject, Observable, of } from 'rxjs'
 import type { Router } from '../index'
 import { Configuration } from './configurations'
 import { Code, Entity, Project } from './models'
 import { DeclarationView } from './declaration.view'
-import { Dependencies } from './index'
+import { Dependencies, fetchImplementation } from './index'
 
 class CodeHeaderView implements VirtualDOM<'div'> {
     public readonly code: Code
@@ -90,15 +90,22 @@ export class CodeView implements VirtualDOM<'div'> {
         router: Router
         configuration: Configuration
         project: Project
+        symbols?: string[]
     }) {
         Object.assign(this, params)
+        const hasImplementation = Boolean(
+            this.code.implementation ||
+                this.code.implementationRef ||
+                this.code.sourceRef,
+        )
         this.children = [
             new DeclarationView({
                 code: this.code,
                 parent: params.parent,
+                symbols: params.symbols,
             }),
             { tag: 'div', class: 'my-1' },
-            this.code.implementation &&
+            hasImplementation &&
                 new CodeHeaderView({
                     code: this.code,
                     parent: params.parent,
@@ -106,7 +113,7 @@ export class CodeView implements VirtualDOM<'div'> {
                     configuration: this.configuration,
                     project: this.project,
                 }),
-            this.code.implementation && {
+            hasImplementation && {
                 source$: this.expanded$,
                 vdomMap: (expanded: boolean) => {
                     if (!expanded) {
@@ -119,17 +126,34 @@ export class CodeView implements VirtualDOM<'div'> {
                             fontSize: '0.8em',
                         },
                         children: [
-                            Dependencies.parseMd({
-                                src: `
+                            {
+                                source$: this.implementation$(),
+                                vdomMap: (implementation: string) =>
+                                    Dependencies.parseMd({
+                                        src: `
 <code-snippet language="javascript">
-${this.code.implementation}
+${implementation}
 </code-snippet>`,
-                                router: this.router,
-                            }),
+                                        router: this.router,
+                                    }),
+                            },
                         ],
                     }
                 },
             },
         ]
     }
+
+    /**
+     * The implementation, fetched only when first displayed if stored in a separate file.
+     */
+    private implementation$(): Observable<string> {
+        if (this.code.implementation) {
+            return of(this.code.implementation)
+        }
+        return fetchImplementation({
+            code: this.code,
+            project: this.project,
+        })
+    }
 }
@@ -69,15 +69,25 @@ export class DeclarationView implements VirtualDOM<'div'> {
     //     fontWeight: 'bolder' as const,
     // }
     public readonly class = 'mkapi-declaration mkapi-semantic-color p-2 rounded'
-    constructor({ code, parent }: { code: Code; parent: Entity }) {
+    constructor({
+        code,
+        parent,
+        symbols,
+    }: {
+        code: Code
+        parent: Entity
+        symbols?: string[]
+    }) {
         // const separators = /[[\],<>@.():;]/g
         this.class += ` mkapi-role-${parent.semantic.role}`
         const nonNullReferences = Object.entries(code.references).reduce(
             (acc, [k, v]) => {
-                if (!v) {
+                // References may be indexes in the module's symbols table (`0` being a valid index).
+                const url = typeof v === 'number' ? symbols?.[v] : v
+                if (!url) {
                     return acc
                 }
-                return { ...acc, [k]: v }
+                return { ...acc, [k]: url }
             },
             {},
         )
@@ -21,14 +21,28 @@ export * from './configurations'
 export * from './documentation.view'
 export * from './models'
 export * from './module.view'
+export * from './search'
 export * from './utils'
 
-import { combineLatest, map, Observable } from 'rxjs'
+import {
+    combineLatest,
+    from,
+    map,
+    mergeMap,
+    Observable,
+    shareReplay,
+} from 'rxjs'
 import { ModuleView } from './module.view'
 import { AnyVirtualDOM } from '@youwol/rx-vdom'
 import { Configuration } from './configurations'
 import { request$, raiseHTTPErrors } from '@youwol/http-primitives'
-import { Module, Project } from './models'
+import {
+    Code,
+    Module,
+    ModuleShard,
+    ModuleSummary,
+    Project,
+} from './models'
 import { install } from '@youwol/webpm-client'
 import type { Decoration, Navigation, Router, Views } from '../index'
 import type { installNotebookModule } from '../../index'
@@ -65,13 +79,228 @@ export function fetchModuleDoc({
     configuration: Configuration
     project: Project
 }): Observable<Module> {
-    const assetPath = `${basePath}/${modulePath}.json`
+    const module$ = project.pack
+        ? fetchPackedFile<Module>({ file: `${modulePath}.json`, project })
+        : fetchApiFile<Module>(`${basePath}/${modulePath}.json`)
     return combineLatest([
-        request$<Module>(new Request(assetPath)).pipe(raiseHTTPErrors()),
+        module$,
         install({
             css: [configuration.css(project)],
         }),
-    ]).pipe(map(([mdle]) => mdle))
+    ]).pipe(map(([mdle]) => resolveModuleSources(mdle)))
+}
+
+/**
+ * Fetches an API file.
+ *
+ * @param assetPath URL of the file.
+ * @returns The decoded content.
+ */
+export function fetchApiFile<T>(assetPath: string): Observable<T> {
+    return request$<T>(new Request(assetPath)).pipe(raiseHTTPErrors())
+}
+
+/**
+ * Index of a pack file, see {@link fetchPackedFile}.
+ */
+export interface PackIndex {
+    /**
+     * Path of the pack file, relative to {@link Project.docBasePath}.
+     */
+    pack: string
+    /**
+     * `[offset, length]` of the API files in the pack, keyed by their path relative to {@link Project.docBasePath}.
+     */
+    files: { [file: string]: [number, number] }
+}
+
+const packIndexes: { [basePath: string]: Observable<PackIndex> } = {}
+
+/**
+ * Fetches an API file from the pack of a project (see {@link Project.pack}), using an HTTP range request.
+ *
+ * The pack's index is fetched once, when the first file is requested. If the server does not support range
+ * requests, the file is extracted from the whole pack.
+ *
+ * @param params
+ * @param params.file Path of the API file, relative to {@link Project.docBasePath}.
+ * @param params.project The project.
+ * @returns The decoded content.
+ */
+export function fetchPackedFile<T>({
+    file,
+    project,
+}: {
+    file: string
+    project: Project
+}): Observable<T> {
+    const basePath = project.docBasePath
+    if (!packIndexes[basePath]) {
+        packIndexes[basePath] = fetchApiFile<PackIndex>(
+            `${basePath}/api.pack-index.json`,
+        ).pipe(shareReplay({ bufferSize: 1, refCount: false }))
+    }
+    return packIndexes[basePath].pipe(
+        mergeMap((index) => {
+            if (!index.files[file]) {
+                throw Error(
+                    `${file} is not included in the pack of ${basePath}`,
+                )
+            }
+            const [offset, length] = index.files[file]
+            const packPath = `${basePath}/${index.pack}`
+            const request = fetch(packPath, {
+                headers: { Range: `bytes=${offset}-${offset + length - 1}` },
+            }).then((response) => {
+                if (!response.ok) {
+                    throw Error(
+                        `Failed to fetch ${packPath}: ${response.status} ${response.statusText}`,
+                    )
+                }
+                return response.status === 206
+                    ? response.arrayBuffer()
+                    : response
+                          .arrayBuffer()
+                          .then((buffer) =>
+                              buffer.slice(offset, offset + length),
+                          )
+            })
+            return from(request)
+        }),
+        map((buffer) => JSON.parse(new TextDecoder().decode(buffer)) as T),
+    )
+}
+
+const sidecarFiles: {
+    [assetPath: string]: Observable<{ [key: string]: string }>
+} = {}
+
+/**
+ * Returns the lines of a source spanning an entity's code.
+ *
+ * @param source The source of the file including the entity.
+ * @param code The entity's code.
+ * @returns The entity's implementation.
+ */
+export function sliceSource(source: string, code: Code): string {
+    return source
+        .split('\n')
+        .slice(code.startLine - 1, code.endLine)
+        .join('\n')
+}
+
+/**
+ * Fetches an implementation stored in a separate file, either directly (see {@link Code.implementationRef}) or as
+ * part of the source of its file (see {@link Code.sourceRef}).
+ *
+ * The files are fetched once, when the first of their implementations is requested.
+ *
+ * @param params
+ * @param params.code The entity's code.
+ * @param params.project The project.
+ * @returns The implementation.
+ */
+export function fetchImplementation({
+    code,
+    project,
+}: {
+    code: Code
+    project: Project
+}): Observable<string> {
+    const ref = code.implementationRef ?? code.sourceRef
+    const separator = ref.indexOf('#')
+    const file = ref.slice(0, separator)
+    const assetPath = `${project.docBasePath}/${file}`
+    const key = ref.slice(separator + 1)
+    if (!sidecarFiles[assetPath]) {
+        const file$ = project.pack
+            ? fetchPackedFile<{ [key: string]: string }>({ file, project })
+            : fetchApiFile<{ [key: string]: string }>(assetPath)
+        sidecarFiles[assetPath] = file$.pipe(
+            shareReplay({ bufferSize: 1, refCount: false }),
+        )
+    }
+    return sidecarFiles[assetPath].pipe(
+        map((entries) =>
+            code.implementationRef
+                ? entries[key]
+                : sliceSource(entries[key], code),
+        ),
+    )
+}
+
+/**
+ * Resolves the implementations of a module's entities referencing the sources included in the module
+ * (see {@link Module.sources}).
+ *
+ * @param module The module, its entities' codes are updated in place.
+ * @param shard The shard including the entities to resolve, if they are not included in the module
+ * (see {@link Module.shards}).
+ * @returns The module.
+ */
+export function resolveModuleSources(
+    module: Module,
+    shard: ModuleShard = module,
+): Module {
+    if (!module.sources) {
+        return module
+    }
+    const entities = [
+        ...shard.types.flatMap((t) => [t, ...t.callables, ...t.attributes]),
+        ...shard.callables,
+        ...shard.attributes,
+    ]
+    const lines: { [filePath: string]: string[] } = {}
+    entities
+        .filter((e) => e.code.sourceRef?.startsWith('#'))
+        .forEach((e) => {
+            const filePath = e.code.sourceRef.slice(1)
+            if (!lines[filePath]) {
+                lines[filePath] = module.sources[filePath].split('\n')
+            }
+            e.code.implementation = lines[filePath]
+                .slice(e.code.startLine - 1, e.code.endLine)
+                .join('\n')
+        })
+    return module
+}
+
+const moduleShards: { [assetPath: string]: Observable<ModuleShard> } = {}
+
+/**
+ * Fetches a shard of a module's entities (see {@link Module.shards}).
+ *
+ * The shards are fetched once, when the first of their entities is requested.
+ *
+ * @param params
+ * @param params.shard Path of the shard, relative to {@link Project.docBasePath}.
+ * @param params.module The module.
+ * @param params.project The project.
+ * @returns The shard.
+ */
+export function fetchModuleShard({
+    shard,
+    module,
+    project,
+}: {
+    shard: string
+    module: Module
+    project: Project
+}): Observable<ModuleShard> {
+    const assetPath = `${project.docBasePath}/${shard}`
+    if (!moduleShards[assetPath]) {
+        const shard$ = project.pack
+            ? fetchPackedFile<ModuleShard>({ file: shard, project })
+            : fetchApiFile<ModuleShard>(assetPath)
+        moduleShards[assetPath] = shard$.pipe(
+            map((moduleShard) => {
+                resolveModuleSources(module, moduleShard)
+                return moduleShard
+            }),
+            shareReplay({ bufferSize: 1, refCount: false }),
+        )
+    }
+    return moduleShards[assetPath]
 }
 
 export const docNode: ({
@@ -117,6 +346,40 @@ export const docNode: ({
             }),
     },
 })
+const navSummaries: {
+    [basePath: string]: Observable<{ [modulePath: string]: ModuleSummary }>
+} = {}
+
+/**
+ * Fetches the summary of the modules' tree of a project (see {@link Project.navSummary}), fetched once.
+ *
+ * @param project The project.
+ * @returns The summaries of the modules, keyed by their path in the navigation (*e.g.* `foo/bar`).
+ */
+export function fetchNavSummary(
+    project: Project,
+): Observable<{ [modulePath: string]: ModuleSummary }> {
+    const basePath = project.docBasePath
+    if (!navSummaries[basePath]) {
+        const assetPath = `${basePath}/api.nav.json`
+        navSummaries[basePath] = fetchApiFile<ModuleSummary>(assetPath).pipe(
+            map((root) => {
+                const summaries: { [modulePath: string]: ModuleSummary } = {}
+                const index = (summary: ModuleSummary, modulePath: string) => {
+                    summaries[modulePath] = summary
+                    summary.children.forEach((child) =>
+                        index(child, `${modulePath}/${child.name}`),
+                    )
+                }
+                index(root, project.name)
+                return summaries
+            }),
+            shareReplay({ bufferSize: 1, refCount: false }),
+        )
+    }
+    return navSummaries[basePath]
+}
+
 export const docNavigation = ({
     modulePath,
     router,
@@ -134,35 +397,62 @@ export const docNavigation = ({
     if (!modulePath.startsWith(project.name)) {
         modulePath = `${project.name}/${modulePath}`
     }
-    return fetchModuleDoc({
-        modulePath,
-        basePath: project.docBasePath,
-        configuration,
-        project,
-    }).pipe(
+    const children = (modules: { name: string; isLeaf: boolean }[]) =>
+        modules?.length > 0
+            ? modules.map((m) => ({
+                  name: m.name,
+                  leaf: m.isLeaf,
+                  id: m.name,
+                  decoration: {
+                      icon: {
+                          tag: 'i' as const,
+                          class: 'mkapi-semantic-flag mkapi-role-module',
+                      },
+                  },
+              }))
+            : []
+    const tableOfContent = (d: { html: HTMLElement; router: Router }) =>
+        Dependencies.Views.tocView({
+            ...d,
+            domConvertor: tocConvertor,
+        })
+    const module$ = () =>
+        fetchModuleDoc({
+            modulePath,
+            basePath: project.docBasePath,
+            configuration,
+            project,
+        })
+    if (project.navSummary) {
+        // The module's API file is only fetched when its page is displayed.
+        return fetchNavSummary(project).pipe(
+            map((summaries) => {
+                return {
+                    children: children(summaries[modulePath]?.children),
+                    html: () =>
+                        module$().pipe(
+                            map(
+                                (module) =>
+                                    new ModuleView({
+                                        module,
+                                        router,
+                                        configuration,
+                                        project,
+                                    }),
+                            ),
+                        ),
+                    tableOfContent,
+                }
+            }),
+        )
+    }
+    return module$().pipe(
         map((module) => {
             return {
-                children:
-                    module.children?.length > 0
-                        ? module.children.map((m) => ({
-                              name: m.name,
-                              leaf: m.isLeaf,
-                              id: m.name,
-                              decoration: {
-                                  icon: {
-                                      tag: 'i' as const,
-                                      class: 'mkapi-semantic-flag mkapi-role-module',
-                                  },
-                              },
-                          }))
-                        : [],
+                children: children(module.children),
                 html: () =>
                     new ModuleView({ module, router, configuration, project }),
-                tableOfContent: (d: { html: HTMLElement; router: Router }) =>
-                    Dependencies.Views.tocView({
-                        ...d,
-                        domConvertor: tocConvertor,
-                    }),
+                tableOfContent,
             }
         }),
     )
@@ -174,10 +464,14 @@ export function codeApiEntryNode(params: {
     docBasePath: string
     entryModule: string
     configuration: Configuration
+    pack?: boolean
+    navSummary?: boolean
 }) {
     const project = {
         name: params.entryModule,
         docBasePath: params.docBasePath,
+        pack: params.pack,
+        navSummary: params.navSummary,
     }
     const configuration = params.configuration
     return {
@@ -57,6 +57,23 @@ export interface Code {
      * Optional associated implementation.
      */
     implementation?: string
+    /**
+     * Reference of the implementation when stored in a separate file rather than in {@link implementation},
+     * formatted as `{file}#{key}`: `file` is the path of the file (relative to {@link Project.docBasePath}) mapping
+     * keys to implementations.
+     *
+     * See {@link fetchImplementation}.
+     */
+    implementationRef?: string
+    /**
+     * Reference of the source of the file including the entity, when the implementation is given by the lines
+     * {@link startLine} to {@link endLine} of this source. It is formatted as `{file}#{filePath}`: `file` is the
+     * path of the file (relative to {@link Project.docBasePath}) mapping files' paths to sources, or is empty when
+     * the sources are included in the module ({@link Module.sources}).
+     *
+     * See {@link fetchImplementation}.
+     */
+    sourceRef?: string
     /**
      * File path in which the declaration is included.
      */
@@ -71,9 +88,9 @@ export interface Code {
     endLine: number
 
     /**
-     * References to other entities in the declaration.
+     * References to other entities in the declaration, either their URL or its index in {@link Module.symbols}.
      */
-    references: { [name: string]: EntityPath }
+    references: { [name: string]: EntityPath | number }
 }
 
 /**
@@ -185,6 +202,102 @@ export interface ChildModule {
     isLeaf: boolean
 }
 
+/**
+ * Summary of a module within the navigation tree, see {@link fetchNavSummary}.
+ */
+export interface ModuleSummary {
+    /**
+     * Name.
+     */
+    name: string
+    /**
+     * Path (*e.g.* `ModuleFoo.ModuleBar`).
+     */
+    path: EntityPath
+    /**
+     * Whether it includes children modules.
+     */
+    isLeaf: boolean
+    /**
+     * First line of the module's docstring (empty if none).
+     */
+    summary: string
+    /**
+     * Children modules.
+     */
+    children: ModuleSummary[]
+}
+
+/**
+ * Entity referenced by the search index, see {@link searchApi}.
+ */
+export interface SearchDocument {
+    /**
+     * Name.
+     */
+    name: string
+    /**
+     * The path (e.g. `ModuleFoo.TypeBar.attrBaz`).
+     */
+    path: EntityPath
+    /**
+     * Role of the entity's semantic (*e.g.* `class`, `function`).
+     */
+    role: string
+    /**
+     * Navigation URL of the entity.
+     */
+    url?: string
+    /**
+     * First line of the entity's documentation (empty if none).
+     */
+    summary: string
+}
+
+/**
+ * Reference of an entity of a module written in a separate shard file (see {@link Module.shards}).
+ */
+export interface ShardEntry {
+    /**
+     * Name of the entity.
+     */
+    name: string
+    /**
+     * Path of the entity, its view's anchor is available before the shard is fetched.
+     */
+    path: string
+    /**
+     * Kind of the entity.
+     */
+    kind: 'type' | 'callable' | 'attribute'
+    /**
+     * File path in which the entity is declared.
+     */
+    filePath: string
+    /**
+     * Path of the shard file including the entity (relative to {@link Project.docBasePath}).
+     */
+    shard: string
+}
+
+/**
+ * Shard of a module's entities, see {@link Module.shards}.
+ */
+export interface ModuleShard {
+    /**
+     * Types components.
+     */
+    types: Type[]
+    /**
+     * Callable components.
+     */
+    callables: Callable[]
+    /**
+     * Attributes components.
+     */
+    attributes: Attribute[]
+}
+
 /**
  * Module representation.
  */
@@ -209,6 +322,20 @@ export type Module = Omit<Entity, 'code'> & {
      * Files components.
      */
     files: File[]
+    /**
+     * Sources of the module's files (keyed by their path) when the implementations refer to them,
+     * see {@link Code.sourceRef}.
+     */
+    sources?: { [filePath: string]: string }
+    /**
+     * URLs referenced by the entities of the module when {@link Code.references} refer to them by index.
+     */
+    symbols?: string[]
+    /**
+     * References of the module's entities when they are written in separate shard files
+     * (see {@link fetchModuleShard}), {@link types}, {@link callables} and {@link attributes} are then empty.
+     */
+    shards?: ShardEntry[]
 }
 
 /**
@@ -223,4 +350,14 @@ export type Project = {
      * The base path of the corresponding node in the documentation.
      */
     docBasePath: string
+    /**
+     * Whether the API files are fetched from the project's pack file (see {@link fetchPackedFile}) rather than
+     * separately.
+     */
+    pack?: boolean
+    /**
+     * Whether the navigation is built from the summary of the modules' tree (see {@link fetchNavSummary}) rather
+     * than from the modules' API files.
+     */
+    navSummary?: boolean
 }
@@ -1,4 +1,18 @@
-import { AnyVirtualDOM, ChildrenLike, VirtualDOM } from '@youwol/rx-vdom'
+import {
+    AnyVirtualDOM,
+    ChildrenLike,
+    RxHTMLElement,
+    VirtualDOM,
+} from '@youwol/rx-vdom'
+import {
+    BehaviorSubject,
+    debounceTime,
+    filter,
+    merge,
+    ReplaySubject,
+    switchMap,
+    take,
+} from 'rxjs'
 import { Configuration } from './configurations'
 import { TypeView } from './type.view'
 import { DocumentationView } from './documentation.view'
@@ -7,7 +21,17 @@ import { HeaderView } from './header.view'
 import { AttributeView } from './attribute.view'
 import type { Router } from '../index'
 import { separatorView, ySeparatorView5 } from './utils'
-import { Entity, Module, Project } from './models'
+import {
+    Attribute,
+    Callable,
+    Entity,
+    Module,
+    ModuleShard,
+    Project,
+    ShardEntry,
+    Type,
+} from './models'
+import { Dependencies, fetchModuleShard } from './index'
 
 /**
  * View for a {@link Module}.
@@ -40,16 +64,65 @@ export class ModuleView implements VirtualDOM<'div'> {
         const getFile = (entity: Entity) => {
             return entity.code.filePath
         }
+        const shards = this.module.shards ?? []
         const files = [
-            ...new Set(
-                [
+            ...new Set([
+                ...[
                     ...this.module.attributes,
                     ...this.module.callables,
                     ...this.module.types,
                 ].map(getFile),
-            ),
+                ...shards.map((entry) => entry.filePath),
+            ]),
         ].sort((a: string, b: string) => a.localeCompare(b))
 
+        const attributeView = (attribute: Attribute) =>
+            new AttributeView({
+                fromModule: this.module,
+                attribute,
+                router: this.router,
+                configuration: this.configuration,
+                project: this.project,
+            })
+        const callableView = (callable: Callable) =>
+            new CallableView({
+                callable,
+                router: this.router,
+                configuration: this.configuration,
+                project: this.project,
+                fromModule: this.module,
+            })
+        const typeView = (type: Type) =>
+            new TypeView({
+                fromModule: this.module,
+                type,
+                router: this.router,
+                configuration: this.configuration,
+                project: this.project,
+            })
+        // Entities written in shards are displayed once their shard is fetched,
+        // independently of the others (see ShardedEntityView).
+        const shardedViews = <T extends Entity>(
+            kind: ShardEntry['kind'],
+            file: string,
+            select: (shard: ModuleShard) => T[],
+            view: (entity: T) => AnyVirtualDOM,
+        ): AnyVirtualDOM[] =>
+            shards
+                .filter((e) => e.kind === kind && e.filePath === file)
+                .map((entry): AnyVirtualDOM[] => [
+                    new ShardedEntityView({
+                        entry,
+                        select,
+                        view,
+                        module: this.module,
+                        router: this.router,
+                        project: this.project,
+                    }),
+                    ySeparatorView5,
+                ])
+                .flat()
+
         this.children = [
             new HeaderView({
                 tag: 'h1',
@@ -103,48 +176,54 @@ export class ModuleView implements VirtualDOM<'div'> {
                         }),
                         {
                             tag: 'div',
-                            children: attributes
-                                .map((attribute) => [
-                                    new AttributeView({
-                                        fromModule: this.module,
-                                        attribute,
-                                        router: this.router,
-                                        configuration: this.configuration,
-                                        project: this.project,
-                                    }),
-                                    ySeparatorView5,
-                                ])
-                                .flat(),
+                            children: [
+                                ...attributes
+                                    .map((attribute) => [
+                                        attributeView(attribute),
+                                        ySeparatorView5,
+                                    ])
+                                    .flat(),
+                                ...shardedViews(
+                                    'attribute',
+                                    file,
+                                    (shard) => shard.attributes,
+                                    attributeView,
+                                ),
+                            ],
                         },
                         {
                             tag: 'div',
-                            children: callables
-                                .map((callable) => [
-                                    new CallableView({
-                                        callable,
-                                        router: this.router,
-                                        configuration: this.configuration,
-                                        project: this.project,
-                                        fromModule: this.module,
-                                    }),
-                                    ySeparatorView5,
-                                ])
-                                .flat(),
+                            children: [
+                                ...callables
+                                    .map((callable) => [
+                                        callableView(callable),
+                                        ySeparatorView5,
+                                    ])
+                                    .flat(),
+                                ...shardedViews(
+                                    'callable',
+                                    file,
+                                    (shard) => shard.callables,
+                                    callableView,
+                                ),
+                            ],
                         },
                         {
                             tag: 'div',
-                            children: types
-                                .map((type) => [
-                                    new TypeView({
-                                        fromModule: this.module,
-                                        type,
-                                        router: this.router,
-                                        configuration: this.configuration,
-                                        project: this.project,
-                                    }),
-                                    ySeparatorView5,
-                                ])
-                                .flat(),
+                            children: [
+                                ...types
+                                    .map((type) => [
+                                        typeView(type),
+                                        ySeparatorView5,
+                                    ])
+                                    .flat(),
+                                ...shardedViews(
+                                    'type',
+                                    file,
+                                    (shard) => shard.types,
+                                    typeView,
+                                ),
+                            ],
                         },
                     ],
                 }
@@ -152,3 +231,114 @@ export class ModuleView implements VirtualDOM<'div'> {
         ]
     }
 }
+
+/**
+ * View of an entity written in a shard file (see {@link Module.shards}).
+ *
+ * The entity's heading is rendered right away: its anchor and its entry in the table of content exist at first
+ * render. The shard is fetched when the view stays in the viewport, or immediately if the entity (or one of its
+ * members) is the section targeted by the current page's URL.
+ */
+export class ShardedEntityView<T extends Entity> implements VirtualDOM<'div'> {
+    public readonly entry: ShardEntry
+    public readonly module: Module
+    public readonly router: Router
+    public readonly project: Project
+    public readonly select: (shard: ModuleShard) => T[]
+    public readonly view: (entity: T) => AnyVirtualDOM
+    public readonly tag = 'div'
+    public readonly children: ChildrenLike
+    public readonly connectedCallback: (elem: RxHTMLElement<'div'>) => void
+    public readonly disconnectedCallback: (elem: RxHTMLElement<'div'>) => void
+
+    /**
+     * Create the VirtualDOM.
+     *
+     * @param params Arguments
+     * @param params.entry Reference of the entity in the module.
+     * @param params.module Model of the module.
+     * @param params.router Router of the application.
+     * @param params.project Project.
+     * @param params.select Selects the entities of the entry's kind in the shard.
+     * @param params.view Creates the view of the entity.
+     */
+    constructor(params: {
+        entry: ShardEntry
+        module: Module
+        router: Router
+        project: Project
+        select: (shard: ModuleShard) => T[]
+        view: (entity: T) => AnyVirtualDOM
+    }) {
+        Object.assign(this, params)
+        const header = new HeaderView({
+            tag: 'h3',
+            withClass: '',
+            doc: { name: this.entry.name, path: this.entry.path },
+            relativeToPath: this.module.path,
+        })
+        const anchor = header.id.replace(Dependencies.headingPrefixId, '')
+        const target$ = new ReplaySubject<string | undefined>(1)
+        const inViewport$ = new BehaviorSubject<boolean>(false)
+        const observer = new IntersectionObserver((entries) => {
+            inViewport$.next(entries.some((entry) => entry.isIntersecting))
+        })
+        const load$ = merge(
+            target$.pipe(filter((target) => target !== undefined)),
+            // Entities only crossed while scrolling (e.g. towards an anchor) are not loaded.
+            inViewport$.pipe(debounceTime(200), filter((visible) => visible)),
+        ).pipe(take(1))
+
+        this.children = [
+            {
+                source$: load$.pipe(
+                    switchMap(() =>
+                        fetchModuleShard({
+                            shard: this.entry.shard,
+                            module: this.module,
+                            project: this.project,
+                        }),
+                    ),
+                ),
+                vdomMap: (shard: ModuleShard): AnyVirtualDOM => ({
+                    tag: 'div',
+                    children: [
+                        this.view(
+                            this.select(shard).find(
+                                (e) => e.name === this.entry.name,
+                            ),
+                        ),
+                    ],
+                    connectedCallback: () => {
+                        observer.disconnect()
+                        target$.pipe(take(1)).subscribe((target) => {
+                            // The anchors of the entity's members only exist now.
+                            if (target !== undefined && target !== anchor) {
+                                this.router.scrollTo(target)
+                            }
+                        })
+                    },
+                }),
+                untilFirst: header,
+            },
+        ]
+        this.connectedCallback = (elem: RxHTMLElement<'div'>) => {
+            elem.ownSubscriptions(
+                this.router.currentPage$
+                    .pipe(take(1))
+                    .subscribe(({ sectionId }) =>
+                        target$.next(
+                            sectionId === anchor ||
+                                sectionId?.startsWith(`${anchor}.`)
+                                ? sectionId
+                                : undefined,
+                        ),
+                    ),
+            )
+            observer.observe(elem)
+        }
+        this.disconnectedCallback = () => {
+            observer.disconnect()
+        }
+    }
+}
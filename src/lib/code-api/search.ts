@@ -0,0 +1,274 @@
+/**
+ * Client-side search within the index generated along with the API files (see the `search_index` option of the
+ * python backend).
+ *
+ * The index is sharded by the first characters of the terms: a query only fetches the shards of its terms, and the
+ * files of the documents returned.
+ */
+import { combineLatest, map, mergeMap, Observable, of, shareReplay } from 'rxjs'
+import { fetchApiFile } from './index'
+import { Project, SearchDocument } from './models'
+
+/**
+ * Description of the search index.
+ */
+export interface SearchIndex {
+    /**
+     * Version of the index's format.
+     */
+    version: number
+    /**
+     * Length of the terms' prefixes defining the shards.
+     */
+    prefixLength: number
+    /**
+     * Words not indexed, see {@link searchTerms}.
+     */
+    stopWords: string[]
+    /**
+     * Number of documents per documents' file.
+     */
+    documentsChunkSize: number
+    /**
+     * Total number of documents.
+     */
+    documentsCount: number
+    /**
+     * Prefixes of the shards.
+     */
+    shards: string[]
+}
+
+/**
+ * Shard of the search index, including the terms starting with its prefix.
+ */
+export interface SearchShard {
+    /**
+     * The terms, sorted.
+     */
+    terms: string[]
+    /**
+     * For each term, the flattened pairs `documentId, weight` sorted by decreasing weights.
+     */
+    postings: number[][]
+}
+
+/**
+ * Result of a search.
+ */
+export interface SearchResult {
+    /**
+     * The document.
+     */
+    document: SearchDocument
+    /**
+     * Its score.
+     */
+    score: number
+}
+
+const searchFiles: { [assetPath: string]: Observable<unknown> } = {}
+
+function fetchSearchFile<T>(project: Project, file: string): Observable<T> {
+    const assetPath = `${project.docBasePath}/search/${file}.json`
+    if (!searchFiles[assetPath]) {
+        searchFiles[assetPath] = fetchApiFile<T>(assetPath).pipe(
+            shareReplay({ bufferSize: 1, refCount: false }),
+        )
+    }
+    return searchFiles[assetPath] as Observable<T>
+}
+
+const searchWord = /[A-Za-z_][A-Za-z0-9_]*/g
+const searchWordPart = /[A-Z]+(?![a-z])|[A-Z]?[a-z]+|[0-9]+/g
+
+function normalizedTerms(candidates: string[], stopWords: string[]) {
+    return candidates
+        .map((candidate) => candidate.toLowerCase().replace(/^_+|_+$/g, ''))
+        .filter(
+            (term) =>
+                term.length > 1 &&
+                term.length <= 64 &&
+                !stopWords.includes(term),
+        )
+}
+
+/**
+ * Returns the terms of a text, following the rules of the function `search_terms` of the python backend used to
+ * index the documents: its lower-cased words (including identifiers), each followed by its parts if any
+ * (*e.g.* `get_module_path`, `get`, `module` and `path` for `get_module_path`). Terms of one character, of more
+ * than 64 characters, or in the stop words are excluded.
+ *
+ * @param text The text.
+ * @param stopWords The words not indexed (see {@link SearchIndex.stopWords}).
+ * @returns The terms.
+ */
+export function searchTerms(text: string, stopWords: string[]): string[] {
+    return (text.match(searchWord) ?? []).flatMap((word) => {
+        const parts = word.match(searchWordPart) ?? []
+        return normalizedTerms(
+            parts.length > 1 ? [...new Set([word, ...parts])] : [word],
+            stopWords,
+        )
+    })
+}
+
+/**
+ * Returns the terms of a query (see {@link searchTerms}), all of them have to match a document.
+ *
+ * Identifiers are replaced by their parts: those are indexed for all the occurrences of an identifier, whatever
+ * its case convention (*e.g.* `getModulePath` matches `get_module_path`).
+ *
+ * @param query The query.
+ * @param stopWords The words not indexed (see {@link SearchIndex.stopWords}).
+ * @returns The terms, without duplicates.
+ */
+export function searchQueryTerms(
+    query: string,
+    stopWords: string[],
+): string[] {
+    const terms = (query.match(searchWord) ?? []).flatMap((word) => {
+        const parts = word.match(searchWordPart) ?? []
+        return normalizedTerms(parts.length > 1 ? parts : [word], stopWords)
+    })
+    return [...new Set(terms)]
+}
+
+function lowerBound(terms: string[], term: string): number {
+    let low = 0
+    let high = terms.length
+    while (low < high) {
+        const middle = (low + high) >> 1
+        if (terms[middle] < term) {
+            low = middle + 1
+        } else {
+            high = middle
+        }
+    }
+    return low
+}
+
+/**
+ * Collects the weights of the documents including a term starting with a given prefix: the weights of the terms
+ * equal to the prefix are counted fully, the others by half.
+ */
+function matchPrefix(
+    shard: SearchShard,
+    prefix: string,
+    scores: Map<number, number>,
+) {
+    for (
+        let i = lowerBound(shard.terms, prefix);
+        i < shard.terms.length && shard.terms[i].startsWith(prefix);
+        i++
+    ) {
+        const factor = shard.terms[i] === prefix ? 1 : 0.5
+        const postings = shard.postings[i]
+        for (let j = 0; j < postings.length; j += 2) {
+            const weight = postings[j + 1] * factor
+            scores.set(
+                postings[j],
+                Math.max(scores.get(postings[j]) ?? 0, weight),
+            )
+        }
+    }
+}
+
+/**
+ * Searches the entities of a project, the terms of the query are matched as prefixes, and all of them must
+ * match.
+ *
+ * Only the shards of the query's terms are fetched (once), as well as the files including the documents returned.
+ *
+ * @param params
+ * @param params.query The query, *e.g.* `parse docstring`.
+ * @param params.project The project.
+ * @param params.limit Maximum number of results.
+ * @returns The results, by decreasing scores.
+ */
+export function searchApi({
+    query,
+    project,
+    limit = 20,
+}: {
+    query: string
+    project: Project
+    limit?: number
+}): Observable<SearchResult[]> {
+    return fetchSearchFile<SearchIndex>(project, 'index').pipe(
+        mergeMap((index) => {
+            const terms = searchQueryTerms(query, index.stopWords)
+            if (terms.length === 0) {
+                return of([])
+            }
+            const matches$ = terms.map((term) => {
+                const shards = index.shards.filter((prefix) =>
+                    term.length >= index.prefixLength
+                        ? prefix === term.slice(0, index.prefixLength)
+                        : prefix.startsWith(term),
+                )
+                if (shards.length === 0) {
+                    return of(new Map<number, number>())
+                }
+                return combineLatest(
+                    shards.map((prefix) =>
+                        fetchSearchFile<SearchShard>(
+                            project,
+                            `terms/${prefix}`,
+                        ),
+                    ),
+                ).pipe(
+                    map((loaded) => {
+                        const scores = new Map<number, number>()
+                        loaded.forEach((shard) =>
+                            matchPrefix(shard, term, scores),
+                        )
+                        return scores
+                    }),
+                )
+            })
+            return combineLatest(matches$).pipe(
+                map((matches) => {
+                    const [first, ...others] = matches
+                    return [...first.entries()]
+                        .filter(([id]) => others.every((m) => m.has(id)))
+                        .map(([id, score]): [number, number] => [
+                            id,
+                            others.reduce((acc, m) => acc + m.get(id), score),
+                        ])
+                        .sort((a, b) => b[1] - a[1] || a[0] - b[0])
+                        .slice(0, limit)
+                }),
+                mergeMap((top) => {
+                    if (top.length === 0) {
+                        return of([])
+                    }
+                    const size = index.documentsChunkSize
+                    const chunks = [
+                        ...new Set(top.map(([id]) => Math.floor(id / size))),
+                    ]
+                    return combineLatest(
+                        chunks.map((chunk) =>
+                            fetchSearchFile<SearchDocument[]>(
+                                project,
+                                `documents/${chunk}`,
+                            ),
+                        ),
+                    ).pipe(
+                        map((documents) => {
+                            const byChunk = new Map<number, SearchDocument[]>(
+                                chunks.map((chunk, i) => [chunk, documents[i]]),
+                            )
+                            return top.map(([id, score]) => ({
+                                document: byChunk.get(Math.floor(id / size))[
+                                    id % size
+                                ],
+                                score,
+                            }))
+                        }),
+                    )
+                }),
+            )
+        }),
+    )
+}
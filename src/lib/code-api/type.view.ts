@@ -42,6 +42,7 @@ export class TypeView implements VirtualDOM<'div'> {
                 configuration: this.configuration,
                 parent: this.type,
                 project: this.project,
+                symbols: this.fromModule.symbols,
             }),
             { tag: 'div', class: 'mt-3' },
             new DocumentationView({
@@ -1,4 +1,17 @@
+import { render } from '@youwol/rx-vdom'
+import { BehaviorSubject, Subject } from 'rxjs'
+import type { Router } from '../lib'
 import { processDeclaration } from '../lib/code-api/declaration.view'
+import * as codeApi from '../lib/code-api/index'
+import {
+    Attribute,
+    Module,
+    ModuleShard,
+    Project,
+    ShardEntry,
+} from '../lib/code-api/models'
+import { ShardedEntityView } from '../lib/code-api/module.view'
+import { searchQueryTerms, searchTerms } from '../lib/code-api/search'
 
 test('declaration view', () => {
     let declaration = `This is a word1, this is (word2), yet a word3\n among other words like word1word2.`
@@ -24,3 +37,123 @@ test('declaration view', () => {
         'This a &lt;word1:@nav/api/word1&gt; in html element.',
     )
 })
+
+test('search terms', () => {
+    // The stop words of the text (among those of the python backend).
+    const stopWords = ['a', 'of', 'or', 'the']
+    // Same text and expected terms as the test of `search_terms` in the python backend.
+    const text =
+        'Parses the docstring of getModulePath, see get_module_path or HTTPServer2 (a __init__ x).'
+    expect(searchTerms(text, stopWords)).toEqual([
+        'parses',
+        'docstring',
+        'getmodulepath',
+        'get',
+        'module',
+        'path',
+        'see',
+        'get_module_path',
+        'get',
+        'module',
+        'path',
+        'httpserver2',
+        'http',
+        'server',
+        'init',
+    ])
+    // The terms of a query are included in the terms indexed for the identifier, whatever its case convention.
+    const indexed = searchTerms('get_module_path', stopWords)
+    ;['the getModulePath', 'get_module_path', 'GetModulePath'].forEach(
+        (query) => {
+            const terms = searchQueryTerms(query, stopWords)
+            expect(terms).toEqual(['get', 'module', 'path'])
+            terms.forEach((term) => expect(indexed).toContain(term))
+        },
+    )
+})
+
+class IntersectionObserverMock {
+    static instances: IntersectionObserverMock[] = []
+    constructor(public readonly callback: IntersectionObserverCallback) {
+        IntersectionObserverMock.instances.push(this)
+    }
+    observe() {}
+    disconnect() {}
+    intersect() {
+        this.callback(
+            [{ isIntersecting: true } as IntersectionObserverEntry],
+            this as unknown as IntersectionObserver,
+        )
+    }
+}
+
+test('deep link to a sharded entity', async () => {
+    codeApi.Dependencies.headingPrefixId = 'mk-head-'
+    globalThis.IntersectionObserver =
+        IntersectionObserverMock as unknown as typeof IntersectionObserver
+    const shards: { [path: string]: Subject<ModuleShard> } = {}
+    const fetchModuleShard = jest
+        .spyOn(codeApi, 'fetchModuleShard')
+        .mockImplementation(({ shard }) => {
+            shards[shard] = new Subject<ModuleShard>()
+            return shards[shard]
+        })
+    const entry = (name: string, shard: string): ShardEntry => ({
+        name,
+        path: `demo.${name}`,
+        kind: 'attribute',
+        filePath: 'demo/shapes.py',
+        shard,
+    })
+    // The URL targets a member of `BigSquare`, included in the second shard.
+    const router = {
+        currentPage$: new BehaviorSubject({
+            html: undefined,
+            sectionId: 'BigSquare.scaled',
+        }),
+        scrollTo: jest.fn(),
+    }
+    const views = [
+        entry('Square', 'demo.shards/0.json'),
+        entry('BigSquare', 'demo.shards/1.json'),
+    ].map(
+        (e) =>
+            new ShardedEntityView<Attribute>({
+                entry: e,
+                module: { path: 'demo' } as Module,
+                router: router as unknown as Router,
+                project: { name: 'demo', docBasePath: '/api' } as Project,
+                select: (shard) => shard.attributes,
+                view: (attribute) => ({
+                    tag: 'h3',
+                    id: `mk-head-${attribute.name}`,
+                    innerText: `${attribute.name} (loaded)`,
+                }),
+            }),
+    )
+    views.forEach((view) => document.body.appendChild(render(view)))
+
+    // The anchors exist at first render, only the shard of the target is fetched.
+    expect(document.getElementById('mk-head-Square')).toBeTruthy()
+    expect(document.getElementById('mk-head-BigSquare')).toBeTruthy()
+    expect(fetchModuleShard).toHaveBeenCalledTimes(1)
+    expect(fetchModuleShard.mock.calls[0][0].shard).toBe('demo.shards/1.json')
+
+    shards['demo.shards/1.json'].next({
+        types: [],
+        callables: [],
+        attributes: [{ name: 'BigSquare' } as Attribute],
+    })
+    expect(document.getElementById('mk-head-BigSquare').innerText).toBe(
+        'BigSquare (loaded)',
+    )
+    // The anchor of the member is available once the shard is loaded.
+    expect(router.scrollTo).toHaveBeenCalledWith('BigSquare.scaled')
+
+    // The other entities are fetched when they stay in the viewport.
+    IntersectionObserverMock.instances[0].intersect()
+    await new Promise((resolve) => setTimeout(resolve, 300))
+    expect(fetchModuleShard).toHaveBeenCalledTimes(2)
+    expect(fetchModuleShard.mock.calls[1][0].shard).toBe('demo.shards/0.json')
+    expect(document.getElementById('mk-head-Square')).toBeTruthy()
+})